@@ -1,5 +1,6 @@
 import argparse
 import json
+from datetime import date
 
 from app.pipeline import bootstrap
 from app.services import AnalyticsService
@@ -17,16 +18,26 @@ def main() -> None:
     parser = argparse.ArgumentParser(description="Run a local DuckDB analytics report")
     parser.add_argument("report", choices=REPORTS, nargs="?", default="revenue")
     parser.add_argument("--limit", type=int, default=20)
+    parser.add_argument("--start", type=date.fromisoformat, help="first order date, YYYY-MM-DD")
+    parser.add_argument("--end", type=date.fromisoformat, help="last order date, YYYY-MM-DD")
+    parser.add_argument("--region", help="only customers in this region")
+    parser.add_argument("--segment", help="only customers in this segment")
     args = parser.parse_args()
     configure_logging()
     bootstrap()
 
     service = AnalyticsService()
     try:
+        filters = {
+            "start": args.start,
+            "end": args.end,
+            "region": args.region,
+            "segment": args.segment,
+        }
         if args.report == "customers":
-            rows = service.top_customers(args.limit)
+            rows = service.top_customers(args.limit, **filters)
         else:
-            rows = getattr(service, REPORTS[args.report])()
+            rows = getattr(service, REPORTS[args.report])(**filters)
         print(json.dumps(rows, default=str, indent=2))
     finally:
         service.close()
@@ -0,0 +1,336 @@
+import argparse
+import asyncio
+import json
+import logging
+import os
+import platform
+import statistics
+import subprocess
+import sys
+from datetime import date
+from pathlib import Path
+from time import perf_counter
+from typing import Any
+
+import duckdb
+import pyarrow.parquet as pq
+
+from app.config import (
+    BENCHMARK_BASELINE,
+    BENCHMARK_CONCURRENCY,
+    BENCHMARK_REPEAT,
+    BENCHMARK_REQUESTS,
+    BENCHMARK_TOLERANCE,
+    BENCHMARKS,
+    BRONZE,
+    BRONZE_CUSTOMERS,
+    PROJECT_ROOT,
+)
+from app.utils import configure_logging, logger
+
+# Scale name -> (orders, customers). Each scale has its own warehouse, reused across runs.
+SCALES = {
+    "25k": (25_000, 500),
+    "1m": (1_000_000, 20_000),
+    "10m": (10_000_000, 200_000),
+    "100m": (100_000_000, 2_000_000),
+}
+WAREHOUSES = BENCHMARKS / "warehouses"
+REPORT_PARAMETERS: dict[str, dict[str, Any]] = {
+    "daily_revenue": {},
+    "top_customers": {"limit": 20},
+    "monthly_growth": {},
+    "retention": {},
+}
+FILTERS = {"start": date(2026, 1, 1), "region": "Europe"}
+API_PATHS = (
+    "/analytics/revenue",
+    "/analytics/top-customers?limit=20",
+    "/analytics/monthly-growth",
+    "/analytics/retention",
+    "/analytics/monthly-growth?start=2026-01-01&region=Europe",
+    "/health",
+)
+MIN_REQUESTS = 2 * len(API_PATHS)
+
+
+def _percentiles(samples: list[float]) -> dict[str, float]:
+    cuts = statistics.quantiles(samples, n=100, method="inclusive")
+    return {
+        "p50_ms": round(cuts[49], 3),
+        "p95_ms": round(cuts[94], 3),
+        "p99_ms": round(cuts[98], 3),
+    }
+
+
+def _ensure_bronze(orders: int, customers: int) -> None:
+    """Generate bronze data unless this scale's warehouse already holds it."""
+    from app.data_generator import generate_data
+
+    generated = sorted((BRONZE / "orders").glob("generated-*.parquet"))
+    if (
+        generated
+        and BRONZE_CUSTOMERS.exists()
+        and sum(pq.read_metadata(path).num_rows for path in generated) == orders
+        and pq.read_metadata(BRONZE_CUSTOMERS).num_rows == customers
+    ):
+        return
+    generate_data(
+        orders, customers, vectorized=orders > SCALES["25k"][0], workers=os.cpu_count() or 1
+    )
+
+
+def _time_reports(repeat: int) -> dict[str, dict[str, dict[str, float]]]:
+    """Time every report uncached when served from gold, from silver, and filtered."""
+    from app.services import AnalyticsService
+
+    modes = {
+        "gold": (AnalyticsService(), {}),
+        "silver": (AnalyticsService(serve_from_gold=False), {}),
+        "filtered": (AnalyticsService(serve_from_gold=False), FILTERS),
+    }
+    timings: dict[str, dict[str, dict[str, float]]] = {}
+    for mode, (service, filters) in modes.items():
+        timings[mode] = {}
+        try:
+            for report, parameters in REPORT_PARAMETERS.items():
+                parameters = {**parameters, **filters}
+                service.report(report, parameters)
+                samples = []
+                for _ in range(repeat):
+                    service.clear_cache()
+                    started = perf_counter()
+                    service.report(report, parameters)
+                    samples.append((perf_counter() - started) * 1000)
+                timings[mode][report] = _percentiles(samples)
+        finally:
+            service.close()
+    return timings
+
+
+async def _load_test(concurrency: int, requests: int) -> dict[str, Any]:
+    """Drive the API in process with ``concurrency`` simulated users.
+
+    Requests go to ``API_PATHS`` in turn, and each path needs two latencies for its
+    percentiles.
+    """
+    if requests < MIN_REQUESTS:
+        raise ValueError(f"requests must be at least {MIN_REQUESTS}, two per API path")
+    import httpx2
+
+    from main import app, lifespan
+
+    logging.getLogger("httpx2").setLevel(logging.WARNING)
+
+    async with lifespan(app):
+        for _ in range(600):
+            if app.state.ready:
+                break
+            await asyncio.sleep(0.1)
+        else:
+            raise RuntimeError("the API did not become ready")
+        transport = httpx2.ASGITransport(app=app)
+        latencies: dict[str, list[float]] = {path: [] for path in API_PATHS}
+        errors = 0
+        sent = 0
+
+        async def user(client: httpx2.AsyncClient) -> None:
+            nonlocal errors, sent
+            while sent < requests:
+                path = API_PATHS[sent % len(API_PATHS)]
+                sent += 1
+                started = perf_counter()
+                response = await client.get(path)
+                latencies[path].append((perf_counter() - started) * 1000)
+                if response.status_code != 200:
+                    errors += 1
+
+        async with httpx2.AsyncClient(transport=transport, base_url="http://benchmark") as client:
+            started = perf_counter()
+            await asyncio.gather(*(user(client) for _ in range(concurrency)))
+            seconds = perf_counter() - started
+
+    samples = [latency for path_latencies in latencies.values() for latency in path_latencies]
+    return {
+        "requests": len(samples),
+        "errors": errors,
+        "concurrency": concurrency,
+        "requests_per_second": round(len(samples) / seconds, 2),
+        **_percentiles(samples),
+        "paths": {path: _percentiles(samples) for path, samples in latencies.items()},
+    }
+
+
+def measure(scale: str, repeat: int, concurrency: int, requests: int) -> dict[str, Any]:
+    """Benchmark the warehouse that ``ANALYTICS_DATA_ROOT`` points at."""
+    from app.pipeline import run_pipeline
+
+    orders, customers = SCALES[scale]
+    _ensure_bronze(orders, customers)
+    started = perf_counter()
+    # Forced, since the reused warehouse would otherwise skip every unchanged stage.
+    run_pipeline(force=True)
+    pipeline_seconds = perf_counter() - started
+    logger.info("benchmark_pipeline_complete scale=%s seconds=%.3f", scale, pipeline_seconds)
+    reports = _time_reports(repeat)
+    api = asyncio.run(_load_test(concurrency, requests))
+    logger.info(
+        "benchmark_load_complete scale=%s rps=%s p95_ms=%s",
+        scale,
+        api["requests_per_second"],
+        api["p95_ms"],
+    )
+    return {
+        "orders": orders,
+        "customers": customers,
+        "pipeline_seconds": round(pipeline_seconds, 3),
+        "reports": reports,
+        "api": api,
+    }
+
+
+def _run_scale(scale: str, repeat: int, concurrency: int, requests: int) -> dict[str, Any]:
+    """Measure one scale in a fresh interpreter whose data root is that scale's warehouse."""
+    data_root = WAREHOUSES / scale
+    data_root.mkdir(parents=True, exist_ok=True)
+    completed = subprocess.run(
+        [
+            sys.executable,
+            "-m",
+            "app.benchmark",
+            "--measure",
+            scale,
+            "--repeat",
+            str(repeat),
+            "--concurrency",
+            str(concurrency),
+            "--requests",
+            str(requests),
+        ],
+        cwd=PROJECT_ROOT,
+        env={**os.environ, "ANALYTICS_DATA_ROOT": str(data_root)},
+        stdout=subprocess.PIPE,
+        text=True,
+        check=True,
+    )
+    return json.loads(completed.stdout)
+
+
+def _gated_metrics(result: dict[str, Any]) -> dict[str, float]:
+    """Flatten the metrics that are compared with the baseline; all are lower-is-better."""
+    metrics = {"pipeline_seconds": result["pipeline_seconds"]}
+    for mode, reports in result["reports"].items():
+        for report, timing in reports.items():
+            metrics[f"reports.{mode}.{report}.p95_ms"] = timing["p95_ms"]
+    metrics["api.p95_ms"] = result["api"]["p95_ms"]
+    for path, timing in result["api"]["paths"].items():
+        metrics[f"api.{path}.p95_ms"] = timing["p95_ms"]
+    metrics["api.ms_per_request"] = round(1000 / result["api"]["requests_per_second"], 3)
+    return metrics
+
+
+def compare(
+    results: dict[str, Any], baseline: dict[str, Any], tolerance: float
+) -> list[str]:
+    """Return the metrics that are more than ``tolerance`` slower than the baseline."""
+    regressions = []
+    for scale, result in results["scales"].items():
+        previous = baseline.get("scales", {}).get(scale)
+        if previous is None:
+            continue
+        reference = _gated_metrics(previous)
+        for metric, value in _gated_metrics(result).items():
+            limit = reference.get(metric)
+            if limit and value > limit * (1 + tolerance):
+                regressions.append(f"{scale} {metric}: {value} > {limit} (+{tolerance:.0%})")
+    return regressions
+
+
+def run_benchmark(
+    scales: list[str],
+    repeat: int = BENCHMARK_REPEAT,
+    concurrency: int = BENCHMARK_CONCURRENCY,
+    requests: int = BENCHMARK_REQUESTS,
+) -> dict[str, Any]:
+    """Benchmark the pipeline, reports, and API at each scale."""
+    return {
+        "environment": {
+            "python": platform.python_version(),
+            "duckdb": duckdb.__version__,
+            "platform": platform.platform(),
+            "cpus": os.cpu_count(),
+        },
+        "scales": {
+            scale: _run_scale(scale, repeat, concurrency, requests) for scale in scales
+        },
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Benchmark the pipeline, reports, and API at several data scales"
+    )
+    parser.add_argument("--scales", nargs="+", choices=SCALES, default=["25k", "1m"])
+    parser.add_argument("--repeat", type=int, default=BENCHMARK_REPEAT, help="runs per report")
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=BENCHMARK_CONCURRENCY,
+        help="simulated API users sending requests at the same time",
+    )
+    parser.add_argument(
+        "--requests", type=int, default=BENCHMARK_REQUESTS, help="API requests per scale"
+    )
+    parser.add_argument("--baseline", type=Path, default=BENCHMARK_BASELINE)
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        help="allowed slowdown as a fraction; defaults to the baseline's own tolerance",
+    )
+    parser.add_argument(
+        "--update-baseline",
+        action="store_true",
+        help="store these results as the new baseline instead of comparing against it",
+    )
+    parser.add_argument("--measure", choices=SCALES, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    configure_logging()
+    if args.repeat < 2 or args.concurrency < 1 or args.requests < MIN_REQUESTS:
+        parser.error(
+            f"--repeat must be at least 2, --requests at least {MIN_REQUESTS} "
+            "(two per API path), and --concurrency positive"
+        )
+    if args.measure:
+        result = measure(args.measure, args.repeat, args.concurrency, args.requests)
+        print(json.dumps(result))
+        return
+
+    results = run_benchmark(args.scales, args.repeat, args.concurrency, args.requests)
+    print(json.dumps(results, indent=2))
+    baseline = {}
+    if args.baseline.exists():
+        baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+    tolerance = args.tolerance
+    if tolerance is None:
+        tolerance = baseline.get("tolerance", BENCHMARK_TOLERANCE)
+    if args.update_baseline:
+        scales = {**baseline.get("scales", {}), **results["scales"]}
+        args.baseline.parent.mkdir(parents=True, exist_ok=True)
+        args.baseline.write_text(
+            json.dumps({**results, "tolerance": tolerance, "scales": scales}, indent=2) + "\n",
+            encoding="utf-8",
+        )
+        logger.info("benchmark_baseline_updated path=%s", args.baseline)
+        return
+    if not baseline:
+        logger.info("benchmark_baseline_missing path=%s", args.baseline)
+        return
+    regressions = compare(results, baseline, tolerance)
+    for regression in regressions:
+        logger.error("benchmark_regression %s", regression)
+    if regressions:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
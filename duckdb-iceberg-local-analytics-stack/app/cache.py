@@ -0,0 +1,156 @@
+import sys
+from collections import OrderedDict
+from collections.abc import Callable, Hashable, Iterable
+from pathlib import Path
+from threading import Lock
+from time import monotonic
+from typing import Any
+
+from app.config import CACHE_MAX_BYTES, CACHE_MAX_ENTRIES, CACHE_TTL_SECONDS, PIPELINE_MANIFEST
+
+_generation = 0
+
+
+def notify_warehouse_changed() -> None:
+    """Invalidate every result cache in this process after the warehouse is rebuilt."""
+    global _generation
+    _generation += 1
+
+
+def warehouse_version() -> tuple[int, int, int]:
+    """Identify the last warehouse change with a single stat of the pipeline manifest.
+
+    Every pipeline run that changes silver or gold rewrites the manifest when it finishes,
+    and the atomic replace gives it a new inode, so this also notices runs in other
+    processes. ``notify_warehouse_changed`` covers changes made in this process.
+    """
+    try:
+        stat = PIPELINE_MANIFEST.stat()
+    except FileNotFoundError:
+        return _generation, 0, 0
+    return _generation, stat.st_ino, stat.st_mtime_ns
+
+
+def fingerprint(paths: Iterable[Path]) -> tuple[tuple[str, int, int], ...]:
+    """Identify the current version of Parquet datasets by file path, size, and mtime."""
+    files: list[Path] = []
+    for path in paths:
+        if path.is_dir():
+            files.extend(sorted(path.rglob("*.parquet")))
+        elif path.exists():
+            files.append(path)
+    entries = []
+    for file in files:
+        try:
+            stat = file.stat()
+        except FileNotFoundError:
+            continue
+        entries.append((file.as_posix(), stat.st_size, stat.st_mtime_ns))
+    return tuple(entries)
+
+
+class ParquetRowCounts:
+    """Count rows from Parquet footers, re-reading only files whose size or mtime changed."""
+
+    def __init__(self) -> None:
+        self._files: dict[str, tuple[int, int, int]] = {}
+        self._lock = Lock()
+
+    def count(self, paths: Iterable[Path]) -> tuple[int, int]:
+        """Return the number of Parquet files under ``paths`` and their total row count."""
+        # Deferred so that importing the cache does not load pyarrow.
+        import pyarrow.parquet as pq
+
+        entries = fingerprint(paths)
+        rows = 0
+        for path, size, mtime_ns in entries:
+            with self._lock:
+                cached = self._files.get(path)
+            if cached is None or cached[:2] != (size, mtime_ns):
+                try:
+                    cached = (size, mtime_ns, pq.read_metadata(path).num_rows)
+                except FileNotFoundError:
+                    continue
+                with self._lock:
+                    self._files[path] = cached
+            rows += cached[2]
+        return len(entries), rows
+
+
+def _sizeof(value: Any) -> int:
+    size = sys.getsizeof(value)
+    if isinstance(value, dict):
+        return size + sum(_sizeof(key) + _sizeof(item) for key, item in value.items())
+    if isinstance(value, (list, tuple)):
+        return size + sum(_sizeof(item) for item in value)
+    return size
+
+
+class ResultCache:
+    """LRU cache with TTL expiry and byte-size accounting for report results."""
+
+    def __init__(
+        self,
+        ttl_seconds: float = CACHE_TTL_SECONDS,
+        max_entries: int = CACHE_MAX_ENTRIES,
+        max_bytes: int = CACHE_MAX_BYTES,
+    ) -> None:
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[Hashable, tuple[float, int, Any]] = OrderedDict()
+        self._lock = Lock()
+        self._bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def get_or_compute(
+        self, report: str, parameters: dict[str, Any] | None, compute: Callable[[], Any]
+    ) -> Any:
+        """Return a cached result for the current warehouse version or compute it."""
+        key = (report, tuple(sorted((parameters or {}).items())), warehouse_version())
+        now = monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > now:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return entry[2]
+            if entry is not None:
+                self._remove(key)
+            self._misses += 1
+
+        value = compute()
+        size = _sizeof(value)
+        if size > self.max_bytes:
+            return value
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (monotonic() + self.ttl_seconds, size, value)
+            self._bytes += size
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+                self._evictions += 1
+        return value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+            }
+
+    def _remove(self, key: Hashable) -> None:
+        _, size, _ = self._entries.pop(key)
+        self._bytes -= size
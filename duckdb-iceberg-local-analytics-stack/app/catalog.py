@@ -1,24 +1,200 @@
+import json
+import re
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Any
+
 import duckdb
 
+from app.cache import fingerprint
 from app.config import (
     BRONZE_CUSTOMERS,
     BRONZE_ORDERS_GLOB,
     DATABASE,
+    GOLD_COHORT_ACTIVITY,
+    GOLD_CUSTOMER_COHORTS,
+    GOLD_CUSTOMER_SUMMARY,
+    GOLD_DAILY_REVENUE,
+    GOLD_MONTHLY_GROWTH,
+    LEGACY_SILVER_ORDERS,
+    LEGACY_SILVER_ORDERS_INCREMENTS_GLOB,
+    SILVER_CUSTOMER_INDEX,
     SILVER_CUSTOMERS,
     SILVER_ORDERS,
-    THREADS,
+    SILVER_ORDERS_GLOB,
+    SILVER_ORDERS_PATHS,
 )
+from app.resources import apply_limits
+
+SILVER_STORE = "silver_store"
+# Native silver tables: view name -> (stored table, sort key, Parquet files it mirrors).
+SILVER_TABLES: dict[str, tuple[str, str, tuple[Path, ...]]] = {
+    "silver_orders": ("orders", "order_date, customer_id", SILVER_ORDERS_PATHS),
+    "silver_customers": ("customers", "customer_id", (SILVER_CUSTOMERS,)),
+}
 
 
 def _parquet_path(path) -> str:
     return path.resolve().as_posix().replace("'", "''")
 
 
-def connection() -> duckdb.DuckDBPyConnection:
-    """Create a configured DuckDB connection and register available datasets."""
-    conn = duckdb.connect(str(DATABASE))
-    conn.execute(f"SET threads = {THREADS}")
+def bind(query: str, parameters: dict[str, Any] | None) -> dict[str, Any]:
+    """Keep the parameters a query references; DuckDB rejects unused named parameters."""
+    names = set(re.findall(r"\$(\w+)", query))
+    return {name: value for name, value in (parameters or {}).items() if name in names}
+
+
+def connection(role: str = "pipeline") -> duckdb.DuckDBPyConnection:
+    """Create a DuckDB connection with a role's resource limits and register datasets.
+
+    Serving connections open the database file. Pipelines get their own in-memory
+    instance, so their limits apply even inside the API process, and they never wait for
+    the database file that a serving process keeps locked.
+    """
+    conn = duckdb.connect(str(DATABASE) if role == "serving" else ":memory:")
+    apply_limits(conn, role)
+    register_datasets(conn)
+    return conn
+
+
+def _silver_source(view: str) -> str | None:
+    """Return the ``read_parquet`` expression over a silver dataset's files, if any exist."""
+    if view == "silver_customers":
+        if SILVER_CUSTOMERS.exists():
+            return f"read_parquet('{_parquet_path(SILVER_CUSTOMERS)}')"
+        return None
+    if list(SILVER_ORDERS.glob("*/*.parquet")):
+        return f"read_parquet('{_parquet_path(SILVER_ORDERS_GLOB)}', hive_partitioning = true)"
+    if LEGACY_SILVER_ORDERS.exists():
+        # Single-file layout from before month partitioning; migrated by the pipeline.
+        legacy = [LEGACY_SILVER_ORDERS]
+        increments = LEGACY_SILVER_ORDERS_INCREMENTS_GLOB
+        if list(increments.parent.glob(increments.name)):
+            legacy.append(increments)
+        sources = ", ".join(f"'{_parquet_path(path)}'" for path in legacy)
+        return (
+            "(SELECT *, CAST(DATE_TRUNC('month', order_date) AS DATE) AS order_month "
+            f"FROM read_parquet([{sources}]))"
+        )
+    return None
+
+
+def _files(paths: Iterable[Path]) -> list[list]:
+    return [list(entry) for entry in fingerprint(paths)]
+
+
+def _stored_files(conn: duckdb.DuckDBPyConnection, view: str) -> list[list] | None:
+    """Return the Parquet files a native silver table was loaded from, if it exists."""
+    exists = conn.execute(
+        "SELECT COUNT(*) FROM duckdb_tables() WHERE schema_name = ? AND table_name = 'loads'",
+        [SILVER_STORE],
+    ).fetchone()
+    if exists is None or not exists[0]:
+        return None
+    row = conn.execute(f"SELECT files FROM {SILVER_STORE}.loads WHERE view = ?", [view]).fetchone()
+    return None if row is None else json.loads(row[0])
+
+
+def _record_load(conn: duckdb.DuckDBPyConnection, view: str) -> None:
+    files = json.dumps(_files(SILVER_TABLES[view][2]))
+    conn.execute(f"DELETE FROM {SILVER_STORE}.loads WHERE view = ?", [view])
+    conn.execute(f"INSERT INTO {SILVER_STORE}.loads VALUES (?, ?)", [view, files])
+
+
+def load_silver_tables(
+    conn: duckdb.DuckDBPyConnection, customer_index: bool = SILVER_CUSTOMER_INDEX
+) -> None:
+    """Copy silver Parquet into sorted native tables in the database file."""
+    conn.execute(f"CREATE SCHEMA IF NOT EXISTS {SILVER_STORE}")
+    conn.execute(
+        f"CREATE TABLE IF NOT EXISTS {SILVER_STORE}.loads "
+        "(view VARCHAR PRIMARY KEY, files VARCHAR)"
+    )
+    for view, (table, sort_key, _) in SILVER_TABLES.items():
+        source = _silver_source(view)
+        if source is None:
+            continue
+        conn.execute(
+            f"CREATE OR REPLACE TABLE {SILVER_STORE}.{table} AS "
+            f"SELECT * FROM {source} ORDER BY {sort_key}"
+        )
+        _record_load(conn, view)
+    if customer_index:
+        conn.execute(
+            f"CREATE INDEX IF NOT EXISTS orders_customer_id ON {SILVER_STORE}.orders (customer_id)"
+        )
+    register_datasets(conn)
+
+
+def append_silver_orders(
+    conn: duckdb.DuckDBPyConnection, delta: str, delta_files: Iterable[Path]
+) -> bool:
+    """Insert a silver increment into the native orders table.
+
+    Returns ``False`` without changing anything when the table does not hold exactly the
+    silver files that existed before the increment, in which case it must be reloaded.
+    """
+    stored = _stored_files(conn, "silver_orders")
+    appended = {tuple(entry) for entry in fingerprint(delta_files)}
+    current = [entry for entry in _files(SILVER_ORDERS_PATHS) if tuple(entry) not in appended]
+    if stored is None or stored != current:
+        return False
+    conn.execute(
+        f"INSERT INTO {SILVER_STORE}.orders BY NAME "
+        f"SELECT * FROM {delta} ORDER BY order_date, customer_id"
+    )
+    _record_load(conn, "silver_orders")
+    register_datasets(conn)
+    return True
+
+
+def drop_silver_tables(conn: duckdb.DuckDBPyConnection) -> None:
+    """Remove native silver tables so silver is served from Parquet only."""
+    conn.execute(f"DROP SCHEMA IF EXISTS {SILVER_STORE} CASCADE")
+    register_datasets(conn)
+
 
+def silver_tables_stale(conn: duckdb.DuckDBPyConnection, storage: str) -> bool:
+    """Return whether the native silver tables do not match a storage mode."""
+    if storage == "table":
+        return any(
+            _silver_source(view) is not None and _stored_files(conn, view) != _files(paths)
+            for view, (_, _, paths) in SILVER_TABLES.items()
+        )
+    row = conn.execute(
+        "SELECT COUNT(*) FROM duckdb_schemas() WHERE schema_name = ?", [SILVER_STORE]
+    ).fetchone()
+    return row is not None and bool(row[0])
+
+
+def sync_silver_tables(
+    conn: duckdb.DuckDBPyConnection, storage: str, appended: list[Path] | None = None
+) -> None:
+    """Load silver into native tables or drop them, per storage mode.
+
+    With ``appended`` silver increment files, table mode inserts just those rows when the
+    tables still hold every earlier file.
+    """
+    if storage == "table" and appended:
+        files = ", ".join(f"'{_parquet_path(path)}'" for path in appended)
+        conn.execute(
+            "CREATE OR REPLACE TEMP VIEW silver_orders_delta AS "
+            f"SELECT * FROM read_parquet([{files}], hive_partitioning = true)"
+        )
+        if append_silver_orders(conn, "silver_orders_delta", appended):
+            return
+    if storage == "table":
+        load_silver_tables(conn)
+    else:
+        drop_silver_tables(conn)
+
+
+def register_datasets(conn: duckdb.DuckDBPyConnection) -> None:
+    """Create or refresh the views over warehouse datasets that currently exist.
+
+    A silver view reads its native table when one was loaded from the current Parquet
+    files, and the Parquet files otherwise.
+    """
     if list(BRONZE_ORDERS_GLOB.parent.glob(BRONZE_ORDERS_GLOB.name)):
         conn.execute(
             "CREATE OR REPLACE VIEW bronze_orders AS "
@@ -30,15 +206,22 @@ def connection() -> duckdb.DuckDBPyConnection:
             "CREATE OR REPLACE VIEW bronze_customers AS "
             f"SELECT * FROM read_parquet('{_parquet_path(BRONZE_CUSTOMERS)}')"
         )
-    if SILVER_ORDERS.exists():
-        conn.execute(
-            "CREATE OR REPLACE VIEW silver_orders AS "
-            f"SELECT * FROM read_parquet('{_parquet_path(SILVER_ORDERS)}')"
-        )
-    if SILVER_CUSTOMERS.exists():
-        conn.execute(
-            "CREATE OR REPLACE VIEW silver_customers AS "
-            f"SELECT * FROM read_parquet('{_parquet_path(SILVER_CUSTOMERS)}')"
-        )
-
-    return conn
+    for view, (table, _, paths) in SILVER_TABLES.items():
+        source = _silver_source(view)
+        if source is None:
+            continue
+        if _stored_files(conn, view) == _files(paths):
+            source = f"{SILVER_STORE}.{table}"
+        conn.execute(f"CREATE OR REPLACE VIEW {view} AS SELECT * FROM {source}")
+    for view, path in (
+        ("gold_daily_revenue", GOLD_DAILY_REVENUE),
+        ("gold_monthly_growth", GOLD_MONTHLY_GROWTH),
+        ("gold_customer_summary", GOLD_CUSTOMER_SUMMARY),
+        ("gold_customer_cohorts", GOLD_CUSTOMER_COHORTS),
+        ("gold_cohort_activity", GOLD_COHORT_ACTIVITY),
+    ):
+        if path.exists():
+            conn.execute(
+                f"CREATE OR REPLACE VIEW {view} AS "
+                f"SELECT * FROM read_parquet('{_parquet_path(path)}')"
+            )
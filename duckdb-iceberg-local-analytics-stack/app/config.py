@@ -1,19 +1,91 @@
+import os
 from pathlib import Path
 
 PROJECT_ROOT = Path(__file__).resolve().parents[1]
-DATABASE = PROJECT_ROOT / "analytics.duckdb"
+# The database, warehouse, incoming files, and logs can live outside the checkout.
+DATA_ROOT = Path(os.environ.get("ANALYTICS_DATA_ROOT", PROJECT_ROOT)).resolve()
+DATABASE = DATA_ROOT / "analytics.duckdb"
 SQL_DIR = PROJECT_ROOT / "sql"
-WAREHOUSE = PROJECT_ROOT / "warehouse"
+WAREHOUSE = DATA_ROOT / "warehouse"
 BRONZE = WAREHOUSE / "bronze"
 SILVER = WAREHOUSE / "silver"
 GOLD = WAREHOUSE / "gold"
-INCOMING = PROJECT_ROOT / "incoming"
-THREADS = 8
+INCOMING = DATA_ROOT / "incoming"
+# DuckDB CPU and memory budget for this machine, shared by the API and pipeline processes.
+CPU_BUDGET = os.cpu_count() or 1
+MEMORY_BUDGET_MB = 4096
+# Share reserved for serving while a pipeline runs; pipelines get the rest. With no
+# pipeline running, serving uses every thread in the budget.
+SERVING_SHARE = 0.5
+RESOURCE_POLL_SECONDS = 1.0
+# Accept requests before bootstrap finishes, serving whatever warehouse data exists.
+FAST_START = True
+POOL_SIZE = 4
+# Report queries use at most QUERY_WORKERS cursors. The rest stay free for re-registering
+# the views, which the startup bootstrap does from its own thread, so it never queues
+# behind slow reports.
+QUERY_WORKERS = 3
+OPERATIONS_WORKERS = 1
+QUERY_TIMEOUT_SECONDS = 30.0
+HEALTH_TIMEOUT_SECONDS = 2.0
+PIPELINE_PARALLELISM = 3
+CACHE_TTL_SECONDS = 300
+CACHE_MAX_ENTRIES = 128
+CACHE_MAX_BYTES = 64 * 1024 * 1024
+SERVE_FROM_GOLD = True
+PIN_GOLD_IN_MEMORY = False
+STREAM_BATCH_SIZE = 100_000
+# Optional filters every report SQL file accepts as bound parameters; NULL disables one.
+REPORT_FILTERS = ("start", "end", "region", "segment")
+# "parquet" serves silver from views over the Parquet files; "table" also loads it into
+# native tables in the DuckDB database file.
+SILVER_STORAGE = "parquet"
+SILVER_CUSTOMER_INDEX = False
+# Collect DuckDB's query profile for every report query. When off, a report is profiled
+# only on the run after a slow one; slow profiled runs are logged in full either way.
+QUERY_PROFILING = False
+SLOW_QUERY_SECONDS = 1.0
+SLOW_QUERY_LOG_MAX_BYTES = 10 * 1024 * 1024
+SLOW_QUERY_LOG_BACKUPS = 5
+INGEST_WORKERS = 4
+INGEST_BATCH_FILES = 32
+BENCHMARK_REPEAT = 20
+BENCHMARK_CONCURRENCY = 8
+BENCHMARK_REQUESTS = 400
+# Bronze order files smaller than the target are merged once this many have accumulated.
+BRONZE_COMPACTION_TARGET_BYTES = 128 * 1024 * 1024
+BRONZE_COMPACTION_MIN_FILES = 16
 
 BRONZE_ORDERS_GLOB = BRONZE / "orders" / "*.parquet"
 BRONZE_CUSTOMERS = BRONZE / "customers" / "customers.parquet"
-SILVER_ORDERS = SILVER / "orders.parquet"
+SILVER_ORDERS = SILVER / "orders"
+SILVER_ORDERS_GLOB = SILVER_ORDERS / "*" / "*.parquet"
 SILVER_CUSTOMERS = SILVER / "customers.parquet"
+SILVER_ROW_GROUP_SIZE = 122_880
+LEGACY_SILVER_ORDERS = SILVER / "orders.parquet"
+LEGACY_SILVER_ORDERS_INCREMENTS_GLOB = SILVER / "orders_increments" / "part-*[0-9].parquet"
+SILVER_ORDERS_PATHS = (
+    SILVER_ORDERS,
+    LEGACY_SILVER_ORDERS,
+    LEGACY_SILVER_ORDERS_INCREMENTS_GLOB.parent,
+)
+GOLD_DAILY_REVENUE = GOLD / "daily_revenue.parquet"
+GOLD_MONTHLY_GROWTH = GOLD / "monthly_growth.parquet"
+GOLD_CUSTOMER_SUMMARY = GOLD / "customer_summary.parquet"
+GOLD_CUSTOMER_COHORTS = GOLD / "customer_cohorts.parquet"
+GOLD_COHORT_ACTIVITY = GOLD / "cohort_activity.parquet"
+PIPELINE_MANIFEST = WAREHOUSE / "pipeline_manifest.json"
+PIPELINE_STAGES = WAREHOUSE / "pipeline_stages.json"
+INGEST_LEDGER = WAREHOUSE / "ingest_ledger.json"
+SLOW_QUERY_LOG = DATA_ROOT / "logs" / "slow_queries.jsonl"
+# DuckDB spills to a subdirectory per role when a query exceeds its memory limit.
+TEMP_DIRECTORY = DATA_ROOT / "tmp"
+# One file per running pipeline process, named after its process id.
+PIPELINE_RUNS = WAREHOUSE / "pipeline_runs"
+BENCHMARKS = PROJECT_ROOT / "benchmarks"
+BENCHMARK_BASELINE = BENCHMARKS / "baseline.json"
+# A p95 latency or pipeline time more than this fraction above the baseline is a regression.
+BENCHMARK_TOLERANCE = 0.2
 
 
 def ensure_directories() -> None:
@@ -24,5 +96,6 @@ def ensure_directories() -> None:
         GOLD,
         INCOMING,
         INCOMING / "processed",
+        INCOMING / "rejected",
     ):
         path.mkdir(parents=True, exist_ok=True)
@@ -1,8 +1,12 @@
 import argparse
 import random
+from concurrent.futures import ProcessPoolExecutor
 from datetime import date, datetime, timedelta
+from pathlib import Path
 
+import numpy as np
 import pyarrow as pa
+import pyarrow.compute as pc
 import pyarrow.parquet as pq
 
 from app.config import BRONZE, ensure_directories
@@ -12,38 +16,52 @@ REGIONS = ("North America", "Europe", "Asia Pacific", "Latin America")
 SEGMENTS = ("Consumer", "Small Business", "Enterprise")
 CATEGORIES = ("Software", "Hardware", "Services", "Training")
 STATUSES = ("completed", "completed", "completed", "completed", "cancelled", "refunded")
+SEGMENT_WEIGHTS = (65, 25, 10)
+SIGNUP_START = date(2024, 1, 1)
+ORDER_START = datetime(2025, 1, 1)
+ORDER_END = datetime(2026, 6, 30)
+VECTORIZED_BATCH_SIZE = 1_000_000
 
 
-def generate_data(order_count: int = 25_000, customer_count: int = 500, seed: int = 42) -> dict[str, int]:
-    """Generate deterministic e-commerce data as reasonably sized Parquet batches."""
+def generate_data(
+    order_count: int = 25_000,
+    customer_count: int = 500,
+    seed: int = 42,
+    vectorized: bool = False,
+    workers: int = 1,
+) -> dict[str, int]:
+    """Generate deterministic e-commerce data as reasonably sized Parquet batches.
+
+    ``vectorized=True`` builds whole Arrow columns with NumPy and can spread the order
+    batches over ``workers`` processes. It draws from the same distributions but uses a
+    different random stream, so its output differs from the default generator.
+    """
     if order_count < 1 or customer_count < 1:
         raise ValueError("order_count and customer_count must be positive")
+    if workers < 1:
+        raise ValueError("workers must be positive")
+    if vectorized:
+        return _generate_vectorized(order_count, customer_count, seed, workers)
 
-    ensure_directories()
+    customers_dir, orders_dir = _prepare_directories()
     rng = random.Random(seed)
-    customers_dir = BRONZE / "customers"
-    orders_dir = BRONZE / "orders"
-    for old_file in orders_dir.glob("generated-*.parquet"):
-        old_file.unlink()
 
     customer_ids = list(range(1, customer_count + 1))
-    signup_start = date(2024, 1, 1)
     customers = pa.table(
         {
             "customer_id": pa.array(customer_ids, type=pa.int64()),
             "customer_name": [f"Customer {customer_id:04d}" for customer_id in customer_ids],
             "region": [rng.choice(REGIONS) for _ in customer_ids],
-            "segment": [rng.choices(SEGMENTS, weights=(65, 25, 10), k=1)[0] for _ in customer_ids],
+            "segment": [rng.choices(SEGMENTS, weights=SEGMENT_WEIGHTS, k=1)[0] for _ in customer_ids],
             "signup_date": pa.array(
-                [signup_start + timedelta(days=rng.randrange(730)) for _ in customer_ids],
+                [SIGNUP_START + timedelta(days=rng.randrange(730)) for _ in customer_ids],
                 type=pa.date32(),
             ),
         }
     )
     pq.write_table(customers, customers_dir / "customers.parquet", compression="zstd")
 
-    order_start = datetime(2025, 1, 1)
-    day_range = (datetime(2026, 6, 30) - order_start).days
+    day_range = (ORDER_END - ORDER_START).days
     batch_size = 5_000
     for offset in range(0, order_count, batch_size):
         size = min(batch_size, order_count - offset)
@@ -57,7 +75,7 @@ def generate_data(order_count: int = 25_000, customer_count: int = 500, seed: in
                 ),
                 "order_time": pa.array(
                     [
-                        order_start
+                        ORDER_START
                         + timedelta(
                             days=rng.randrange(day_range + 1),
                             seconds=rng.randrange(86_400),
@@ -82,14 +100,120 @@ def generate_data(order_count: int = 25_000, customer_count: int = 500, seed: in
     return result
 
 
+def _prepare_directories() -> tuple[Path, Path]:
+    ensure_directories()
+    orders_dir = BRONZE / "orders"
+    for old_file in orders_dir.glob("generated-*.parquet"):
+        old_file.unlink()
+    return BRONZE / "customers", orders_dir
+
+
+def _order_batch(
+    seed: int, batch_number: int, first_order_id: int, size: int, customer_count: int
+) -> pa.Table:
+    """Build one batch of orders; each batch has its own seed so workers stay deterministic."""
+    rng = np.random.default_rng([seed, batch_number])
+    day_range = (ORDER_END - ORDER_START).days
+    start = np.datetime64(ORDER_START, "us")
+    offsets = rng.integers(0, day_range + 1, size) * 86_400 + rng.integers(0, 86_400, size)
+    return pa.table(
+        {
+            "order_id": pa.array(
+                np.arange(first_order_id, first_order_id + size, dtype=np.int64)
+            ),
+            "customer_id": pa.array(rng.integers(1, customer_count + 1, size, dtype=np.int64)),
+            "order_time": pa.array(start + offsets.astype("timedelta64[s]")),
+            "status": pc.take(pa.array(STATUSES), rng.integers(0, len(STATUSES), size)),
+            "product_category": pc.take(
+                pa.array(CATEGORIES), rng.integers(0, len(CATEGORIES), size)
+            ),
+            "total_amount": pa.array(np.round(rng.lognormal(4.5, 0.75, size), 2)),
+        }
+    )
+
+
+def _write_order_batch(
+    seed: int, batch_number: int, first_order_id: int, size: int, customer_count: int
+) -> int:
+    table = _order_batch(seed, batch_number, first_order_id, size, customer_count)
+    pq.write_table(
+        table,
+        BRONZE / "orders" / f"generated-{batch_number:03d}.parquet",
+        compression="zstd",
+    )
+    return size
+
+
+def _generate_vectorized(
+    order_count: int, customer_count: int, seed: int, workers: int
+) -> dict[str, int]:
+    customers_dir, _ = _prepare_directories()
+    rng = np.random.default_rng(seed)
+    weights = np.array(SEGMENT_WEIGHTS) / sum(SEGMENT_WEIGHTS)
+    customers = pa.table(
+        {
+            "customer_id": pa.array(np.arange(1, customer_count + 1, dtype=np.int64)),
+            "customer_name": [
+                f"Customer {customer_id:04d}" for customer_id in range(1, customer_count + 1)
+            ],
+            "region": pc.take(pa.array(REGIONS), rng.integers(0, len(REGIONS), customer_count)),
+            "segment": pc.take(
+                pa.array(SEGMENTS), rng.choice(len(SEGMENTS), customer_count, p=weights)
+            ),
+            "signup_date": pa.array(
+                np.datetime64(SIGNUP_START, "D")
+                + rng.integers(0, 730, customer_count).astype("timedelta64[D]")
+            ),
+        }
+    )
+    pq.write_table(customers, customers_dir / "customers.parquet", compression="zstd")
+
+    batches = [
+        (
+            seed,
+            offset // VECTORIZED_BATCH_SIZE + 1,
+            offset + 1,
+            min(VECTORIZED_BATCH_SIZE, order_count - offset),
+            customer_count,
+        )
+        for offset in range(0, order_count, VECTORIZED_BATCH_SIZE)
+    ]
+    if workers == 1:
+        for batch in batches:
+            _write_order_batch(*batch)
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            list(executor.map(_write_order_batch, *zip(*batches)))
+
+    logger.info(
+        "generated_bronze_data customers=%s orders=%s mode=vectorized files=%s workers=%s",
+        customer_count,
+        order_count,
+        len(batches),
+        workers,
+    )
+    return {"customers": customer_count, "orders": order_count}
+
+
 def main() -> None:
     parser = argparse.ArgumentParser(description="Generate sample analytics data in Parquet")
     parser.add_argument("--orders", type=int, default=25_000)
     parser.add_argument("--customers", type=int, default=500)
     parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument(
+        "--vectorized",
+        action="store_true",
+        help="build columns with NumPy; much faster for large warehouses",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="processes writing order files in vectorized mode",
+    )
     args = parser.parse_args()
     configure_logging()
-    generate_data(args.orders, args.customers, args.seed)
+    generate_data(args.orders, args.customers, args.seed, args.vectorized, args.workers)
 
 
 if __name__ == "__main__":
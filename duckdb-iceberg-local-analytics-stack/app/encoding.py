@@ -0,0 +1,56 @@
+import io
+from collections.abc import Iterator
+
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+
+from app.media import ARROW_STREAM, NDJSON, PARQUET
+
+
+def _drain(sink: io.BytesIO) -> bytes:
+    data = sink.getvalue()
+    sink.seek(0)
+    sink.truncate()
+    return data
+
+
+def _arrow_stream(reader: pa.RecordBatchReader) -> Iterator[bytes]:
+    sink = io.BytesIO()
+    with pa.ipc.new_stream(sink, reader.schema) as writer:
+        yield _drain(sink)
+        for batch in reader:
+            writer.write_batch(batch)
+            yield _drain(sink)
+    yield _drain(sink)
+
+
+def _parquet(reader: pa.RecordBatchReader) -> Iterator[bytes]:
+    sink = io.BytesIO()
+    with pq.ParquetWriter(sink, reader.schema, compression="zstd") as writer:
+        for batch in reader:
+            writer.write_batch(batch)
+            yield _drain(sink)
+    yield _drain(sink)
+
+
+def _ndjson(reader: pa.RecordBatchReader) -> Iterator[bytes]:
+    for batch in reader:
+        if batch.num_rows == 0:
+            continue
+        # Append a newline to every JSON document and emit the string data buffer as-is.
+        lines = pc.binary_join_element_wise(batch.column(0), "", "\n")
+        _, offsets_buffer, data = lines.buffers()
+        offsets = pa.Array.from_buffers(
+            pa.int32(), len(lines) + 1, [None, offsets_buffer], offset=lines.offset
+        )
+        start, end = offsets[0].as_py(), offsets[-1].as_py()
+        yield data.slice(start, end - start).to_pybytes()
+
+
+ENCODERS = {ARROW_STREAM: _arrow_stream, PARQUET: _parquet, NDJSON: _ndjson}
+
+
+def encode(reader: pa.RecordBatchReader, media_type: str) -> Iterator[bytes]:
+    """Encode record batches as a byte stream in the given media type."""
+    return ENCODERS[media_type](reader)
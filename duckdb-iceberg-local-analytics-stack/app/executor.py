@@ -0,0 +1,106 @@
+import asyncio
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
+from typing import Any, TypeVar
+
+from app.config import QUERY_TIMEOUT_SECONDS, QUERY_WORKERS
+from app.pool import Interruptible, active_request
+
+T = TypeVar("T")
+DISCONNECT_POLL_SECONDS = 0.25
+
+
+class QueryExecutor:
+    """Run blocking DuckDB work on a bounded thread pool from async code.
+
+    Each call gets a deadline. When it expires, or the awaiting task is cancelled, the
+    DuckDB queries started for the call are interrupted instead of running to completion.
+    """
+
+    def __init__(
+        self, workers: int = QUERY_WORKERS, timeout: float = QUERY_TIMEOUT_SECONDS
+    ) -> None:
+        if workers < 1:
+            raise ValueError("workers must be positive")
+        self.timeout = timeout
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="duckdb")
+
+    async def run(
+        self,
+        func: Callable[..., T],
+        *args: Any,
+        timeout: float | None = None,
+        is_disconnected: Callable[[], Awaitable[bool]] | None = None,
+    ) -> T:
+        """Call ``func(*args)`` on the pool; cancel it if the client goes away."""
+        request = Interruptible()
+        call = asyncio.ensure_future(self._call(request, func, *args, timeout=timeout))
+        if is_disconnected is None:
+            return await call
+        while True:
+            done, _ = await asyncio.wait({call}, timeout=DISCONNECT_POLL_SECONDS)
+            if done:
+                return call.result()
+            if await is_disconnected():
+                call.cancel()
+                return await call
+
+    async def stream(
+        self, chunks: Iterator[bytes], timeout: float | None = None
+    ) -> AsyncIterator[bytes]:
+        """Pull chunks from a blocking iterator on the pool under one request deadline."""
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + (self.timeout if timeout is None else timeout)
+        request = Interruptible()
+        lock = Lock()
+        finished = False
+
+        def step() -> bytes | None:
+            with lock:
+                return next(chunks, None)
+
+        def close() -> None:
+            with lock:
+                close_chunks = getattr(chunks, "close", None)
+                if close_chunks is not None:
+                    close_chunks()
+
+        try:
+            while True:
+                remaining = deadline - loop.time()
+                chunk = await self._call(request, step, timeout=max(remaining, 0))
+                if chunk is None:
+                    finished = True
+                    return
+                yield chunk
+        finally:
+            if not finished:
+                request.cancel()
+                # Runs after any in-flight step so the iterator releases its cursor.
+                self._executor.submit(close)
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    async def _call(
+        self,
+        request: Interruptible,
+        func: Callable[..., T],
+        *args: Any,
+        timeout: float | None = None,
+    ) -> T:
+        def call() -> T:
+            token = active_request.set(request)
+            try:
+                return func(*args)
+            finally:
+                active_request.reset(token)
+
+        loop = asyncio.get_running_loop()
+        future = loop.run_in_executor(self._executor, call)
+        try:
+            return await asyncio.wait_for(future, self.timeout if timeout is None else timeout)
+        except (TimeoutError, asyncio.CancelledError):
+            request.cancel()
+            raise
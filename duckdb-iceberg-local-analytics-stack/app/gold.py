@@ -0,0 +1,102 @@
+from collections.abc import Iterable
+from dataclasses import dataclass
+from pathlib import Path
+from threading import Lock
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from app.cache import fingerprint, warehouse_version
+from app.config import (
+    GOLD_COHORT_ACTIVITY,
+    GOLD_CUSTOMER_SUMMARY,
+    GOLD_DAILY_REVENUE,
+    GOLD_MONTHLY_GROWTH,
+    SILVER_CUSTOMERS,
+    SILVER_ORDERS_PATHS,
+)
+
+
+@dataclass(frozen=True)
+class GoldTable:
+    """A materialized gold dataset that can answer a silver report."""
+
+    view: str
+    path: Path
+    sql_file: str
+    sources: tuple[Path, ...]
+    # Report filters the gold query applies exactly; other filters need silver.
+    filters: frozenset[str] = frozenset()
+
+
+GOLD_TABLES: dict[str, GoldTable] = {
+    "revenue.sql": GoldTable(
+        "gold_daily_revenue",
+        GOLD_DAILY_REVENUE,
+        "gold_revenue.sql",
+        SILVER_ORDERS_PATHS,
+        frozenset({"start", "end"}),
+    ),
+    "growth.sql": GoldTable(
+        "gold_monthly_growth", GOLD_MONTHLY_GROWTH, "gold_growth.sql", SILVER_ORDERS_PATHS
+    ),
+    "customers.sql": GoldTable(
+        "gold_customer_summary",
+        GOLD_CUSTOMER_SUMMARY,
+        "gold_customers.sql",
+        (*SILVER_ORDERS_PATHS, SILVER_CUSTOMERS),
+        frozenset({"region", "segment"}),
+    ),
+    "retention.sql": GoldTable(
+        "gold_cohort_activity", GOLD_COHORT_ACTIVITY, "gold_retention.sql", SILVER_ORDERS_PATHS
+    ),
+}
+
+
+def _latest_mtime(paths: Iterable[Path]) -> int:
+    return max((mtime for _, _, mtime in fingerprint(paths)), default=0)
+
+
+_freshness: dict[Path, tuple[tuple[int, int, int], bool]] = {}
+_freshness_lock = Lock()
+
+
+def is_fresh(table: GoldTable) -> bool:
+    """Return whether the gold file exists and was written after its silver inputs.
+
+    The answer is kept until the warehouse version changes, so the silver files are only
+    listed once per pipeline run rather than on every request.
+    """
+    version = warehouse_version()
+    with _freshness_lock:
+        known = _freshness.get(table.path)
+    if known is not None and known[0] == version:
+        return known[1]
+    gold = fingerprint((table.path,))
+    fresh = bool(gold) and gold[0][2] >= _latest_mtime(table.sources)
+    with _freshness_lock:
+        _freshness[table.path] = (version, fresh)
+    return fresh
+
+
+class PinnedGold:
+    """Keep small gold tables in memory as Arrow, reloading when the file changes."""
+
+    def __init__(self) -> None:
+        self._tables: dict[Path, tuple[tuple, pa.Table]] = {}
+        self._lock = Lock()
+
+    def get(self, table: GoldTable) -> pa.Table:
+        version = fingerprint((table.path,))
+        with self._lock:
+            pinned = self._tables.get(table.path)
+            if pinned is not None and pinned[0] == version:
+                return pinned[1]
+        loaded = pq.read_table(table.path)
+        with self._lock:
+            self._tables[table.path] = (version, loaded)
+        return loaded
+
+    def clear(self) -> None:
+        with self._lock:
+            self._tables.clear()
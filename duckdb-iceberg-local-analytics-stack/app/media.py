@@ -0,0 +1,35 @@
+ARROW_STREAM = "application/vnd.apache.arrow.stream"
+PARQUET = "application/vnd.apache.parquet"
+NDJSON = "application/x-ndjson"
+STREAMING_MEDIA_TYPES = {
+    ARROW_STREAM: ARROW_STREAM,
+    PARQUET: PARQUET,
+    "application/x-parquet": PARQUET,
+    NDJSON: NDJSON,
+    "application/jsonl": NDJSON,
+}
+
+
+def negotiate(accept: str | None) -> str | None:
+    """Pick a streaming media type from an Accept header, or ``None`` for plain JSON."""
+    if not accept:
+        return None
+    candidates = []
+    for position, item in enumerate(accept.split(",")):
+        media_type, *params = (part.strip() for part in item.split(";"))
+        quality = 1.0
+        for param in params:
+            name, _, value = param.partition("=")
+            if name.strip() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        if quality > 0:
+            candidates.append((-quality, position, media_type.lower()))
+    for _, _, media_type in sorted(candidates):
+        if media_type in STREAMING_MEDIA_TYPES:
+            return STREAMING_MEDIA_TYPES[media_type]
+        if media_type in ("application/json", "*/*", "application/*"):
+            return None
+    return None
@@ -0,0 +1,179 @@
+import json
+import logging
+from datetime import UTC, datetime
+from logging.handlers import RotatingFileHandler
+from pathlib import Path
+from threading import Lock
+from typing import Any
+
+from app.config import (
+    SLOW_QUERY_LOG,
+    SLOW_QUERY_LOG_BACKUPS,
+    SLOW_QUERY_LOG_MAX_BYTES,
+    SLOW_QUERY_SECONDS,
+)
+
+SECONDS_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+ROWS_BUCKETS = (1, 10, 100, 1_000, 10_000, 100_000, 1_000_000, 10_000_000, 100_000_000)
+
+
+class Histogram:
+    """A Prometheus-style cumulative histogram with one series per query label."""
+
+    def __init__(self, name: str, description: str, buckets: tuple[float, ...]) -> None:
+        self.name = name
+        self.description = description
+        self.buckets = buckets
+        self._series: dict[str, list] = {}
+        self._lock = Lock()
+
+    def observe(self, query: str, value: float) -> None:
+        with self._lock:
+            series = self._series.setdefault(query, [[0] * len(self.buckets), 0.0, 0])
+            for index, bound in enumerate(self.buckets):
+                if value <= bound:
+                    series[0][index] += 1
+                    break
+            series[1] += value
+            series[2] += 1
+
+    def render(self) -> list[str]:
+        lines = [f"# HELP {self.name} {self.description}", f"# TYPE {self.name} histogram"]
+        with self._lock:
+            for query, (counts, total, count) in sorted(self._series.items()):
+                cumulative = 0
+                for bound, bucket_count in zip(self.buckets, counts):
+                    cumulative += bucket_count
+                    labels = f'query="{query}",le="{bound}"'
+                    lines.append(f"{self.name}_bucket{{{labels}}} {cumulative}")
+                lines.append(f'{self.name}_bucket{{query="{query}",le="+Inf"}} {count}')
+                lines.append(f'{self.name}_sum{{query="{query}"}} {total}')
+                lines.append(f'{self.name}_count{{query="{query}"}} {count}')
+        return lines
+
+
+def _slow_query_logger(path: Path, max_bytes: int, backups: int) -> logging.Logger:
+    log = logging.getLogger(f"analytics.slow_queries.{path}")
+    if not log.handlers:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        handler = RotatingFileHandler(
+            path, maxBytes=max_bytes, backupCount=backups, encoding="utf-8", delay=True
+        )
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        log.addHandler(handler)
+        log.setLevel(logging.INFO)
+        log.propagate = False
+    return log
+
+
+class QueryMetrics:
+    """Record report query timings and persist the profiles of slow queries."""
+
+    def __init__(
+        self,
+        slow_seconds: float = SLOW_QUERY_SECONDS,
+        slow_log: Path = SLOW_QUERY_LOG,
+        slow_log_max_bytes: int = SLOW_QUERY_LOG_MAX_BYTES,
+        slow_log_backups: int = SLOW_QUERY_LOG_BACKUPS,
+    ) -> None:
+        self.slow_seconds = slow_seconds
+        self.slow_log = _slow_query_logger(slow_log, slow_log_max_bytes, slow_log_backups)
+        self.duration = Histogram(
+            "analytics_query_duration_seconds",
+            "Wall time of report queries, including waiting for a cursor.",
+            SECONDS_BUCKETS,
+        )
+        self.pool_wait = Histogram(
+            "analytics_query_pool_wait_seconds",
+            "Time report queries waited for a pooled cursor.",
+            SECONDS_BUCKETS,
+        )
+        self.rows = Histogram(
+            "analytics_query_rows_returned", "Rows returned by report queries.", ROWS_BUCKETS
+        )
+        self.rows_scanned = Histogram(
+            "analytics_query_rows_scanned", "Rows scanned by report queries.", ROWS_BUCKETS
+        )
+        self._slow_queries: dict[str, int] = {}
+        # Reports whose last run was slow without a profile; their next run is profiled.
+        self._profile_next: set[str] = set()
+        self._lock = Lock()
+
+    def wants_profile(self, query: str) -> bool:
+        """Return whether the next run of a report should collect DuckDB's profile."""
+        with self._lock:
+            return query in self._profile_next
+
+    def record(
+        self,
+        query: str,
+        seconds: float,
+        waited: float,
+        rows: int | None,
+        profile: dict[str, Any] | None,
+    ) -> None:
+        """Observe one report query.
+
+        ``rows`` is the number of rows delivered to the caller, or ``None`` when the query
+        failed; ``profile`` is DuckDB's JSON profile when one was collected. A slow run
+        without a profile has the report's next run profiled, and stays out of the slow
+        query log until a profiled run is slow too.
+        """
+        self.duration.observe(query, seconds)
+        self.pool_wait.observe(query, waited)
+        if rows is not None:
+            self.rows.observe(query, rows)
+        if profile is not None:
+            self.rows_scanned.observe(query, profile.get("cumulative_rows_scanned", 0))
+        slow = seconds >= self.slow_seconds
+        with self._lock:
+            if slow:
+                self._slow_queries[query] = self._slow_queries.get(query, 0) + 1
+            if slow and profile is None:
+                self._profile_next.add(query)
+            elif profile is not None:
+                self._profile_next.discard(query)
+        if not slow or profile is None:
+            return
+        self.slow_log.info(
+            json.dumps(
+                {
+                    "at": datetime.now(UTC).isoformat(timespec="milliseconds"),
+                    "query": query,
+                    "seconds": round(seconds, 6),
+                    "pool_wait_seconds": round(waited, 6),
+                    "rows_scanned": profile.get("cumulative_rows_scanned"),
+                    # Bytes read from files; reads served by DuckDB's file cache are excluded.
+                    "bytes_read": profile.get("total_bytes_read"),
+                    "profile": profile,
+                },
+                default=str,
+            )
+        )
+
+    def render(self) -> str:
+        """Return all metrics in the Prometheus text exposition format."""
+        lines = []
+        for histogram in (
+            self.duration,
+            self.pool_wait,
+            self.rows,
+            self.rows_scanned,
+        ):
+            lines.extend(histogram.render())
+        lines.append("# HELP analytics_slow_queries_total Report queries over the slow threshold.")
+        lines.append("# TYPE analytics_slow_queries_total counter")
+        with self._lock:
+            for query, count in sorted(self._slow_queries.items()):
+                lines.append(f'analytics_slow_queries_total{{query="{query}"}} {count}')
+        return "\n".join(lines) + "\n"
+
+
+def render_gauges(prefix: str, values: dict[str, Any]) -> str:
+    """Render numeric values of a stats snapshot as Prometheus gauges."""
+    lines = []
+    for key, value in values.items():
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            lines.append(f"# TYPE {prefix}_{key} gauge")
+            lines.append(f"{prefix}_{key} {value}")
+    return "\n".join(lines) + "\n"
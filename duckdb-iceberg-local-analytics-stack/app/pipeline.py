@@ -1,18 +1,58 @@
+import argparse
+import hashlib
+import json
+import os
+import shutil
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from datetime import UTC, datetime
 from pathlib import Path
+from time import perf_counter
 
-from app.catalog import connection
+import duckdb
+import pyarrow.parquet as pq
+
+from app.cache import fingerprint, notify_warehouse_changed
+from app.catalog import (
+    bind,
+    connection,
+    register_datasets,
+    sync_silver_tables,
+)
 from app.config import (
+    BRONZE_COMPACTION_MIN_FILES,
+    BRONZE_COMPACTION_TARGET_BYTES,
     BRONZE_CUSTOMERS,
     BRONZE_ORDERS_GLOB,
-    GOLD,
+    DATABASE,
+    GOLD_COHORT_ACTIVITY,
+    GOLD_CUSTOMER_COHORTS,
+    GOLD_CUSTOMER_SUMMARY,
+    GOLD_DAILY_REVENUE,
+    GOLD_MONTHLY_GROWTH,
+    INGEST_LEDGER,
+    LEGACY_SILVER_ORDERS,
+    LEGACY_SILVER_ORDERS_INCREMENTS_GLOB,
+    PIPELINE_MANIFEST,
+    PIPELINE_PARALLELISM,
+    PIPELINE_STAGES,
+    REPORT_FILTERS,
     SILVER_CUSTOMERS,
     SILVER_ORDERS,
+    SILVER_ORDERS_GLOB,
+    SILVER_ROW_GROUP_SIZE,
+    SILVER_STORAGE,
     SQL_DIR,
     ensure_directories,
 )
 from app.data_generator import generate_data
+from app.resources import apply_limits, pipeline_limits, pipeline_running
 from app.utils import logger
 
+# Compacted bronze files are staged next to bronze/orders, outside the bronze glob.
+COMPACTION_STAGING = BRONZE_ORDERS_GLOB.parent.with_name("orders.compacting")
+COMPACTION_JOURNAL = COMPACTION_STAGING / "journal.json"
+
 
 def _sql_string(path: Path) -> str:
     return path.resolve().as_posix().replace("'", "''")
@@ -23,68 +63,631 @@ def _write_parquet(db, query: str, destination: Path) -> None:
     temporary = destination.with_suffix(".tmp.parquet")
     temporary.unlink(missing_ok=True)
     clean_query = query.strip().rstrip(";")
+    # Report SQL reused for gold is built over all of silver, with every filter disabled.
     db.execute(
         f"COPY ({clean_query}) TO '{_sql_string(temporary)}' "
-        "(FORMAT PARQUET, COMPRESSION ZSTD)"
+        "(FORMAT PARQUET, COMPRESSION ZSTD)",
+        bind(query, dict.fromkeys(REPORT_FILTERS)),
     )
     temporary.replace(destination)
 
 
-def run_pipeline() -> dict[str, int]:
-    """Promote raw bronze Parquet into validated silver and aggregate gold data."""
-    ensure_directories()
-    bronze_orders = list(BRONZE_ORDERS_GLOB.parent.glob(BRONZE_ORDERS_GLOB.name))
-    if not bronze_orders or not BRONZE_CUSTOMERS.exists():
-        raise FileNotFoundError("Bronze data is missing; run the data generator first")
+def _copy_partitioned(db, query: str, directory: Path, filename_pattern: str) -> None:
+    """Write silver orders as order_month Hive partitions sorted by order_date."""
+    clean_query = query.strip().rstrip(";")
+    db.execute(
+        "COPY ("
+        "SELECT *, CAST(DATE_TRUNC('month', order_date) AS DATE) AS order_month "
+        f"FROM ({clean_query}) ORDER BY order_date, order_time"
+        f") TO '{_sql_string(directory)}' (FORMAT PARQUET, COMPRESSION ZSTD, "
+        f"PARTITION_BY (order_month), ROW_GROUP_SIZE {SILVER_ROW_GROUP_SIZE}, "
+        f"FILENAME_PATTERN '{filename_pattern}')"
+    )
+    directory.mkdir(parents=True, exist_ok=True)
 
-    db = connection()
+
+def _write_partitioned(db, query: str, destination: Path) -> None:
+    """Replace a partitioned dataset by repointing its symlink at a freshly written version.
+
+    ``destination`` is a symlink to a ``<name>.v<timestamp>`` directory, replaced with a
+    single rename, so readers always find either the old or the new dataset. The version
+    it pointed at is kept until the next build, so a query that listed its files just
+    before the swap can still read them; older versions are removed.
+    """
+    stamp = datetime.now(UTC).strftime("%Y%m%dT%H%M%S%f")
+    version = destination.with_name(f"{destination.name}.v{stamp}")
+    _copy_partitioned(db, query, version, "part-{i}")
+    if destination.is_dir() and not destination.is_symlink():
+        # A directory from before versioned datasets; this one swap is not atomic.
+        destination.rename(destination.with_name(f"{destination.name}.v0"))
+    previous = destination.resolve() if destination.is_symlink() else None
+    link = destination.with_name(f"{destination.name}.link")
+    link.unlink(missing_ok=True)
+    # Relative, so the warehouse keeps working when DATA_ROOT is moved.
+    link.symlink_to(version.name, target_is_directory=True)
+    os.replace(link, destination)
+    for old in destination.parent.glob(f"{destination.name}.v*"):
+        if old.name != version.name and (previous is None or old.name != previous.name):
+            shutil.rmtree(old, ignore_errors=True)
+
+
+def _append_partitioned(db, query: str, destination: Path, increment: str) -> list[Path]:
+    """Add an increment's files to the matching partitions of an existing dataset."""
+    temporary = destination.with_name(f"{destination.name}.increment")
+    shutil.rmtree(temporary, ignore_errors=True)
+    _copy_partitioned(db, query, temporary, f"increment-{increment}-{{i}}")
+    appended = []
+    for source in sorted(temporary.glob("*/*.parquet")):
+        target = destination / source.parent.name / source.name
+        target.parent.mkdir(parents=True, exist_ok=True)
+        source.replace(target)
+        appended.append(target)
+    shutil.rmtree(temporary, ignore_errors=True)
+    return appended
+
+
+@dataclass(frozen=True)
+class PipelineNode:
+    """One dataset written from a SQL file once the nodes it depends on are built.
+
+    ``inputs`` lists files the node reads besides the datasets of its dependencies.
+    """
+
+    name: str
+    sql_file: str
+    destination: Path
+    depends_on: tuple[str, ...] = ()
+    partitioned: bool = False
+    inputs: tuple[Path, ...] = ()
+
+
+FULL_BUILD = (
+    PipelineNode(
+        "silver_orders",
+        "silver_orders.sql",
+        SILVER_ORDERS,
+        partitioned=True,
+        inputs=(BRONZE_ORDERS_GLOB.parent,),
+    ),
+    PipelineNode(
+        "silver_customers", "silver_customers.sql", SILVER_CUSTOMERS, inputs=(BRONZE_CUSTOMERS,)
+    ),
+    # The report SQL joins silver_customers for its region and segment filters.
+    PipelineNode(
+        "gold_daily_revenue",
+        "revenue.sql",
+        GOLD_DAILY_REVENUE,
+        ("silver_orders", "silver_customers"),
+    ),
+    PipelineNode(
+        "gold_monthly_growth",
+        "growth.sql",
+        GOLD_MONTHLY_GROWTH,
+        ("silver_orders", "silver_customers"),
+    ),
+    PipelineNode(
+        "gold_customer_summary",
+        "gold_customer_summary.sql",
+        GOLD_CUSTOMER_SUMMARY,
+        ("silver_orders",),
+    ),
+    PipelineNode(
+        "gold_customer_cohorts",
+        "gold_customer_cohorts.sql",
+        GOLD_CUSTOMER_COHORTS,
+        ("silver_orders",),
+    ),
+    PipelineNode(
+        "gold_cohort_activity",
+        "gold_cohort_activity.sql",
+        GOLD_COHORT_ACTIVITY,
+        ("gold_customer_cohorts",),
+    ),
+)
+
+GOLD_MERGES = (
+    PipelineNode("gold_daily_revenue", "gold_daily_revenue_merge.sql", GOLD_DAILY_REVENUE),
+    PipelineNode("gold_monthly_growth", "gold_monthly_growth_merge.sql", GOLD_MONTHLY_GROWTH),
+    PipelineNode(
+        "gold_customer_summary", "gold_customer_summary_merge.sql", GOLD_CUSTOMER_SUMMARY
+    ),
+    PipelineNode("gold_cohort_activity", "gold_cohort_activity_merge.sql", GOLD_COHORT_ACTIVITY),
+    # Replaced only after the matrix merge has read the previous per-customer state.
+    PipelineNode(
+        "gold_customer_cohorts",
+        "gold_customer_cohorts_merge.sql",
+        GOLD_CUSTOMER_COHORTS,
+        ("gold_cohort_activity",),
+    ),
+)
+
+
+def _build_node(db, node: PipelineNode) -> float:
+    started = perf_counter()
+    cursor = db.cursor()
     try:
-        silver_orders_sql = (SQL_DIR / "silver_orders.sql").read_text(encoding="utf-8")
-        _write_parquet(db, silver_orders_sql, SILVER_ORDERS)
-        _write_parquet(
-            db,
-            """
-            SELECT
-                CAST(customer_id AS BIGINT) AS customer_id,
-                customer_name,
-                region,
-                segment,
-                CAST(signup_date AS DATE) AS signup_date
-            FROM bronze_customers
-            WHERE customer_id IS NOT NULL
-            """,
-            SILVER_CUSTOMERS,
+        query = (SQL_DIR / node.sql_file).read_text(encoding="utf-8")
+        if node.partitioned:
+            _write_partitioned(cursor, query, node.destination)
+        else:
+            _write_parquet(cursor, query, node.destination)
+    finally:
+        cursor.close()
+    return perf_counter() - started
+
+
+def _footer_digest(path: Path) -> str:
+    """Hash a Parquet file's footer, which changes whenever the data it describes does."""
+    with path.open("rb") as file:
+        file.seek(-8, os.SEEK_END)
+        length = int.from_bytes(file.read(4), "little")
+        file.seek(-8 - length, os.SEEK_END)
+        return hashlib.sha256(file.read(length)).hexdigest()
+
+
+def _digest(paths: tuple[Path, ...], *extra: str) -> str:
+    """Identify the content of Parquet datasets by file name, size, and footer."""
+    signature = [
+        (name, size, _footer_digest(Path(name))) for name, size, _ in fingerprint(paths)
+    ]
+    return hashlib.sha256(json.dumps([signature, *extra]).encode()).hexdigest()
+
+
+def _node_inputs(node: PipelineNode, nodes: dict[str, PipelineNode]) -> tuple[Path, ...]:
+    return (*node.inputs, *(nodes[name].destination for name in node.depends_on))
+
+
+def _stage_key(node: PipelineNode, nodes: dict[str, PipelineNode]) -> str:
+    query = (SQL_DIR / node.sql_file).read_text(encoding="utf-8")
+    return _digest(_node_inputs(node, nodes), query)
+
+
+def _is_current(node: PipelineNode, key: str, stages: dict[str, dict[str, str]]) -> bool:
+    """Return whether a node's output was built from the same inputs and SQL as now."""
+    stage = stages.get(node.name)
+    if stage is None or stage["key"] != key or not node.destination.exists():
+        return False
+    return stage["output"] == _digest((node.destination,))
+
+
+def _keep_fresh(node: PipelineNode, nodes: dict[str, PipelineNode]) -> None:
+    """Touch a skipped output that is older than rewritten but identical inputs.
+
+    Gold is only served when it is newer than silver, so an unchanged gold file must not
+    look stale after silver was rewritten with the same rows.
+    """
+    if node.partitioned:
+        return
+    newest = max((mtime for _, _, mtime in fingerprint(_node_inputs(node, nodes))), default=0)
+    if node.destination.stat().st_mtime_ns < newest:
+        os.utime(node.destination)
+
+
+def _read_stages() -> dict[str, dict[str, str]]:
+    if not PIPELINE_STAGES.exists():
+        return {}
+    return json.loads(PIPELINE_STAGES.read_text(encoding="utf-8"))
+
+
+def _write_stages(stages: dict[str, dict[str, str]]) -> None:
+    temporary = PIPELINE_STAGES.with_suffix(".tmp.json")
+    temporary.write_text(json.dumps(stages, indent=2), encoding="utf-8")
+    temporary.replace(PIPELINE_STAGES)
+
+
+def _run_graph(
+    db,
+    nodes: tuple[PipelineNode, ...],
+    parallelism: int,
+    stages: dict[str, dict[str, str]] | None = None,
+) -> int:
+    """Build nodes on separate cursors, running independent nodes concurrently.
+
+    With ``stages``, a node whose SQL and input files match the recorded stage key is
+    skipped, and the key of every node that is built is recorded. Returns the number of
+    nodes that were built.
+    """
+    if parallelism < 1:
+        raise ValueError("parallelism must be positive")
+    graph = {node.name: node for node in nodes}
+    pending = dict(graph)
+    built: set[str] = set()
+    running = {}
+    keys: dict[str, str] = {}
+    rebuilt = 0
+    with ThreadPoolExecutor(max_workers=parallelism) as executor:
+        while pending or running:
+            skipped = False
+            for name, node in list(pending.items()):
+                if not set(node.depends_on) <= built:
+                    continue
+                del pending[name]
+                if stages is not None:
+                    keys[name] = _stage_key(node, graph)
+                    if _is_current(node, keys[name], stages):
+                        _keep_fresh(node, graph)
+                        built.add(name)
+                        skipped = True
+                        logger.info("pipeline_node_skipped node=%s reason=unchanged", name)
+                        continue
+                running[executor.submit(_build_node, db, node)] = node
+            if skipped:
+                continue
+            if not running:
+                raise ValueError(f"pipeline nodes have unmet dependencies: {sorted(pending)}")
+            finished, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in finished:
+                node = running.pop(future)
+                seconds = future.result()
+                built.add(node.name)
+                rebuilt += 1
+                logger.info("pipeline_node_complete node=%s seconds=%.3f", node.name, seconds)
+                if stages is not None:
+                    stages[node.name] = {
+                        "key": keys[node.name],
+                        "output": _digest((node.destination,)),
+                    }
+                    _write_stages(stages)
+            # Refresh the views so dependent nodes read the datasets just written.
+            register_datasets(db)
+    return rebuilt
+
+
+def _bronze_order_files() -> list[Path]:
+    return sorted(BRONZE_ORDERS_GLOB.parent.glob(BRONZE_ORDERS_GLOB.name))
+
+
+def _silver_increments() -> list[str]:
+    return sorted({path.name.split("-")[1] for path in SILVER_ORDERS.glob("*/increment-*.parquet")})
+
+
+def _legacy_silver_orders() -> list[Path]:
+    increments = LEGACY_SILVER_ORDERS_INCREMENTS_GLOB
+    legacy = [LEGACY_SILVER_ORDERS] if LEGACY_SILVER_ORDERS.exists() else []
+    return legacy + sorted(increments.parent.glob(increments.name))
+
+
+def _remove_legacy_silver_orders() -> None:
+    for path in _legacy_silver_orders():
+        path.unlink()
+    shutil.rmtree(LEGACY_SILVER_ORDERS_INCREMENTS_GLOB.parent, ignore_errors=True)
+
+
+def _file_state(path: Path) -> dict[str, int]:
+    stat = path.stat()
+    return {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+
+def _read_manifest() -> dict | None:
+    if not PIPELINE_MANIFEST.exists():
+        return None
+    return json.loads(PIPELINE_MANIFEST.read_text(encoding="utf-8"))
+
+
+def _write_manifest(bronze_files: list[Path], increments: list[str], storage: str) -> None:
+    """Record which bronze files silver and gold were built from, and the silver storage."""
+    _save_manifest(
+        {
+            "bronze": {path.name: _file_state(path) for path in bronze_files},
+            "increments": increments,
+            "storage": storage,
+        }
+    )
+
+
+def _manifest_storage(manifest: dict | None) -> str:
+    """Return the silver storage mode of the last build, or the configured default."""
+    if manifest is None:
+        return SILVER_STORAGE
+    return manifest.get("storage", SILVER_STORAGE)
+
+
+def recorded_storage() -> str:
+    """Return the silver storage mode the last build recorded in the manifest."""
+    return _manifest_storage(_read_manifest())
+
+
+def _save_manifest(manifest: dict) -> None:
+    temporary = PIPELINE_MANIFEST.with_suffix(".tmp.json")
+    temporary.write_text(json.dumps(manifest, indent=2), encoding="utf-8")
+    temporary.replace(PIPELINE_MANIFEST)
+
+
+def _compactable_bronze_files(target_bytes: int) -> list[Path]:
+    """Return bronze order files below the target size that silver was already built from.
+
+    Files the manifest has not seen yet are left for the next incremental run. Generated
+    files are never merged, so regenerating data cannot take ingested rows with it.
+    """
+    manifest = _read_manifest()
+    files = [
+        path
+        for path in _bronze_order_files()
+        if not path.name.startswith("generated-") and path.stat().st_size < target_bytes
+    ]
+    if manifest is None:
+        return files
+    return [path for path in files if manifest["bronze"].get(path.name) == _file_state(path)]
+
+
+def _finish_compaction() -> None:
+    """Swap staged compacted files into bronze, resuming a swap that was interrupted.
+
+    The journal is written only after the compacted files were checked, so without it
+    the staging directory holds an incomplete write and is discarded.
+    """
+    if not COMPACTION_JOURNAL.exists():
+        shutil.rmtree(COMPACTION_STAGING, ignore_errors=True)
+        return
+    journal = json.loads(COMPACTION_JOURNAL.read_text(encoding="utf-8"))
+    orders = BRONZE_ORDERS_GLOB.parent
+    for name in journal["outputs"]:
+        staged = COMPACTION_STAGING / name
+        if staged.exists():
+            staged.replace(orders / name)
+    for name in journal["sources"]:
+        (orders / name).unlink(missing_ok=True)
+
+    manifest = _read_manifest()
+    if manifest is not None:
+        bronze = {
+            name: state
+            for name, state in manifest["bronze"].items()
+            if name not in journal["sources"]
+        }
+        bronze.update({name: _file_state(orders / name) for name in journal["outputs"]})
+        _save_manifest({**manifest, "bronze": bronze})
+    _relink_ledger(journal["sources"], journal["outputs"])
+    shutil.rmtree(COMPACTION_STAGING, ignore_errors=True)
+
+
+def _relink_ledger(sources: list[str], outputs: list[str]) -> None:
+    """Point ingest ledger entries for merged bronze files at the compacted files.
+
+    Compacted files are sorted by time, so an ingested file's rows can end up in any of
+    them and its entry lists every output of the compaction.
+    """
+    if not INGEST_LEDGER.exists():
+        return
+    ledger = json.loads(INGEST_LEDGER.read_text(encoding="utf-8"))
+    merged = set(sources)
+    for entry in ledger["files"].values():
+        bronze = entry.get("bronze")
+        names = [bronze] if isinstance(bronze, str) else bronze or []
+        if merged.intersection(names):
+            entry["bronze"] = sorted({*(name for name in names if name not in merged), *outputs})
+    temporary = INGEST_LEDGER.with_suffix(".tmp.json")
+    temporary.write_text(json.dumps(ledger, indent=2), encoding="utf-8")
+    temporary.replace(INGEST_LEDGER)
+
+
+@pipeline_running()
+def compact_bronze(
+    target_bytes: int = BRONZE_COMPACTION_TARGET_BYTES,
+    min_files: int = BRONZE_COMPACTION_MIN_FILES,
+) -> int:
+    """Merge small bronze order files into files of about ``target_bytes`` sorted by time.
+
+    Nothing is done until at least ``min_files`` small files have accumulated. The merged
+    rows are written to a staging directory and checked against the source footers before
+    they replace the small files, and the manifest is updated so the next incremental run
+    does not fall back to a full rebuild. Returns the number of files that were merged.
+    """
+    if target_bytes < 1:
+        raise ValueError("target_bytes must be positive")
+    _finish_compaction()
+    sources = _compactable_bronze_files(target_bytes)
+    if len(sources) < max(min_files, 2):
+        logger.info("bronze_compaction_skipped small_files=%s", len(sources))
+        return 0
+
+    started = perf_counter()
+    expected_rows = sum(pq.read_metadata(path).num_rows for path in sources)
+    stamp = datetime.now(UTC).strftime("%Y%m%dT%H%M%S")
+    files = ", ".join(f"'{_sql_string(path)}'" for path in sources)
+    # An in-memory connection, so compaction never waits for the database file lock.
+    db = duckdb.connect()
+    try:
+        apply_limits(db, "pipeline")
+        db.execute(
+            f"COPY (SELECT * FROM read_parquet([{files}], union_by_name = true) "
+            "ORDER BY TRY_CAST(order_time AS TIMESTAMP), order_id) "
+            f"TO '{_sql_string(COMPACTION_STAGING)}' (FORMAT PARQUET, COMPRESSION ZSTD, "
+            f"FILE_SIZE_BYTES {target_bytes}, FILENAME_PATTERN 'compacted-{stamp}-{{i}}')"
         )
     finally:
         db.close()
+    outputs = sorted(COMPACTION_STAGING.glob("*.parquet"))
+    rows = sum(pq.read_metadata(path).num_rows for path in outputs)
+    if rows != expected_rows:
+        shutil.rmtree(COMPACTION_STAGING, ignore_errors=True)
+        raise RuntimeError(f"compacted bronze has {rows} rows, expected {expected_rows}")
 
-    # Reconnect so the catalog registers the newly created silver datasets.
+    journal = {
+        "sources": [path.name for path in sources],
+        "outputs": [path.name for path in outputs],
+    }
+    temporary = COMPACTION_JOURNAL.with_suffix(".tmp")
+    temporary.write_text(json.dumps(journal, indent=2), encoding="utf-8")
+    temporary.replace(COMPACTION_JOURNAL)
+    _finish_compaction()
+    logger.info(
+        "bronze_compaction_complete sources=%s outputs=%s rows=%s seconds=%.3f",
+        len(sources),
+        len(outputs),
+        rows,
+        perf_counter() - started,
+    )
+    return len(sources)
+
+
+def migrate_silver_orders() -> bool:
+    """Convert a single-file silver orders dataset into the month-partitioned layout."""
+    legacy = _legacy_silver_orders()
+    if not legacy:
+        return False
+    if SILVER_ORDERS.exists() or not LEGACY_SILVER_ORDERS.exists():
+        # A previous migration swapped the new layout in but did not finish cleaning up.
+        _remove_legacy_silver_orders()
+        return False
+
+    sources = ", ".join(f"'{_sql_string(path)}'" for path in legacy)
     db = connection()
     try:
-        _write_parquet(
-            db,
-            (SQL_DIR / "revenue.sql").read_text(encoding="utf-8"),
-            GOLD / "daily_revenue.parquet",
-        )
-        _write_parquet(
-            db,
-            (SQL_DIR / "growth.sql").read_text(encoding="utf-8"),
-            GOLD / "monthly_growth.parquet",
-        )
-        _write_parquet(
-            db,
-            """
-            SELECT
-                customer_id,
-                COUNT(*) AS lifetime_orders,
-                ROUND(SUM(total_amount), 2) AS lifetime_revenue,
-                MIN(order_date) AS first_order_date,
-                MAX(order_date) AS last_order_date
-            FROM silver_orders
-            GROUP BY customer_id
-            """,
-            GOLD / "customer_summary.parquet",
+        _write_partitioned(db, f"SELECT * FROM read_parquet([{sources}])", SILVER_ORDERS)
+    finally:
+        db.close()
+    # Serving re-registers its views on the new layout before the legacy files go away.
+    notify_warehouse_changed()
+    _remove_legacy_silver_orders()
+
+    # Gold was built from exactly these rows, so keep it fresh relative to the new files.
+    for node in GOLD_MERGES:
+        if node.destination.exists():
+            os.utime(node.destination)
+    manifest = _read_manifest()
+    if manifest is not None:
+        bronze_files = [path for path in _bronze_order_files() if path.name in manifest["bronze"]]
+        _write_manifest(bronze_files, [], _manifest_storage(manifest))
+    notify_warehouse_changed()
+    logger.info("migrated_silver_orders files=%s destination=%s", len(legacy), SILVER_ORDERS)
+    return True
+
+
+def _sync_silver_storage(storage: str, appended: list[Path] | None = None) -> None:
+    """Load silver into native tables in the database file or drop them, per storage mode.
+
+    The tables live in the serving database, so they are built there under pipeline
+    limits. When a serving process in another process holds the file, the build is left
+    to it: the API syncs the tables to the recorded mode once it sees the new manifest.
+    """
+    try:
+        db = duckdb.connect(str(DATABASE))
+    except duckdb.IOException as exc:
+        logger.warning("silver_storage_deferred_to_api storage=%s error=%s", storage, exc)
+        return
+    try:
+        with pipeline_limits(db):
+            sync_silver_tables(db, storage, appended)
+    finally:
+        db.close()
+
+
+def _run_incremental(parallelism: int, storage: str) -> dict[str, int] | None:
+    """Append new bronze files to silver and merge them into gold.
+
+    Returns ``None`` when the warehouse does not match the manifest and needs a full rebuild.
+    """
+    manifest = _read_manifest()
+    required = (SILVER_ORDERS, SILVER_CUSTOMERS, *(node.destination for node in GOLD_MERGES))
+    if manifest is None or not all(path.exists() for path in required):
+        return None
+    increments = _silver_increments()
+    if increments != manifest["increments"]:
+        return None
+    bronze_files = _bronze_order_files()
+    current = {path.name: path for path in bronze_files}
+    for name, state in manifest["bronze"].items():
+        if name not in current or _file_state(current[name]) != state:
+            return None
+
+    new_files = [path for path in bronze_files if path.name not in manifest["bronze"]]
+    if not new_files:
+        logger.info("incremental_pipeline_up_to_date bronze_files=%s", len(bronze_files))
+        return {"bronze_orders": 0, "silver_orders": 0, "customers": -1}
+
+    increment = f"{len(increments) + 1:06d}"
+    sources = ", ".join(f"'{_sql_string(path)}'" for path in new_files)
+    db = connection()
+    try:
+        db.execute(
+            "CREATE OR REPLACE TEMP VIEW bronze_orders AS "
+            f"SELECT * FROM read_parquet([{sources}], union_by_name = true)"
         )
+        silver_orders_sql = (SQL_DIR / "silver_orders.sql").read_text(encoding="utf-8")
+        appended = _append_partitioned(db, silver_orders_sql, SILVER_ORDERS, increment)
+        bronze_rows = db.execute("SELECT COUNT(*) FROM bronze_orders").fetchone()
+        customers = db.execute("SELECT COUNT(*) FROM silver_customers").fetchone()
+        if bronze_rows is None or customers is None:
+            raise RuntimeError("DuckDB did not return pipeline row counts")
+    finally:
+        db.close()
+
+    silver_rows = 0
+    if appended:
+        db = connection()
+        delta = SILVER_ORDERS_GLOB.with_name(f"increment-{increment}-*.parquet")
+        try:
+            # A regular view rather than a temporary one so that every cursor can see it.
+            db.execute(
+                "CREATE OR REPLACE VIEW silver_orders_delta AS "
+                f"SELECT * FROM read_parquet('{_sql_string(delta)}', hive_partitioning = true)"
+            )
+            _run_graph(db, GOLD_MERGES, parallelism)
+            count = db.execute("SELECT COUNT(*) FROM silver_orders_delta").fetchone()
+            if count is None:
+                raise RuntimeError("DuckDB did not return pipeline row counts")
+            silver_rows = count[0]
+        finally:
+            db.close()
+        _sync_silver_storage(storage, appended)
+        increments = [*increments, increment]
+
+    _write_manifest(bronze_files, increments, storage)
+    result = {
+        "bronze_orders": bronze_rows[0],
+        "silver_orders": silver_rows,
+        "customers": customers[0],
+    }
+    logger.info(
+        "incremental_pipeline_complete bronze_files=%s bronze_orders=%s silver_orders=%s",
+        len(new_files),
+        result["bronze_orders"],
+        result["silver_orders"],
+    )
+    return result
+
+
+@pipeline_running()
+def run_pipeline(
+    incremental: bool = False,
+    parallelism: int = PIPELINE_PARALLELISM,
+    storage: str | None = None,
+    force: bool = False,
+) -> dict[str, int]:
+    """Promote raw bronze Parquet into validated silver and aggregate gold data.
+
+    With ``incremental=True`` only bronze files missing from the pipeline manifest are
+    processed; the pipeline falls back to a full rebuild when the manifest is stale.
+    A full build skips datasets whose SQL and input files are unchanged since they were
+    last built, unless ``force=True``. Up to ``parallelism`` independent datasets are
+    built at the same time. With ``storage="table"`` silver is also loaded into native
+    tables in the database file; without ``storage`` the mode recorded in the manifest by
+    the last build is kept, falling back to ``SILVER_STORAGE``.
+    """
+    if storage is None:
+        storage = _manifest_storage(_read_manifest())
+    if storage not in ("parquet", "table"):
+        raise ValueError("storage must be 'parquet' or 'table'")
+    ensure_directories()
+    _finish_compaction()
+    bronze_orders = _bronze_order_files()
+    if not bronze_orders or not BRONZE_CUSTOMERS.exists():
+        raise FileNotFoundError("Bronze data is missing; run the data generator first")
+    if incremental:
+        migrate_silver_orders()
+        result = _run_incremental(parallelism, storage)
+        if result is not None:
+            if result["bronze_orders"]:
+                notify_warehouse_changed()
+            return result
+        logger.info("incremental_pipeline_fallback reason=manifest_mismatch")
+
+    stages = {} if force else _read_stages()
+    db = connection()
+    try:
+        rebuilt = _run_graph(db, FULL_BUILD, parallelism, stages)
+        _remove_legacy_silver_orders()
         counts = db.execute(
             """
             SELECT
@@ -103,11 +706,18 @@ def run_pipeline() -> dict[str, int]:
     finally:
         db.close()
 
+    _sync_silver_storage(storage)
+    _write_manifest(bronze_orders, [], storage)
+    if rebuilt:
+        notify_warehouse_changed()
     logger.info(
-        "analytics_pipeline_complete bronze_orders=%s silver_orders=%s customers=%s",
+        "analytics_pipeline_complete bronze_orders=%s silver_orders=%s customers=%s "
+        "rebuilt=%s skipped=%s",
         result["bronze_orders"],
         result["silver_orders"],
         result["customers"],
+        rebuilt,
+        len(FULL_BUILD) - rebuilt,
     )
     return result
 
@@ -117,6 +727,7 @@ def bootstrap() -> dict[str, int]:
     ensure_directories()
     if not list(BRONZE_ORDERS_GLOB.parent.glob(BRONZE_ORDERS_GLOB.name)) or not BRONZE_CUSTOMERS.exists():
         generate_data()
+    migrate_silver_orders()
     if not SILVER_ORDERS.exists() or not SILVER_CUSTOMERS.exists():
         return run_pipeline()
     return {"bronze_orders": -1, "silver_orders": -1, "customers": -1}
@@ -125,10 +736,55 @@ def bootstrap() -> dict[str, int]:
 def main() -> None:
     from app.utils import configure_logging
 
+    parser = argparse.ArgumentParser(description="Build the silver and gold layers")
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="only process bronze files that are not yet in the pipeline manifest",
+    )
+    parser.add_argument(
+        "--parallelism",
+        type=int,
+        default=PIPELINE_PARALLELISM,
+        help="maximum number of datasets built at the same time",
+    )
+    parser.add_argument(
+        "--storage",
+        choices=("parquet", "table"),
+        help=(
+            "serve silver from Parquet views or from native tables in the database file; "
+            "defaults to the mode of the last build"
+        ),
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="rebuild every dataset, even those whose SQL and inputs are unchanged",
+    )
+    parser.add_argument(
+        "--compact",
+        action="store_true",
+        help="merge small bronze order files instead of building; suited to a scheduled job",
+    )
+    parser.add_argument(
+        "--compact-min-files",
+        type=int,
+        default=BRONZE_COMPACTION_MIN_FILES,
+        help="only compact once at least this many small bronze files exist",
+    )
+    args = parser.parse_args()
     configure_logging()
+    if args.compact:
+        compact_bronze(min_files=args.compact_min_files)
+        return
     if not list(BRONZE_ORDERS_GLOB.parent.glob(BRONZE_ORDERS_GLOB.name)):
         generate_data()
-    run_pipeline()
+    run_pipeline(
+        incremental=args.incremental,
+        parallelism=args.parallelism,
+        storage=args.storage,
+        force=args.force,
+    )
 
 
 if __name__ == "__main__":
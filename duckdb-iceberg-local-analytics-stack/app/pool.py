@@ -0,0 +1,124 @@
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from queue import Queue
+from threading import Lock
+from time import perf_counter
+from typing import Any
+
+import duckdb
+
+from app.catalog import connection
+from app.config import POOL_SIZE, QUERY_PROFILING
+from app.resources import ServingGovernor
+
+
+class QueryCancelled(Exception):
+    """Raised when a request is cancelled before its query starts."""
+
+
+class Interruptible:
+    """Track the cursors used on behalf of one request so its queries can be interrupted."""
+
+    def __init__(self) -> None:
+        self._cursors: set[duckdb.DuckDBPyConnection] = set()
+        self._lock = Lock()
+        self.cancelled = False
+
+    def attach(self, cursor: duckdb.DuckDBPyConnection) -> None:
+        with self._lock:
+            if self.cancelled:
+                raise QueryCancelled("request was cancelled")
+            self._cursors.add(cursor)
+
+    def detach(self, cursor: duckdb.DuckDBPyConnection) -> None:
+        with self._lock:
+            self._cursors.discard(cursor)
+
+    def cancel(self) -> None:
+        with self._lock:
+            self.cancelled = True
+            for cursor in self._cursors:
+                cursor.interrupt()
+
+
+active_request: ContextVar[Interruptible | None] = ContextVar("active_request", default=None)
+
+
+class ConnectionPool:
+    """Hand out DuckDB cursors that share one database instance across threads."""
+
+    def __init__(self, size: int = POOL_SIZE, profiling: bool = QUERY_PROFILING) -> None:
+        if size < 1:
+            raise ValueError("pool size must be positive")
+        self.size = size
+        self.profiling = profiling
+        self.db = connection("serving")
+        self.governor = ServingGovernor(self.db)
+        self._idle: Queue[duckdb.DuckDBPyConnection] = Queue()
+        for _ in range(size):
+            cursor = self.db.cursor()
+            if profiling:
+                # Profile every query without printing it; read back with get_profiling_information.
+                cursor.execute("PRAGMA enable_profiling = 'no_output'")
+            self._idle.put(cursor)
+        self._stats_lock = Lock()
+        self._in_use = 0
+        self._waiting = 0
+        self._peak_in_use = 0
+        self._checkouts = 0
+        self._wait_seconds = 0.0
+        self._max_wait_seconds = 0.0
+
+    @contextmanager
+    def acquire(self) -> Iterator[duckdb.DuckDBPyConnection]:
+        """Borrow a cursor, blocking until one is free."""
+        self.governor.poll()
+        started = perf_counter()
+        with self._stats_lock:
+            self._waiting += 1
+        try:
+            cursor = self._idle.get()
+        finally:
+            with self._stats_lock:
+                self._waiting -= 1
+        waited = perf_counter() - started
+        with self._stats_lock:
+            self._in_use += 1
+            self._checkouts += 1
+            self._peak_in_use = max(self._peak_in_use, self._in_use)
+            self._wait_seconds += waited
+            self._max_wait_seconds = max(self._max_wait_seconds, waited)
+        request = active_request.get()
+        try:
+            if request is not None:
+                request.attach(cursor)
+            yield cursor
+        finally:
+            if request is not None:
+                request.detach(cursor)
+            with self._stats_lock:
+                self._in_use -= 1
+            self._idle.put(cursor)
+
+    def stats(self) -> dict[str, Any]:
+        """Return a snapshot of pool saturation counters."""
+        with self._stats_lock:
+            return {
+                "size": self.size,
+                "in_use": self._in_use,
+                "idle": self.size - self._in_use,
+                "waiting": self._waiting,
+                "peak_in_use": self._peak_in_use,
+                "checkouts": self._checkouts,
+                "utilization": round(self._in_use / self.size, 4),
+                "total_wait_ms": round(self._wait_seconds * 1000, 3),
+                "max_wait_ms": round(self._max_wait_seconds * 1000, 3),
+                "threads": self.governor.threads,
+                "pipeline_active": int(self.governor.pipeline_active),
+            }
+
+    def close(self) -> None:
+        while not self._idle.empty():
+            self._idle.get_nowait().close()
+        self.db.close()
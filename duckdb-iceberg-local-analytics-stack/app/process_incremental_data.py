@@ -1,71 +1,239 @@
 import argparse
+import json
+import os
 import shutil
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import UTC, datetime
 from pathlib import Path
 
 import duckdb
+import pyarrow as pa
+import pyarrow.parquet as pq
 
-from app.config import BRONZE, INCOMING, ensure_directories
-from app.pipeline import run_pipeline
+from app.config import (
+    BRONZE,
+    INCOMING,
+    INGEST_BATCH_FILES,
+    INGEST_LEDGER,
+    INGEST_WORKERS,
+    ensure_directories,
+)
+from app.pipeline import compact_bronze, run_pipeline
+from app.resources import apply_limits, pipeline_running
 from app.utils import configure_logging, logger
 
 
+def _is_text(data_type: pa.DataType) -> bool:
+    return pa.types.is_string(data_type) or pa.types.is_large_string(data_type)
+
+
+REQUIRED_COLUMNS: dict[str, Callable[[pa.DataType], bool]] = {
+    "order_id": pa.types.is_integer,
+    "customer_id": pa.types.is_integer,
+    "order_time": lambda t: pa.types.is_timestamp(t) or pa.types.is_date(t) or _is_text(t),
+    "status": _is_text,
+    "product_category": _is_text,
+    "total_amount": lambda t: (
+        pa.types.is_floating(t) or pa.types.is_decimal(t) or pa.types.is_integer(t)
+    ),
+}
+
+
 def _quoted(path: Path) -> str:
     return path.resolve().as_posix().replace("'", "''")
 
 
-def process_incremental_data() -> int:
-    """Validate incoming order Parquet files, add them to bronze, and rebuild derived layers."""
+def _inspect(source: Path) -> dict[str, int]:
+    """Validate a file against the bronze order schema using only its Parquet footer."""
+    metadata = pq.read_metadata(source)
+    schema = metadata.schema.to_arrow_schema()
+    missing = sorted(set(REQUIRED_COLUMNS) - set(schema.names))
+    if missing:
+        raise ValueError(f"{source.name} is missing columns: {missing}")
+    mistyped = [
+        f"{name} ({schema.field(name).type})"
+        for name, accepts in REQUIRED_COLUMNS.items()
+        if not accepts(schema.field(name).type)
+    ]
+    if mistyped:
+        raise ValueError(f"{source.name} has columns with unsupported types: {mistyped}")
+    return {"size": source.stat().st_size, "rows": metadata.num_rows}
+
+
+def _copy_batch(db: duckdb.DuckDBPyConnection, sources: list[Path], destination: Path) -> None:
+    """Copy a group of incoming files into one bronze file with a single multi-file COPY."""
+    # Not named *.parquet while it is written, so the bronze glob never sees a partial file.
+    temporary = destination.with_suffix(".parquet.tmp")
+    temporary.unlink(missing_ok=True)
+    files = ", ".join(f"'{_quoted(source)}'" for source in sources)
+    cursor = db.cursor()
+    try:
+        cursor.execute(
+            f"COPY (SELECT * FROM read_parquet([{files}], union_by_name = true)) "
+            f"TO '{_quoted(temporary)}' (FORMAT PARQUET, COMPRESSION ZSTD)"
+        )
+    finally:
+        cursor.close()
+    # A hard link never replaces an existing file, so bronze data cannot be overwritten.
+    try:
+        os.link(temporary, destination)
+    finally:
+        temporary.unlink(missing_ok=True)
+
+
+def _bronze_destination(batch: list[Path], run: str) -> Path:
+    """Name a batch's bronze file after the ingest run, which keeps names unique across runs."""
+    if len(batch) == 1:
+        return BRONZE / "orders" / f"incremental-{run}-{batch[0].stem}.parquet"
+    return BRONZE / "orders" / f"incremental-{run}-{batch[0].stem}-batch{len(batch)}.parquet"
+
+
+def _read_ledger() -> dict[str, dict]:
+    if not INGEST_LEDGER.exists():
+        return {}
+    return json.loads(INGEST_LEDGER.read_text(encoding="utf-8"))["files"]
+
+
+def _write_ledger(files: dict[str, dict]) -> None:
+    """Record the outcome of every incoming file seen so far."""
+    temporary = INGEST_LEDGER.with_suffix(".tmp.json")
+    temporary.write_text(json.dumps({"files": files}, indent=2), encoding="utf-8")
+    temporary.replace(INGEST_LEDGER)
+
+
+def _archive(source: Path, directory: Path) -> None:
+    archived = directory / source.name
+    archived.unlink(missing_ok=True)
+    shutil.move(str(source), archived)
+
+
+def process_incremental_data(
+    workers: int = INGEST_WORKERS,
+    batch_files: int = INGEST_BATCH_FILES,
+    storage: str | None = None,
+) -> int:
+    """Validate incoming order Parquet files, add them to bronze, and rebuild derived layers.
+
+    Files are validated from their footers and copied ``batch_files`` at a time into one
+    bronze file per batch, with up to ``workers`` batches in flight. Outcomes are kept in
+    the ingest ledger, so a rerun skips files that were already ingested. Once enough
+    small bronze files have accumulated they are compacted. ``storage`` overrides the
+    silver storage mode the pipeline recorded on its last build.
+    """
+    if workers < 1 or batch_files < 1:
+        raise ValueError("workers and batch_files must be positive")
     ensure_directories()
     files = sorted(INCOMING.glob("*.parquet"))
     if not files:
         logger.info("no_incremental_files directory=%s", INCOMING)
         return 0
 
-    destination_dir = BRONZE / "orders"
-    processed_dir = INCOMING / "processed"
+    ledger = _read_ledger()
+    started = datetime.now(UTC)
+    now = started.isoformat(timespec="seconds")
+    run = started.strftime("%Y%m%dT%H%M%S%f")
+    accepted: list[tuple[Path, dict[str, int]]] = []
+    rejected: list[Path] = []
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        inspections = {executor.submit(_inspect, source): source for source in files}
+        for future in as_completed(inspections):
+            source = inspections[future]
+            try:
+                accepted.append((source, future.result()))
+            except (ValueError, OSError, pa.ArrowException) as exc:
+                ledger[source.name] = {"status": "rejected", "error": str(exc), "at": now}
+                rejected.append(source)
+                logger.warning("rejected_incremental_file file=%s error=%s", source.name, exc)
+
+    pending: list[Path] = []
+    duplicates: list[Path] = []
+    for source, state in sorted(accepted):
+        entry = ledger.get(source.name, {})
+        if entry.get("status") == "ingested" and all(entry[k] == v for k, v in state.items()):
+            duplicates.append(source)
+        else:
+            ledger[source.name] = {"status": "pending", **state}
+            pending.append(source)
+
+    batches = [pending[i : i + batch_files] for i in range(0, len(pending), batch_files)]
+    ingested: list[Path] = []
     db = duckdb.connect()
     try:
-        for source in files:
-            columns = {
-                row[0]
-                for row in db.execute(
-                    f"DESCRIBE SELECT * FROM read_parquet('{_quoted(source)}')"
-                ).fetchall()
-            }
-            required = {
-                "order_id",
-                "customer_id",
-                "order_time",
-                "status",
-                "product_category",
-                "total_amount",
+        apply_limits(db, "pipeline")
+        with pipeline_running(), ThreadPoolExecutor(max_workers=workers) as executor:
+            copies = {
+                executor.submit(_copy_batch, db, batch, _bronze_destination(batch, run)): batch
+                for batch in batches
             }
-            missing = required - columns
-            if missing:
-                raise ValueError(f"{source.name} is missing columns: {sorted(missing)}")
-
-            destination = destination_dir / f"incremental-{source.stem}.parquet"
-            destination.unlink(missing_ok=True)
-            db.execute(
-                f"COPY (SELECT * FROM read_parquet('{_quoted(source)}')) "
-                f"TO '{_quoted(destination)}' (FORMAT PARQUET, COMPRESSION ZSTD)"
-            )
-            archived = processed_dir / source.name
-            archived.unlink(missing_ok=True)
-            shutil.move(str(source), archived)
-            logger.info("ingested_incremental_file file=%s", source.name)
+            for future in as_completed(copies):
+                batch = copies[future]
+                destination = _bronze_destination(batch, run)
+                try:
+                    future.result()
+                except (duckdb.Error, FileExistsError) as exc:
+                    # Left in incoming/ so the next run retries them.
+                    for source in batch:
+                        ledger[source.name].update(status="failed", error=str(exc), at=now)
+                    logger.error("failed_incremental_batch files=%s error=%s", len(batch), exc)
+                    continue
+                for source in batch:
+                    ledger[source.name].update(status="ingested", bronze=[destination.name], at=now)
+                ingested.extend(batch)
+                # Written per batch so a crash cannot lose track of files already in bronze.
+                _write_ledger(ledger)
+                logger.info(
+                    "ingested_incremental_batch files=%s destination=%s",
+                    len(batch),
+                    destination.name,
+                )
     finally:
         db.close()
+        _write_ledger(ledger)
+
+    for source in (*ingested, *duplicates):
+        _archive(source, INCOMING / "processed")
+    for source in rejected:
+        _archive(source, INCOMING / "rejected")
+    logger.info(
+        "incremental_ingest_complete ingested=%s skipped=%s rejected=%s failed=%s",
+        len(ingested),
+        len(duplicates),
+        len(rejected),
+        len(pending) - len(ingested),
+    )
 
-    run_pipeline()
-    return len(files)
+    if ingested or duplicates:
+        run_pipeline(incremental=True, storage=storage)
+        # Runs after the pipeline so only files already in the manifest are merged.
+        compact_bronze()
+    return len(ingested)
 
 
 def main() -> None:
     parser = argparse.ArgumentParser(description="Ingest Parquet files from incoming/")
-    parser.parse_args()
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=INGEST_WORKERS,
+        help="number of files validated and batches copied at the same time",
+    )
+    parser.add_argument(
+        "--batch-files",
+        type=int,
+        default=INGEST_BATCH_FILES,
+        help="incoming files combined into each bronze file; 1 keeps one bronze file per input",
+    )
+    parser.add_argument(
+        "--storage",
+        choices=("parquet", "table"),
+        help="silver storage mode for the pipeline run; defaults to the mode of the last build",
+    )
+    args = parser.parse_args()
     configure_logging()
-    process_incremental_data()
+    process_incremental_data(
+        workers=args.workers, batch_files=args.batch_files, storage=args.storage
+    )
 
 
 if __name__ == "__main__":
@@ -1,34 +1,167 @@
+import json
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
 from pathlib import Path
-from threading import Lock
+from time import perf_counter
 from typing import Any
 
-from app.catalog import connection
-from app.config import SQL_DIR
+import duckdb
+import pyarrow as pa
+
+from app.catalog import bind, register_datasets, silver_tables_stale, sync_silver_tables
+from app.config import POOL_SIZE, SQL_DIR, STREAM_BATCH_SIZE
+from app.metrics import QueryMetrics
+from app.pool import ConnectionPool
+from app.resources import pipeline_limits, pipeline_running
+from app.utils import logger
+
+
+@dataclass
+class _QueryRun:
+    """A report query's cursor and the number of rows it has delivered so far."""
+
+    cursor: duckdb.DuckDBPyConnection
+    rows: int = 0
+
+
+def _counted(reader: pa.RecordBatchReader, run: _QueryRun) -> Iterator[pa.RecordBatch]:
+    for batch in reader:
+        run.rows += batch.num_rows
+        yield batch
 
 
 class AnalyticsRepository:
-    def __init__(self) -> None:
-        self.db = connection()
-        self._lock = Lock()
+    def __init__(self, pool_size: int = POOL_SIZE) -> None:
+        self.pool = ConnectionPool(pool_size)
+        self.metrics = QueryMetrics()
 
     def execute_sql_file(
-        self, filename: str, parameters: dict[str, Any] | None = None
+        self,
+        filename: str,
+        parameters: dict[str, Any] | None = None,
+        relations: dict[str, pa.Table] | None = None,
     ) -> list[dict[str, Any]]:
-        sql_path = self._safe_sql_path(filename)
-        query = sql_path.read_text(encoding="utf-8")
-        with self._lock:
-            result = self.db.execute(query, parameters or {})
-            return result.fetch_arrow_table().to_pylist()
+        """Run a report SQL file, optionally shadowing views with in-memory Arrow tables."""
+        query = self._safe_sql_path(filename).read_text(encoding="utf-8")
+        with self._instrumented(filename, relations) as run:
+            result = run.cursor.execute(query, bind(query, parameters))
+            table = result.fetch_arrow_table()
+            run.rows = table.num_rows
+            return table.to_pylist()
+
+    @contextmanager
+    def stream_sql_file(
+        self,
+        filename: str,
+        parameters: dict[str, Any] | None = None,
+        relations: dict[str, pa.Table] | None = None,
+        as_json: bool = False,
+        batch_size: int = STREAM_BATCH_SIZE,
+    ) -> Iterator[pa.RecordBatchReader]:
+        """Yield a record batch reader over a report, holding a pooled cursor until exit.
+
+        With ``as_json=True`` DuckDB serializes each row to a JSON object in a single
+        ``json`` column.
+        """
+        query = self._safe_sql_path(filename).read_text(encoding="utf-8")
+        if as_json:
+            query = (
+                "SELECT CAST(to_json(report) AS VARCHAR) AS json "
+                f"FROM ({query.strip().rstrip(';')}) AS report"
+            )
+        with self._instrumented(filename, relations) as run:
+            reader = run.cursor.execute(query, bind(query, parameters)).fetch_record_batch(
+                batch_size
+            )
+            yield pa.RecordBatchReader.from_batches(reader.schema, _counted(reader, run))
 
     def scalar(self, query: str) -> Any:
-        with self._lock:
-            row = self.db.execute(query).fetchone()
+        with self.pool.acquire() as cursor:
+            row = cursor.execute(query).fetchone()
         if row is None:
             raise RuntimeError("DuckDB scalar query returned no rows")
         return row[0]
 
+    def refresh(self) -> None:
+        with self.pool.acquire() as cursor:
+            register_datasets(cursor)
+
+    def sync_silver_storage(self, storage: str) -> None:
+        """Load or drop native silver tables that a pipeline process could not reach.
+
+        Runs as a pipeline on the serving instance, so other serving processes yield
+        threads to it and it stays within the pipeline budget.
+        """
+        with self.pool.acquire() as cursor:
+            if not silver_tables_stale(cursor, storage):
+                return
+            started = perf_counter()
+            with pipeline_running(), pipeline_limits(cursor):
+                sync_silver_tables(cursor, storage)
+        logger.info(
+            "silver_storage_synced storage=%s duration_ms=%.2f",
+            storage,
+            (perf_counter() - started) * 1000,
+        )
+
+    def pool_stats(self) -> dict[str, Any]:
+        return self.pool.stats()
+
     def close(self) -> None:
-        self.db.close()
+        self.pool.close()
+
+    @contextmanager
+    def _instrumented(
+        self, filename: str, relations: dict[str, pa.Table] | None = None
+    ) -> Iterator[_QueryRun]:
+        """Borrow a cursor for a report and record its timings once the query finishes.
+
+        Failed queries are recorded too, with their duration but without row counts. The
+        query profile is collected when the pool profiles every query, or for a report
+        whose previous run was slow.
+        """
+        started = perf_counter()
+        waited = None
+        rows = None
+        profile = None
+        profiling = self.pool.profiling or self.metrics.wants_profile(filename)
+        try:
+            with self._cursor(relations, profiling) as cursor:
+                waited = perf_counter() - started
+                run = _QueryRun(cursor)
+                yield run
+                rows = run.rows
+                if profiling:
+                    profile = json.loads(cursor.get_profiling_information(format="json"))
+        finally:
+            seconds = perf_counter() - started
+            self.metrics.record(
+                filename, seconds, seconds if waited is None else waited, rows, profile
+            )
+
+    @contextmanager
+    def _cursor(
+        self, relations: dict[str, pa.Table] | None = None, profiling: bool = False
+    ) -> Iterator[duckdb.DuckDBPyConnection]:
+        """Borrow a cursor with ``relations`` registered, profiling it if asked to.
+
+        Profiling is a per-cursor setting, so a cursor the pool does not profile gets it
+        for this query only.
+        """
+        with self.pool.acquire() as cursor:
+            for name, table in (relations or {}).items():
+                cursor.register(name, table)
+            temporary = profiling and not self.pool.profiling
+            if temporary:
+                cursor.execute("PRAGMA enable_profiling = 'no_output'")
+            try:
+                yield cursor
+            finally:
+                if temporary:
+                    cursor.execute("PRAGMA disable_profiling")
+                for name in relations or {}:
+                    cursor.unregister(name)
 
     @staticmethod
     def _safe_sql_path(filename: str) -> Path:
@@ -0,0 +1,155 @@
+import os
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from threading import Lock
+from time import monotonic
+
+import duckdb
+
+from app.config import (
+    CPU_BUDGET,
+    MEMORY_BUDGET_MB,
+    PIPELINE_RUNS,
+    RESOURCE_POLL_SECONDS,
+    SERVING_SHARE,
+    TEMP_DIRECTORY,
+)
+from app.utils import logger
+
+_runs = 0
+_runs_lock = Lock()
+
+
+@dataclass(frozen=True)
+class ResourceLimits:
+    """DuckDB settings that bound one database instance's share of the budget."""
+
+    threads: int
+    memory_limit_mb: int
+    temp_directory: Path
+
+
+def limits(role: str, pipeline_active: bool = False) -> ResourceLimits:
+    """Return the limits for ``"serving"`` or ``"pipeline"`` instances.
+
+    Memory is split by ``SERVING_SHARE`` at all times, because a limit cannot be lowered
+    below what a running query already holds. Threads are split the same way while a
+    pipeline runs; otherwise serving gets all of them.
+    """
+    if role not in ("serving", "pipeline"):
+        raise ValueError("role must be 'serving' or 'pipeline'")
+    serving_threads = min(CPU_BUDGET - 1, round(CPU_BUDGET * SERVING_SHARE)) or 1
+    serving_memory = round(MEMORY_BUDGET_MB * SERVING_SHARE)
+    if role == "serving":
+        threads = serving_threads if pipeline_active else CPU_BUDGET
+        return ResourceLimits(threads, serving_memory, TEMP_DIRECTORY / "serving")
+    return ResourceLimits(
+        max(1, CPU_BUDGET - serving_threads),
+        MEMORY_BUDGET_MB - serving_memory,
+        TEMP_DIRECTORY / "pipeline",
+    )
+
+
+def apply_limits(conn: duckdb.DuckDBPyConnection, role: str) -> None:
+    """Apply a role's limits to the database instance behind a connection.
+
+    DuckDB settings are per instance, so pipelines run on in-memory instances of their
+    own rather than on the serving instance.
+    """
+    resource_limits = limits(role, role == "serving" and pipeline_active())
+    resource_limits.temp_directory.mkdir(parents=True, exist_ok=True)
+    conn.execute(f"SET threads = {resource_limits.threads}")
+    conn.execute(f"SET memory_limit = '{resource_limits.memory_limit_mb}MB'")
+    temp_directory = resource_limits.temp_directory.as_posix().replace("'", "''")
+    conn.execute(f"SET temp_directory = '{temp_directory}'")
+
+
+@contextmanager
+def pipeline_limits(conn: duckdb.DuckDBPyConnection) -> Iterator[None]:
+    """Apply pipeline limits for pipeline work that has to run on the serving instance.
+
+    Only work that writes the database file does this; serving limits are restored after.
+    """
+    apply_limits(conn, "pipeline")
+    try:
+        yield
+    finally:
+        apply_limits(conn, "serving")
+
+
+def _is_running(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def pipeline_active() -> bool:
+    """Return whether a pipeline is running in this or another process."""
+    if not PIPELINE_RUNS.exists():
+        return False
+    for marker in PIPELINE_RUNS.iterdir():
+        if not marker.name.isdigit():
+            continue
+        if _is_running(int(marker.name)):
+            return True
+        # Left behind by a pipeline process that was killed.
+        marker.unlink(missing_ok=True)
+    return False
+
+
+@contextmanager
+def pipeline_running() -> Iterator[None]:
+    """Mark this process as running a pipeline, so serving processes yield threads to it."""
+    global _runs
+    marker = PIPELINE_RUNS / str(os.getpid())
+    with _runs_lock:
+        _runs += 1
+        if _runs == 1:
+            PIPELINE_RUNS.mkdir(parents=True, exist_ok=True)
+            marker.touch()
+    try:
+        yield
+    finally:
+        with _runs_lock:
+            _runs -= 1
+            if _runs == 0:
+                marker.unlink(missing_ok=True)
+
+
+class ServingGovernor:
+    """Keep a serving instance's thread count in line with pipeline activity."""
+
+    def __init__(
+        self, db: duckdb.DuckDBPyConnection, poll_seconds: float = RESOURCE_POLL_SECONDS
+    ) -> None:
+        self.db = db
+        self.poll_seconds = poll_seconds
+        self.pipeline_active = pipeline_active()
+        self.threads = limits("serving", self.pipeline_active).threads
+        self._checked = monotonic()
+        self._lock = Lock()
+
+    def poll(self) -> None:
+        """Lower or restore serving threads when a pipeline starts or finishes."""
+        now = monotonic()
+        if now - self._checked < self.poll_seconds or not self._lock.acquire(blocking=False):
+            return
+        try:
+            self._checked = now
+            active = pipeline_active()
+            if active == self.pipeline_active:
+                return
+            self.pipeline_active = active
+            self.threads = limits("serving", active).threads
+            self.db.execute(f"SET threads = {self.threads}")
+            logger.info(
+                "serving_threads_adjusted threads=%s pipeline_active=%s", self.threads, active
+            )
+        finally:
+            self._lock.release()
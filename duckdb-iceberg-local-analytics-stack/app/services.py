@@ -1,50 +1,198 @@
-from functools import lru_cache
+from collections.abc import Iterator
+from threading import Lock, Thread
 from typing import Any
 
-from app.config import BRONZE_ORDERS_GLOB, SILVER_CUSTOMERS, SILVER_ORDERS
+import pyarrow as pa
+
+from app.cache import ParquetRowCounts, ResultCache, fingerprint, warehouse_version
+from app.config import (
+    BRONZE_ORDERS_GLOB,
+    LEGACY_SILVER_ORDERS,
+    PIN_GOLD_IN_MEMORY,
+    REPORT_FILTERS,
+    SERVE_FROM_GOLD,
+    SILVER_CUSTOMERS,
+    SILVER_ORDERS,
+    SILVER_ORDERS_PATHS,
+)
+from app.encoding import encode
+from app.gold import GOLD_TABLES, PinnedGold, is_fresh
+from app.media import NDJSON
+from app.metrics import render_gauges
+from app.pipeline import recorded_storage
 from app.repository import AnalyticsRepository
+from app.utils import logger
+
+REPORTS: dict[str, str] = {
+    "daily_revenue": "revenue.sql",
+    "top_customers": "customers.sql",
+    "monthly_growth": "growth.sql",
+    "retention": "retention.sql",
+}
 
 
 class AnalyticsService:
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        serve_from_gold: bool = SERVE_FROM_GOLD,
+        pin_gold: bool = PIN_GOLD_IN_MEMORY,
+    ) -> None:
         self.repo = AnalyticsRepository()
+        self.cache = ResultCache()
+        self.row_counts = ParquetRowCounts()
+        self.serve_from_gold = serve_from_gold
+        self.pinned = PinnedGold() if pin_gold else None
+        self._version = warehouse_version()
+        self._version_lock = Lock()
+        self._storage_lock = Lock()
+        self._storage_changed = False
+        self._storage_syncing = False
+
+    def daily_revenue(self, **filters: Any) -> list[dict[str, Any]]:
+        return self.report("daily_revenue", filters)
 
-    @lru_cache(maxsize=16)
-    def daily_revenue(self) -> list[dict[str, Any]]:
-        return self.repo.execute_sql_file("revenue.sql")
+    def top_customers(self, limit: int = 20, **filters: Any) -> list[dict[str, Any]]:
+        return self.report("top_customers", {**filters, "limit": limit})
 
-    @lru_cache(maxsize=16)
-    def top_customers(self, limit: int = 20) -> list[dict[str, Any]]:
-        return self.repo.execute_sql_file("customers.sql", {"limit": limit})
+    def monthly_growth(self, **filters: Any) -> list[dict[str, Any]]:
+        return self.report("monthly_growth", filters)
 
-    @lru_cache(maxsize=16)
-    def monthly_growth(self) -> list[dict[str, Any]]:
-        return self.repo.execute_sql_file("growth.sql")
+    def retention(self, **filters: Any) -> list[dict[str, Any]]:
+        return self.report("retention", filters)
 
-    @lru_cache(maxsize=16)
-    def retention(self) -> list[dict[str, Any]]:
-        return self.repo.execute_sql_file("retention.sql")
+    def stream_report(
+        self, report: str, media_type: str, parameters: dict[str, Any] | None = None
+    ) -> Iterator[bytes]:
+        """Encode a report straight from DuckDB record batches, bypassing the result cache."""
+        parameters = _with_filters(parameters)
+        self._follow_warehouse()
+        filename, relations = self._resolve(report, parameters)
+        with self.repo.stream_sql_file(
+            filename, parameters, relations, as_json=media_type == NDJSON
+        ) as reader:
+            yield from encode(reader, media_type)
 
     def health(self) -> dict[str, Any]:
-        bronze_files = len(list(BRONZE_ORDERS_GLOB.parent.glob(BRONZE_ORDERS_GLOB.name)))
+        """Report warehouse row counts from cached Parquet footers, without scanning data."""
+        _, orders = self.row_counts.count(SILVER_ORDERS_PATHS)
+        _, customers = self.row_counts.count((SILVER_CUSTOMERS,))
         return {
             "status": "healthy",
             "database": "duckdb",
             "warehouse": "available",
-            "bronze_parquet_files": bronze_files,
-            "orders": self.repo.scalar("SELECT COUNT(*) FROM silver_orders"),
-            "customers": self.repo.scalar("SELECT COUNT(*) FROM silver_customers"),
-            "silver_files_available": SILVER_ORDERS.exists() and SILVER_CUSTOMERS.exists(),
+            "bronze_parquet_files": len(fingerprint((BRONZE_ORDERS_GLOB.parent,))),
+            "orders": orders,
+            "customers": customers,
+            "silver_files_available": self.ready(),
+            "connection_pool": self.repo.pool_stats(),
+            "result_cache": self.cache.stats(),
         }
 
+    def ready(self) -> bool:
+        """Return whether the silver datasets that reports read from exist.
+
+        The single-file layout counts too; the catalog serves it until it is migrated.
+        """
+        orders = SILVER_ORDERS.exists() or LEGACY_SILVER_ORDERS.exists()
+        return orders and SILVER_CUSTOMERS.exists()
+
+    def refresh(self) -> None:
+        """Re-register the warehouse views after datasets were created or rebuilt."""
+        self.repo.refresh()
+        self.clear_cache()
+        self._sync_storage()
+
+    def pool_stats(self) -> dict[str, Any]:
+        return self.repo.pool_stats()
+
+    def metrics(self) -> str:
+        """Return query, connection pool, and result cache metrics for Prometheus."""
+        return (
+            self.repo.metrics.render()
+            + render_gauges("analytics_pool", self.repo.pool_stats())
+            + render_gauges("analytics_cache", self.cache.stats())
+        )
+
     def clear_cache(self) -> None:
-        self.daily_revenue.cache_clear()
-        self.top_customers.cache_clear()
-        self.monthly_growth.cache_clear()
-        self.retention.cache_clear()
+        self.cache.clear()
+        if self.pinned is not None:
+            self.pinned.clear()
 
     def close(self) -> None:
         self.repo.close()
 
+    def _follow_warehouse(self) -> None:
+        """Re-register the views once per warehouse version.
+
+        Pipelines in other processes cannot change this instance's views, which pick native
+        silver tables or Parquet files when they are registered.
+        """
+        version = warehouse_version()
+        if version == self._version:
+            return
+        with self._version_lock:
+            if version != self._version:
+                self.repo.refresh()
+                self._version = version
+                self._sync_storage()
+
+    def _sync_storage(self) -> None:
+        """Bring the native silver tables in line with the recorded storage mode.
+
+        A pipeline in another process cannot open the database file this process holds,
+        so it leaves the tables to the API. They are built in the background; until then
+        the silver views read Parquet.
+        """
+        with self._storage_lock:
+            self._storage_changed = True
+            if self._storage_syncing:
+                return
+            self._storage_syncing = True
+        Thread(target=self._run_storage_sync, name="silver-storage-sync", daemon=True).start()
+
+    def _run_storage_sync(self) -> None:
+        while True:
+            with self._storage_lock:
+                if not self._storage_changed:
+                    self._storage_syncing = False
+                    return
+                self._storage_changed = False
+            try:
+                self.repo.sync_silver_storage(recorded_storage())
+            except Exception:
+                logger.exception("silver_storage_sync_failed")
+
+    def _resolve(
+        self, report: str, parameters: dict[str, Any]
+    ) -> tuple[str, dict[str, pa.Table] | None]:
+        """Return the SQL file and pinned relations that answer a report."""
+        filename = REPORTS[report]
+        gold = GOLD_TABLES.get(filename) if self.serve_from_gold else None
+        active = {name for name in REPORT_FILTERS if parameters[name] is not None}
+        if gold is None or not active <= gold.filters or not is_fresh(gold):
+            return filename, None
+        relations = None
+        if self.pinned is not None:
+            relations = {gold.view: self.pinned.get(gold)}
+        return gold.sql_file, relations
+
+    def report(
+        self, report: str, parameters: dict[str, Any] | None = None
+    ) -> list[dict[str, Any]]:
+        """Return a report's rows from the result cache, computing them on a miss."""
+        parameters = _with_filters(parameters)
+        self._follow_warehouse()
+        filename, relations = self._resolve(report, parameters)
+        return self.cache.get_or_compute(
+            filename,
+            parameters,
+            lambda: self.repo.execute_sql_file(filename, parameters, relations),
+        )
+
+
+def _with_filters(parameters: dict[str, Any] | None) -> dict[str, Any]:
+    """Add every report filter that was not given, disabled, to a parameter set."""
+    return {**dict.fromkeys(REPORT_FILTERS), **(parameters or {})}
+
 
 RevenueService = AnalyticsService
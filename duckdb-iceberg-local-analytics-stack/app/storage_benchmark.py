@@ -0,0 +1,83 @@
+import argparse
+import json
+import statistics
+import tempfile
+from pathlib import Path
+from time import perf_counter
+
+import duckdb
+
+from app.catalog import bind, load_silver_tables, register_datasets
+from app.config import REPORT_FILTERS, SQL_DIR
+from app.pipeline import bootstrap
+from app.resources import apply_limits
+from app.utils import configure_logging, logger
+
+REPORT_FILES = ("revenue.sql", "customers.sql", "growth.sql", "retention.sql")
+
+
+def _time_reports(conn: duckdb.DuckDBPyConnection, repeat: int) -> dict[str, dict[str, float]]:
+    timings = {}
+    for filename in REPORT_FILES:
+        query = (SQL_DIR / filename).read_text(encoding="utf-8")
+        parameters = bind(query, {**dict.fromkeys(REPORT_FILTERS), "limit": 20})
+        conn.execute(query, parameters).fetchall()
+        samples = []
+        for _ in range(repeat):
+            started = perf_counter()
+            conn.execute(query, parameters).fetchall()
+            samples.append((perf_counter() - started) * 1000)
+        timings[filename] = {
+            "median_ms": round(statistics.median(samples), 3),
+            "min_ms": round(min(samples), 3),
+        }
+    return timings
+
+
+def run_benchmark(repeat: int = 20, customer_index: bool = False) -> dict[str, dict]:
+    """Time the report SQL files against Parquet views and against native silver tables.
+
+    Both modes run in a scratch database file, so ``analytics.duckdb`` is left untouched.
+    """
+    bootstrap()
+    with tempfile.TemporaryDirectory() as directory:
+        conn = duckdb.connect(str(Path(directory) / "benchmark.duckdb"))
+        try:
+            apply_limits(conn, "serving")
+            register_datasets(conn)
+            parquet = _time_reports(conn, repeat)
+            started = perf_counter()
+            load_silver_tables(conn, customer_index=customer_index)
+            load_seconds = perf_counter() - started
+            table = _time_reports(conn, repeat)
+        finally:
+            conn.close()
+    results = {
+        filename: {
+            "parquet": parquet[filename],
+            "table": table[filename],
+            "speedup": round(parquet[filename]["median_ms"] / table[filename]["median_ms"], 2),
+        }
+        for filename in REPORT_FILES
+    }
+    logger.info("storage_benchmark_complete repeat=%s load_seconds=%.3f", repeat, load_seconds)
+    return {"load_seconds": round(load_seconds, 3), "reports": results}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Compare report latency on Parquet views and native silver tables"
+    )
+    parser.add_argument("--repeat", type=int, default=20, help="timed runs per report")
+    parser.add_argument(
+        "--customer-index",
+        action="store_true",
+        help="also build the ART index on silver orders customer_id",
+    )
+    args = parser.parse_args()
+    configure_logging()
+    print(json.dumps(run_benchmark(args.repeat, args.customer_index), indent=2))
+
+
+if __name__ == "__main__":
+    main()
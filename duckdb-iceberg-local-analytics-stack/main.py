@@ -1,20 +1,79 @@
-from contextlib import asynccontextmanager
-from typing import Annotated
-
-from fastapi import FastAPI, Query, Request
-
-from app.pipeline import bootstrap
-from app.services import AnalyticsService
-from app.utils import configure_logging
+import asyncio
+from contextlib import asynccontextmanager, suppress
+from datetime import date
+from typing import TYPE_CHECKING, Annotated, Any
+
+from fastapi import Depends, FastAPI, Header, HTTPException, Query, Request
+from fastapi.responses import JSONResponse, PlainTextResponse, StreamingResponse
+
+from app.config import (
+    FAST_START,
+    HEALTH_TIMEOUT_SECONDS,
+    OPERATIONS_WORKERS,
+    QUERY_TIMEOUT_SECONDS,
+)
+from app.executor import QueryExecutor
+from app.media import negotiate
+from app.pool import QueryCancelled
+from app.utils import configure_logging, logger
+
+if TYPE_CHECKING:
+    from app.services import AnalyticsService
+
+
+def start_analytics(app: FastAPI) -> None:
+    """Open the analytics service, then bootstrap any missing warehouse layers.
+
+    The service is published before bootstrapping, so requests are served from the silver
+    and gold data that already exist while the pipeline runs.
+    """
+    # Imported here so the server starts without loading pyarrow and the pipeline modules.
+    from app.config import ensure_directories
+    from app.pipeline import bootstrap
+    from app.services import AnalyticsService
+
+    try:
+        # The database file's directory must exist before the service connects to it.
+        ensure_directories()
+        analytics = AnalyticsService()
+        app.state.analytics = analytics
+        app.state.ready = analytics.ready()
+        bootstrap()
+        analytics.refresh()
+    except Exception:
+        logger.exception("analytics_bootstrap_failed")
+        raise
+    app.state.ready = analytics.ready()
+    logger.info("analytics_ready ready=%s", app.state.ready)
+
+
+def _log_startup_failure(task: "asyncio.Task[None]") -> None:
+    """Log a failed background startup as soon as it fails, not only at shutdown."""
+    if task.cancelled():
+        logger.warning("analytics_startup_cancelled")
+    elif task.exception() is not None:
+        logger.error("analytics_startup_failed error=%r", task.exception())
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     configure_logging()
-    bootstrap()
-    app.state.analytics = AnalyticsService()
+    app.state.analytics = None
+    app.state.ready = False
+    app.state.queries = QueryExecutor()
+    app.state.operations = QueryExecutor(OPERATIONS_WORKERS, HEALTH_TIMEOUT_SECONDS)
+    startup = asyncio.create_task(asyncio.to_thread(start_analytics, app))
+    startup.add_done_callback(_log_startup_failure)
+    if not FAST_START:
+        await startup
     yield
-    app.state.analytics.close()
+    # A running bootstrap cannot be interrupted; let it finish writing the warehouse.
+    with suppress(Exception):
+        await startup
+    app.state.queries.shutdown()
+    app.state.operations.shutdown()
+    if app.state.analytics is not None:
+        app.state.analytics.close()
 
 
 app = FastAPI(
@@ -25,36 +84,117 @@ app = FastAPI(
 )
 
 
-def service(request: Request) -> AnalyticsService:
+@app.exception_handler(TimeoutError)
+async def query_timeout(request: Request, exc: TimeoutError):
+    return JSONResponse({"detail": "query timed out"}, status_code=504)
+
+
+@app.exception_handler(QueryCancelled)
+async def query_cancelled(request: Request, exc: QueryCancelled):
+    return JSONResponse({"detail": "query cancelled"}, status_code=499)
+
+
+def service(request: Request) -> "AnalyticsService":
+    if not request.app.state.ready:
+        raise HTTPException(503, "analytics data is still loading", headers={"Retry-After": "5"})
     return request.app.state.analytics
 
 
+def request_timeout(
+    x_query_timeout: Annotated[float | None, Header(gt=0, le=QUERY_TIMEOUT_SECONDS)] = None,
+) -> float:
+    """Per-request query deadline in seconds, from the optional X-Query-Timeout header."""
+    return x_query_timeout or QUERY_TIMEOUT_SECONDS
+
+
+Timeout = Annotated[float, Depends(request_timeout)]
+
+
+def report_filters(
+    start: Annotated[date | None, Query(description="first order date to include")] = None,
+    end: Annotated[date | None, Query(description="last order date to include")] = None,
+    region: Annotated[str | None, Query(max_length=64)] = None,
+    segment: Annotated[str | None, Query(max_length=64)] = None,
+) -> dict[str, Any]:
+    """Optional report filters, bound as SQL parameters and part of the cache key."""
+    if start is not None and end is not None and start > end:
+        raise HTTPException(422, "start must not be after end")
+    return {"start": start, "end": end, "region": region, "segment": segment}
+
+
+Filters = Annotated[dict[str, Any], Depends(report_filters)]
+
+
+async def run_report(
+    request: Request, timeout: float, name: str, parameters: dict[str, Any] | None = None
+):
+    """Run a report on the query executor, streaming it when the Accept header asks for it."""
+    queries: QueryExecutor = request.app.state.queries
+    media_type = negotiate(request.headers.get("accept"))
+    if media_type is not None:
+        chunks = service(request).stream_report(name, media_type, parameters)
+        return StreamingResponse(queries.stream(chunks, timeout), media_type=media_type)
+    return await queries.run(
+        service(request).report,
+        name,
+        parameters,
+        timeout=timeout,
+        is_disconnected=request.is_disconnected,
+    )
+
+
 @app.get("/health", tags=["operations"])
-def health(request: Request):
-    return service(request).health()
+async def health(request: Request):
+    return await request.app.state.operations.run(service(request).health)
+
+
+@app.get("/health/live", tags=["operations"])
+async def live():
+    return {"status": "alive"}
+
+
+@app.get("/health/ready", tags=["operations"])
+async def ready(request: Request):
+    if not request.app.state.ready:
+        return JSONResponse({"status": "not_ready"}, status_code=503)
+    return {"status": "ready"}
+
+
+@app.get("/health/pool", tags=["operations"])
+async def pool(request: Request):
+    return service(request).pool_stats()
+
+
+@app.get("/metrics", tags=["operations"], response_class=PlainTextResponse)
+async def metrics(request: Request):
+    return PlainTextResponse(
+        service(request).metrics(), media_type="text/plain; version=0.0.4"
+    )
 
 
 @app.get("/analytics/revenue", tags=["analytics"])
-def revenue(request: Request):
-    return service(request).daily_revenue()
+async def revenue(request: Request, timeout: Timeout, filters: Filters):
+    return await run_report(request, timeout, "daily_revenue", filters)
 
 
 @app.get("/analytics/top-customers", tags=["analytics"])
-def customers(
+async def customers(
     request: Request,
+    timeout: Timeout,
+    filters: Filters,
     limit: Annotated[int, Query(ge=1, le=100)] = 20,
 ):
-    return service(request).top_customers(limit)
+    return await run_report(request, timeout, "top_customers", {**filters, "limit": limit})
 
 
 @app.get("/analytics/monthly-growth", tags=["analytics"])
-def monthly_growth(request: Request):
-    return service(request).monthly_growth()
+async def monthly_growth(request: Request, timeout: Timeout, filters: Filters):
+    return await run_report(request, timeout, "monthly_growth", filters)
 
 
 @app.get("/analytics/retention", tags=["analytics"])
-def retention(request: Request):
-    return service(request).retention()
+async def retention(request: Request, timeout: Timeout, filters: Filters):
+    return await run_report(request, timeout, "retention", filters)
 
 
 if __name__ == "__main__":
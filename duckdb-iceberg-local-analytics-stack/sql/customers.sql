@@ -5,6 +5,11 @@ WITH customer_revenue AS (
         ROUND(SUM(total_amount), 2) AS revenue,
         MAX(order_date) AS last_order_date
     FROM silver_orders
+    -- order_month prunes whole partition files; order_date prunes row groups.
+    WHERE ($start IS NULL OR order_month >= DATE_TRUNC('month', CAST($start AS DATE)))
+      AND ($end IS NULL OR order_month <= CAST($end AS DATE))
+      AND ($start IS NULL OR order_date >= CAST($start AS DATE))
+      AND ($end IS NULL OR order_date <= CAST($end AS DATE))
     GROUP BY customer_id
 )
 SELECT
@@ -17,5 +22,7 @@ SELECT
     revenue.last_order_date
 FROM customer_revenue AS revenue
 JOIN silver_customers AS customers USING (customer_id)
+WHERE ($region IS NULL OR customers.region = $region)
+  AND ($segment IS NULL OR customers.segment = $segment)
 ORDER BY revenue.revenue DESC
 LIMIT $limit;
@@ -0,0 +1,10 @@
+WITH monthly_activity AS (
+    SELECT cohort_month, UNNEST(active_months) AS activity_month
+    FROM gold_customer_cohorts
+)
+SELECT
+    cohort_month,
+    DATE_DIFF('month', cohort_month, activity_month) AS month_number,
+    COUNT(*) AS active_customers
+FROM monthly_activity
+GROUP BY cohort_month, month_number;
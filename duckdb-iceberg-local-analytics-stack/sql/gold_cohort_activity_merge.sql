@@ -0,0 +1,49 @@
+-- Only customers with new orders are recomputed: their previous cells are subtracted
+-- from the matrix and the cells of their merged activity are added back.
+WITH delta AS (
+    SELECT customer_id, LIST(DISTINCT DATE_TRUNC('month', order_date)) AS active_months
+    FROM silver_orders_delta
+    GROUP BY customer_id
+),
+previous AS (
+    SELECT state.customer_id, state.active_months
+    FROM gold_customer_cohorts AS state
+    SEMI JOIN delta ON state.customer_id = delta.customer_id
+),
+updated AS (
+    SELECT
+        delta.customer_id,
+        LIST_SORT(LIST_DISTINCT(LIST_CONCAT(previous.active_months, delta.active_months)))
+            AS active_months
+    FROM delta
+    LEFT JOIN previous ON previous.customer_id = delta.customer_id
+),
+changes AS (
+    SELECT active_months[1] AS cohort_month, UNNEST(active_months) AS activity_month, -1 AS change
+    FROM previous
+    UNION ALL
+    SELECT active_months[1] AS cohort_month, UNNEST(active_months) AS activity_month, 1 AS change
+    FROM updated
+),
+matrix_delta AS (
+    SELECT
+        cohort_month,
+        DATE_DIFF('month', cohort_month, activity_month) AS month_number,
+        SUM(change) AS change
+    FROM changes
+    GROUP BY cohort_month, month_number
+),
+merged AS (
+    SELECT
+        COALESCE(gold.cohort_month, matrix_delta.cohort_month) AS cohort_month,
+        COALESCE(gold.month_number, matrix_delta.month_number) AS month_number,
+        CAST(COALESCE(gold.active_customers, 0) + COALESCE(matrix_delta.change, 0) AS BIGINT)
+            AS active_customers
+    FROM gold_cohort_activity AS gold
+    FULL OUTER JOIN matrix_delta
+        ON gold.cohort_month = matrix_delta.cohort_month
+        AND gold.month_number = matrix_delta.month_number
+)
+SELECT cohort_month, month_number, active_customers
+FROM merged
+WHERE active_customers > 0;
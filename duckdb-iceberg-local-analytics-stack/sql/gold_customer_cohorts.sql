@@ -0,0 +1,11 @@
+WITH monthly_activity AS (
+    SELECT DISTINCT customer_id, DATE_TRUNC('month', order_date) AS activity_month
+    FROM silver_orders
+)
+SELECT
+    customer_id,
+    MIN(activity_month) AS cohort_month,
+    MAX(activity_month) AS last_active_month,
+    LIST(activity_month ORDER BY activity_month) AS active_months
+FROM monthly_activity
+GROUP BY customer_id;
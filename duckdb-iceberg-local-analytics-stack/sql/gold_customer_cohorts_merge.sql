@@ -0,0 +1,19 @@
+WITH delta AS (
+    SELECT customer_id, LIST(DISTINCT DATE_TRUNC('month', order_date)) AS active_months
+    FROM silver_orders_delta
+    GROUP BY customer_id
+),
+merged AS (
+    SELECT
+        COALESCE(state.customer_id, delta.customer_id) AS customer_id,
+        LIST_SORT(LIST_DISTINCT(LIST_CONCAT(state.active_months, delta.active_months)))
+            AS active_months
+    FROM gold_customer_cohorts AS state
+    FULL OUTER JOIN delta ON state.customer_id = delta.customer_id
+)
+SELECT
+    customer_id,
+    active_months[1] AS cohort_month,
+    active_months[-1] AS last_active_month,
+    active_months
+FROM merged;
@@ -0,0 +1,19 @@
+WITH delta AS (
+    SELECT
+        customer_id,
+        COUNT(*) AS lifetime_orders,
+        SUM(total_amount) AS lifetime_revenue,
+        MIN(order_date) AS first_order_date,
+        MAX(order_date) AS last_order_date
+    FROM silver_orders_delta
+    GROUP BY customer_id
+)
+SELECT
+    COALESCE(gold.customer_id, delta.customer_id) AS customer_id,
+    COALESCE(gold.lifetime_orders, 0) + COALESCE(delta.lifetime_orders, 0) AS lifetime_orders,
+    ROUND(COALESCE(gold.lifetime_revenue, 0) + COALESCE(delta.lifetime_revenue, 0), 2)
+        AS lifetime_revenue,
+    LEAST(gold.first_order_date, delta.first_order_date) AS first_order_date,
+    GREATEST(gold.last_order_date, delta.last_order_date) AS last_order_date
+FROM gold_customer_summary AS gold
+FULL OUTER JOIN delta ON gold.customer_id = delta.customer_id;
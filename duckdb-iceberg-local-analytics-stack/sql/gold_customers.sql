@@ -0,0 +1,14 @@
+SELECT
+    summary.customer_id,
+    customers.customer_name,
+    customers.region,
+    customers.segment,
+    summary.lifetime_orders AS orders,
+    summary.lifetime_revenue AS revenue,
+    summary.last_order_date
+FROM gold_customer_summary AS summary
+JOIN silver_customers AS customers USING (customer_id)
+WHERE ($region IS NULL OR customers.region = $region)
+  AND ($segment IS NULL OR customers.segment = $segment)
+ORDER BY summary.lifetime_revenue DESC
+LIMIT $limit;
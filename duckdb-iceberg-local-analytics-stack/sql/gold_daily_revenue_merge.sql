@@ -0,0 +1,23 @@
+WITH delta AS (
+    SELECT
+        order_date,
+        SUM(total_amount) AS revenue,
+        COUNT(*) AS orders
+    FROM silver_orders_delta
+    GROUP BY order_date
+),
+merged AS (
+    SELECT
+        COALESCE(gold.order_date, delta.order_date) AS order_date,
+        COALESCE(gold.revenue, 0) + COALESCE(delta.revenue, 0) AS revenue,
+        COALESCE(gold.orders, 0) + COALESCE(delta.orders, 0) AS orders
+    FROM gold_daily_revenue AS gold
+    FULL OUTER JOIN delta ON gold.order_date = delta.order_date
+)
+SELECT
+    order_date,
+    ROUND(revenue, 2) AS revenue,
+    orders,
+    ROUND(CAST(revenue AS DOUBLE) / orders, 2) AS average_order_value
+FROM merged
+ORDER BY order_date;
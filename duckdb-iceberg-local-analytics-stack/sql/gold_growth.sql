@@ -0,0 +1,7 @@
+SELECT
+    month,
+    revenue,
+    orders,
+    growth_percent
+FROM gold_monthly_growth
+ORDER BY month;
@@ -0,0 +1,31 @@
+WITH delta AS (
+    SELECT
+        DATE_TRUNC('month', order_date) AS month,
+        SUM(total_amount) AS revenue,
+        COUNT(*) AS orders
+    FROM silver_orders_delta
+    GROUP BY month
+),
+monthly AS (
+    SELECT
+        COALESCE(gold.month, delta.month) AS month,
+        ROUND(COALESCE(gold.revenue, 0) + COALESCE(delta.revenue, 0), 2) AS revenue,
+        COALESCE(gold.orders, 0) + COALESCE(delta.orders, 0) AS orders
+    FROM gold_monthly_growth AS gold
+    FULL OUTER JOIN delta ON gold.month = delta.month
+),
+with_previous AS (
+    SELECT
+        month,
+        revenue,
+        orders,
+        LAG(revenue) OVER (ORDER BY month) AS previous_revenue
+    FROM monthly
+)
+SELECT
+    month,
+    revenue,
+    orders,
+    ROUND(100.0 * (revenue - previous_revenue) / NULLIF(previous_revenue, 0), 2) AS growth_percent
+FROM with_previous
+ORDER BY month;
@@ -0,0 +1,11 @@
+SELECT
+    activity.cohort_month,
+    activity.month_number,
+    sizes.active_customers AS cohort_size,
+    activity.active_customers,
+    ROUND(100.0 * activity.active_customers / sizes.active_customers, 2) AS retention_percent
+FROM gold_cohort_activity AS activity
+JOIN gold_cohort_activity AS sizes
+    ON sizes.cohort_month = activity.cohort_month
+    AND sizes.month_number = 0
+ORDER BY activity.cohort_month, activity.month_number;
@@ -0,0 +1,9 @@
+SELECT
+    order_date,
+    revenue,
+    orders,
+    average_order_value
+FROM gold_daily_revenue
+WHERE ($start IS NULL OR order_date >= CAST($start AS DATE))
+  AND ($end IS NULL OR order_date <= CAST($end AS DATE))
+ORDER BY order_date;
@@ -4,6 +4,20 @@ WITH monthly AS (
         ROUND(SUM(total_amount), 2) AS revenue,
         COUNT(*) AS orders
     FROM silver_orders
+    -- order_month prunes whole partition files; order_date prunes row groups.
+    WHERE ($start IS NULL OR order_month >= DATE_TRUNC('month', CAST($start AS DATE)))
+      AND ($end IS NULL OR order_month <= CAST($end AS DATE))
+      AND ($start IS NULL OR order_date >= CAST($start AS DATE))
+      AND ($end IS NULL OR order_date <= CAST($end AS DATE))
+      AND (
+          ($region IS NULL AND $segment IS NULL)
+          OR customer_id IN (
+              SELECT customer_id
+              FROM silver_customers
+              WHERE ($region IS NULL OR region = $region)
+                AND ($segment IS NULL OR segment = $segment)
+          )
+      )
     GROUP BY month
 ),
 with_previous AS (
@@ -1,11 +1,29 @@
-WITH first_orders AS (
-    SELECT customer_id, DATE_TRUNC('month', MIN(order_date)) AS cohort_month
+WITH orders AS (
+    SELECT customer_id, order_date
     FROM silver_orders
+    -- order_month prunes whole partition files; order_date prunes row groups.
+    WHERE ($start IS NULL OR order_month >= DATE_TRUNC('month', CAST($start AS DATE)))
+      AND ($end IS NULL OR order_month <= CAST($end AS DATE))
+      AND ($start IS NULL OR order_date >= CAST($start AS DATE))
+      AND ($end IS NULL OR order_date <= CAST($end AS DATE))
+      AND (
+          ($region IS NULL AND $segment IS NULL)
+          OR customer_id IN (
+              SELECT customer_id
+              FROM silver_customers
+              WHERE ($region IS NULL OR region = $region)
+                AND ($segment IS NULL OR segment = $segment)
+          )
+      )
+),
+first_orders AS (
+    SELECT customer_id, DATE_TRUNC('month', MIN(order_date)) AS cohort_month
+    FROM orders
     GROUP BY customer_id
 ),
 monthly_activity AS (
     SELECT DISTINCT customer_id, DATE_TRUNC('month', order_date) AS activity_month
-    FROM silver_orders
+    FROM orders
 ),
 cohort_activity AS (
     SELECT
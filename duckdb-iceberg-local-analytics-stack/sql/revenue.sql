@@ -2,7 +2,23 @@ SELECT
     order_date,
     ROUND(SUM(total_amount), 2) AS revenue,
     COUNT(*) AS orders,
-    ROUND(AVG(total_amount), 2) AS average_order_value
+    -- Computed from revenue and orders exactly like gold_daily_revenue_merge.sql, so an
+    -- incrementally merged gold table matches a full rebuild.
+    ROUND(CAST(SUM(total_amount) AS DOUBLE) / COUNT(*), 2) AS average_order_value
 FROM silver_orders
+-- order_month prunes whole partition files; order_date prunes row groups.
+WHERE ($start IS NULL OR order_month >= DATE_TRUNC('month', CAST($start AS DATE)))
+  AND ($end IS NULL OR order_month <= CAST($end AS DATE))
+  AND ($start IS NULL OR order_date >= CAST($start AS DATE))
+  AND ($end IS NULL OR order_date <= CAST($end AS DATE))
+  AND (
+      ($region IS NULL AND $segment IS NULL)
+      OR customer_id IN (
+          SELECT customer_id
+          FROM silver_customers
+          WHERE ($region IS NULL OR region = $region)
+            AND ($segment IS NULL OR segment = $segment)
+      )
+  )
 GROUP BY order_date
 ORDER BY order_date;
@@ -0,0 +1,8 @@
+SELECT
+    CAST(customer_id AS BIGINT) AS customer_id,
+    customer_name,
+    region,
+    segment,
+    CAST(signup_date AS DATE) AS signup_date
+FROM bronze_customers
+WHERE customer_id IS NOT NULL
@@ -0,0 +1,21 @@
+import os
+import shutil
+import tempfile
+
+import pytest
+
+# app.config reads the data root on import, so point it at a scratch warehouse first.
+os.environ["ANALYTICS_DATA_ROOT"] = tempfile.mkdtemp(prefix="analytics-tests-")
+
+
+@pytest.fixture
+def empty_warehouse():
+    """Start a test from an empty data root."""
+    from app.config import DATA_ROOT, ensure_directories
+
+    for path in DATA_ROOT.iterdir():
+        if path.is_dir() and not path.is_symlink():
+            shutil.rmtree(path)
+        else:
+            path.unlink()
+    ensure_directories()
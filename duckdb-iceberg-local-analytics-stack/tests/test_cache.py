@@ -0,0 +1,76 @@
+import pytest
+
+from app import cache
+from app.cache import ResultCache
+
+
+def computed(value):
+    calls = []
+
+    def compute():
+        calls.append(value)
+        return value
+
+    return compute, calls
+
+
+def test_hits_until_the_ttl_expires(monkeypatch):
+    clock = [100.0]
+    monkeypatch.setattr(cache, "monotonic", lambda: clock[0])
+    results = ResultCache(ttl_seconds=10)
+    compute, calls = computed([{"revenue": 1}])
+
+    results.get_or_compute("revenue.sql", {"region": None}, compute)
+    clock[0] += 9
+    results.get_or_compute("revenue.sql", {"region": None}, compute)
+    assert len(calls) == 1
+
+    clock[0] += 2
+    results.get_or_compute("revenue.sql", {"region": None}, compute)
+    assert len(calls) == 2
+    assert results.stats()["hits"] == 1
+    assert results.stats()["misses"] == 2
+
+
+def test_evicts_the_least_recently_used_entry():
+    results = ResultCache(max_entries=2)
+    for name in ("a", "b"):
+        results.get_or_compute(name, None, lambda: [name])
+    results.get_or_compute("a", None, lambda: pytest.fail("a should be cached"))
+    results.get_or_compute("c", None, lambda: ["c"])
+
+    compute, calls = computed(["b"])
+    results.get_or_compute("b", None, compute)
+    assert calls == [["b"]]
+    assert results.stats()["evictions"] == 2
+
+
+def test_evicts_until_results_fit_the_byte_budget():
+    value = [{"day": index, "revenue": index * 1.5} for index in range(20)]
+    size = cache._sizeof(value)
+    results = ResultCache(max_bytes=size * 2 + size // 2)
+    for name in ("a", "b", "c"):
+        results.get_or_compute(name, None, lambda: list(value))
+
+    stats = results.stats()
+    assert stats["entries"] == 2
+    assert stats["bytes"] <= stats["max_bytes"]
+    assert stats["evictions"] == 1
+
+
+def test_results_larger_than_the_budget_are_not_cached():
+    results = ResultCache(max_bytes=64)
+    compute, calls = computed(list(range(100)))
+    results.get_or_compute("large", None, compute)
+    results.get_or_compute("large", None, compute)
+    assert len(calls) == 2
+    assert results.stats()["entries"] == 0
+
+
+def test_a_warehouse_change_invalidates_results():
+    results = ResultCache()
+    compute, calls = computed([1])
+    results.get_or_compute("revenue.sql", None, compute)
+    cache.notify_warehouse_changed()
+    results.get_or_compute("revenue.sql", None, compute)
+    assert len(calls) == 2
@@ -0,0 +1,30 @@
+import pytest
+
+from app.media import ARROW_STREAM, NDJSON, PARQUET, negotiate
+
+
+@pytest.mark.parametrize(
+    ("accept", "expected"),
+    [
+        (None, None),
+        ("", None),
+        ("application/json", None),
+        ("*/*", None),
+        (ARROW_STREAM, ARROW_STREAM),
+        ("application/x-parquet", PARQUET),
+        ("application/jsonl", NDJSON),
+        ("Application/X-NDJSON", NDJSON),
+        # The first acceptable type wins at equal quality.
+        (f"application/json, {PARQUET}", None),
+        (f"{PARQUET}, application/json", PARQUET),
+        # Quality values order the candidates.
+        (f"application/json;q=0.5, {ARROW_STREAM}", ARROW_STREAM),
+        (f"{ARROW_STREAM};q=0.2, {NDJSON};q=0.8", NDJSON),
+        # q=0 and malformed q values rule a type out.
+        (f"{PARQUET};q=0, text/csv", None),
+        (f"{PARQUET};q=high, {NDJSON}", NDJSON),
+        ("text/csv", None),
+    ],
+)
+def test_negotiate(accept, expected):
+    assert negotiate(accept) == expected
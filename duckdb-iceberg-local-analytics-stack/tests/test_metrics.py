@@ -0,0 +1,59 @@
+import json
+
+from app.config import REPORT_FILTERS
+from app.data_generator import generate_data
+from app.metrics import QueryMetrics
+from app.pipeline import run_pipeline
+from app.repository import AnalyticsRepository
+
+
+def slow_log_entries(path) -> list[dict]:
+    if not path.exists():
+        return []
+    return [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+
+
+def test_slow_reports_are_profiled_on_their_next_run(tmp_path):
+    log = tmp_path / "slow.jsonl"
+    metrics = QueryMetrics(slow_seconds=1.0, slow_log=log)
+    profile = {"cumulative_rows_scanned": 500, "total_bytes_read": 4096}
+
+    metrics.record("revenue.sql", 0.1, 0.0, 10, None)
+    assert not metrics.wants_profile("revenue.sql")
+    metrics.record("revenue.sql", 2.0, 0.0, 10, None)
+    assert metrics.wants_profile("revenue.sql")
+    assert slow_log_entries(log) == []
+
+    metrics.record("revenue.sql", 2.0, 0.5, 10, profile)
+    [entry] = slow_log_entries(log)
+    assert entry["rows_scanned"] == 500
+    assert entry["bytes_read"] == 4096
+    assert entry["pool_wait_seconds"] == 0.5
+    assert not metrics.wants_profile("revenue.sql")
+    assert 'analytics_slow_queries_total{query="revenue.sql"} 2' in metrics.render()
+
+
+def test_repository_profiles_only_after_a_slow_run(empty_warehouse, tmp_path):
+    generate_data(order_count=3_000, customer_count=100)
+    run_pipeline()
+    log = tmp_path / "slow.jsonl"
+    repo = AnalyticsRepository(pool_size=1)
+    repo.metrics = QueryMetrics(slow_seconds=0, slow_log=log)
+    try:
+        repo.refresh()
+        filters = dict.fromkeys(REPORT_FILTERS)
+        repo.execute_sql_file("revenue.sql", filters)
+        assert slow_log_entries(log) == []
+
+        with repo.stream_sql_file("revenue.sql", filters) as reader:
+            reader.read_all()
+        [entry] = slow_log_entries(log)
+        assert entry["query"] == "revenue.sql"
+        assert entry["rows_scanned"] > 0
+        assert entry["bytes_read"] is not None
+        assert entry["profile"]["children"]
+        # Profiling was switched on for that run only.
+        with repo.pool.acquire() as cursor:
+            assert cursor.execute("SELECT current_setting('enable_profiling')").fetchone() == (None,)
+    finally:
+        repo.close()
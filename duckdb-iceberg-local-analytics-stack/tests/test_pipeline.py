@@ -0,0 +1,164 @@
+import json
+import shutil
+
+import duckdb
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from app import pipeline
+from app.config import BRONZE, INCOMING, INGEST_LEDGER, PIPELINE_MANIFEST, SILVER_ORDERS_GLOB
+from app.data_generator import generate_data
+from app.pipeline import (
+    COMPACTION_JOURNAL,
+    COMPACTION_STAGING,
+    GOLD_MERGES,
+    compact_bronze,
+    run_pipeline,
+)
+from app.process_incremental_data import process_incremental_data
+
+
+def drop_orders(name: str, first_order_id: int, rows: int = 100) -> None:
+    """Deliver ``rows`` new orders to incoming/, copied from generated bronze rows."""
+    source = pq.read_table(sorted((BRONZE / "orders").glob("generated-*.parquet"))[0])
+    orders = source.slice(first_order_id % (source.num_rows - rows), rows)
+    order_ids = pa.array(range(first_order_id, first_order_id + rows), pa.int64())
+    pq.write_table(orders.set_column(0, "order_id", order_ids), INCOMING / f"{name}.parquet")
+
+
+def read_ledger() -> dict[str, dict]:
+    return json.loads(INGEST_LEDGER.read_text(encoding="utf-8"))["files"]
+
+
+def silver_order_ids() -> set[int]:
+    db = duckdb.connect()
+    try:
+        rows = db.execute(f"SELECT order_id FROM read_parquet('{SILVER_ORDERS_GLOB}')").fetchall()
+    finally:
+        db.close()
+    return {order_id for (order_id,) in rows}
+
+
+def gold_rows() -> dict[str, list[dict]]:
+    rows = {}
+    for node in GOLD_MERGES:
+        table = pq.read_table(node.destination)
+        rows[node.name] = sorted(table.to_pylist(), key=repr)
+    return rows
+
+
+def test_incremental_merge_matches_full_rebuild(empty_warehouse):
+    generate_data(order_count=3_000, customer_count=100)
+    run_pipeline()
+    for batch in range(3):
+        drop_orders(f"drop-{batch}", 1_000_000 + batch * 1_000)
+        assert process_incremental_data() == 1
+
+    merged = gold_rows()
+    run_pipeline(force=True)
+    assert gold_rows() == merged
+
+
+
+def test_compacted_ingests_survive_regeneration(empty_warehouse):
+    generate_data(order_count=3_000, customer_count=100)
+    run_pipeline()
+    for batch in range(3):
+        drop_orders(f"drop-{batch}", 1_000_000 + batch * 1_000)
+        process_incremental_data()
+    assert compact_bronze(min_files=2) == 3
+
+    orders = BRONZE / "orders"
+    compacted = sorted(path.name for path in orders.glob("compacted-*.parquet"))
+    assert compacted
+    assert not list(orders.glob("incremental-*.parquet"))
+    ledger = read_ledger()
+    assert {entry["status"] for entry in ledger.values()} == {"ingested"}
+    assert all(entry["bronze"] == compacted for entry in ledger.values())
+    ingested = {order_id for order_id in silver_order_ids() if order_id >= 1_000_000}
+    assert ingested
+
+    generate_data(order_count=2_000, customer_count=100, seed=7)
+    # Delivering an ingested file again is a duplicate, so its rows must still be in bronze.
+    shutil.copy(INCOMING / "processed" / "drop-0.parquet", INCOMING)
+    assert process_incremental_data() == 0
+
+    assert sorted(path.name for path in orders.glob("compacted-*.parquet")) == compacted
+    assert {order_id for order_id in silver_order_ids() if order_id >= 1_000_000} == ingested
+
+
+def test_ledger_rejects_invalid_files_and_skips_duplicates(empty_warehouse):
+    generate_data(order_count=3_000, customer_count=100)
+    run_pipeline()
+    drop_orders("good", 1_000_000)
+    pq.write_table(pa.table({"order_id": [1]}), INCOMING / "bad.parquet")
+
+    assert process_incremental_data() == 1
+    ledger = read_ledger()
+    assert ledger["good.parquet"]["status"] == "ingested"
+    assert ledger["good.parquet"]["rows"] == 100
+    assert ledger["bad.parquet"]["status"] == "rejected"
+    assert "missing columns" in ledger["bad.parquet"]["error"]
+    assert (INCOMING / "processed" / "good.parquet").exists()
+    assert (INCOMING / "rejected" / "bad.parquet").exists()
+    ingested = silver_order_ids()
+
+    shutil.copy(INCOMING / "processed" / "good.parquet", INCOMING)
+    assert process_incremental_data() == 0
+    assert read_ledger()["good.parquet"] == ledger["good.parquet"]
+    assert silver_order_ids() == ingested
+
+
+def test_interrupted_compaction_resumes_from_its_journal(empty_warehouse, monkeypatch):
+    generate_data(order_count=3_000, customer_count=100)
+    run_pipeline()
+    for batch in range(2):
+        drop_orders(f"drop-{batch}", 1_000_000 + batch * 1_000)
+        process_incremental_data()
+    orders = BRONZE / "orders"
+    sources = sorted(path.name for path in orders.glob("incremental-*.parquet"))
+    ingested = silver_order_ids()
+
+    finish = pipeline._finish_compaction
+    calls = []
+
+    def interrupted():
+        calls.append(None)
+        if len(calls) > 1:
+            raise KeyboardInterrupt
+        finish()
+
+    # Let the leftover check run, then stop before the checked files are swapped in.
+    monkeypatch.setattr(pipeline, "_finish_compaction", interrupted)
+    try:
+        compact_bronze(min_files=2)
+    except KeyboardInterrupt:
+        pass
+    monkeypatch.undo()
+    journal = json.loads(COMPACTION_JOURNAL.read_text(encoding="utf-8"))
+    assert journal["sources"] == sources
+
+    assert compact_bronze(min_files=2) == 0
+    assert not COMPACTION_STAGING.exists()
+    assert not list(orders.glob("incremental-*.parquet"))
+    assert sorted(path.name for path in orders.glob("compacted-*.parquet")) == journal["outputs"]
+    manifest = json.loads(PIPELINE_MANIFEST.read_text(encoding="utf-8"))
+    assert set(journal["outputs"]) <= set(manifest["bronze"])
+    assert not set(sources) & set(manifest["bronze"])
+    assert {tuple(entry["bronze"]) for entry in read_ledger().values()} == {
+        tuple(journal["outputs"])
+    }
+    # The manifest now matches bronze, so an incremental run finds nothing to rebuild.
+    assert run_pipeline(incremental=True)["bronze_orders"] == 0
+    assert silver_order_ids() == ingested
+
+
+def test_compaction_discards_staging_without_a_journal(empty_warehouse):
+    generate_data(order_count=3_000, customer_count=100)
+    run_pipeline()
+    COMPACTION_STAGING.mkdir()
+    (COMPACTION_STAGING / "compacted-partial-0.parquet").write_bytes(b"partial")
+
+    assert compact_bronze(min_files=2) == 0
+    assert not COMPACTION_STAGING.exists()
+    assert not list((BRONZE / "orders").glob("compacted-*.parquet"))
@@ -0,0 +1,98 @@
+import subprocess
+import sys
+import threading
+import time
+
+import pytest
+
+from app import resources
+from app.config import PROJECT_ROOT
+from app.data_generator import generate_data
+from app.pipeline import run_pipeline
+from app.pool import ConnectionPool
+
+# Each test builds a 200k-order warehouse and runs full pipelines.
+pytestmark = pytest.mark.slow
+
+
+@pytest.fixture(scope="module")
+def warehouse():
+    generate_data(order_count=200_000, customer_count=2_000, vectorized=True)
+    run_pipeline()
+
+
+@pytest.fixture
+def pool(warehouse, monkeypatch):
+    # Enough threads that the serving share differs from the whole budget.
+    monkeypatch.setattr(resources, "CPU_BUDGET", 4)
+    pool = ConnectionPool(size=1)
+    pool.governor.poll_seconds = 0
+    yield pool
+    pool.close()
+
+
+def _threads(pool: ConnectionPool) -> int:
+    with pool.acquire() as cursor:
+        return cursor.execute("SELECT current_setting('threads')").fetchone()[0]
+
+
+def _watch(pool: ConnectionPool, running) -> set[int]:
+    """Poll the governor while ``running()`` is true; return the thread counts seen."""
+    seen = set()
+    while running():
+        seen.add(_threads(pool))
+        time.sleep(0.01)
+    return seen
+
+
+def test_pipeline_process_runs_while_serving_and_takes_threads(pool):
+    full = resources.limits("serving").threads
+    shared = resources.limits("serving", pipeline_active=True).threads
+    assert _threads(pool) == full
+
+    process = subprocess.Popen(
+        [sys.executable, "-m", "app.pipeline", "--force"],
+        cwd=PROJECT_ROOT,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+    )
+    seen = _watch(pool, lambda: process.poll() is None)
+    output = process.communicate()[0]
+
+    # The pipeline must not need the database file the serving pool holds.
+    assert process.returncode == 0, output
+    assert shared in seen
+    assert _threads(pool) == full
+
+
+def test_in_process_pipeline_gets_own_limits_and_takes_threads(pool):
+    full = resources.limits("serving").threads
+    shared = resources.limits("serving", pipeline_active=True).threads
+    pipeline_threads = resources.limits("pipeline").threads
+    applied = []
+    apply_limits = resources.apply_limits
+
+    def record(conn, role):
+        apply_limits(conn, role)
+        applied.append((role, conn.execute("SELECT current_setting('threads')").fetchone()[0]))
+
+    failures = []
+
+    def build():
+        try:
+            run_pipeline(force=True)
+        except Exception as exc:
+            failures.append(exc)
+
+    with pytest.MonkeyPatch.context() as patch:
+        patch.setattr("app.catalog.apply_limits", record)
+        thread = threading.Thread(target=build)
+        thread.start()
+        seen = _watch(pool, thread.is_alive)
+        thread.join()
+
+    assert not failures
+    assert ("pipeline", pipeline_threads) in applied
+    assert shared in seen
+    assert _threads(pool) == full
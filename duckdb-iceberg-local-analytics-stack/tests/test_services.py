@@ -0,0 +1,42 @@
+import shutil
+
+import duckdb
+
+from app.config import LEGACY_SILVER_ORDERS, SILVER_ORDERS, SILVER_ORDERS_GLOB
+from app.data_generator import generate_data
+from app.pipeline import migrate_silver_orders, run_pipeline
+from app.services import AnalyticsService
+
+
+def legacy_silver_orders() -> None:
+    """Rewrite silver orders in the single-file layout from before month partitioning."""
+    db = duckdb.connect()
+    try:
+        db.execute(
+            f"COPY (SELECT * EXCLUDE (order_month) FROM read_parquet('{SILVER_ORDERS_GLOB}', "
+            f"hive_partitioning = true)) TO '{LEGACY_SILVER_ORDERS}' (FORMAT PARQUET)"
+        )
+    finally:
+        db.close()
+    target = SILVER_ORDERS.resolve()
+    SILVER_ORDERS.unlink()
+    shutil.rmtree(target)
+
+
+def test_serves_legacy_silver_until_it_is_migrated(empty_warehouse):
+    generate_data(order_count=3_000, customer_count=100)
+    run_pipeline()
+    legacy_silver_orders()
+
+    service = AnalyticsService(serve_from_gold=False)
+    try:
+        assert service.ready()
+        before = service.daily_revenue()
+        assert before
+
+        assert migrate_silver_orders()
+        assert SILVER_ORDERS.exists() and not LEGACY_SILVER_ORDERS.exists()
+        assert service.ready()
+        assert service.daily_revenue() == before
+    finally:
+        service.close()
@@ -0,0 +1 @@
+"""Shared core of the dashboard benchmark: dataset, query catalog and engine adapters."""
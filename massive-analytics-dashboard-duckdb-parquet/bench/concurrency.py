@@ -0,0 +1,135 @@
+"""Concurrent-user load simulation: many dashboard users hitting one engine at once.
+
+Each simulated user runs on its own thread with its own connection and loops
+think → query until the duration is up: it sleeps for an exponentially distributed
+think time, then runs a query drawn from the weighted mix. Every driver used here
+releases the GIL while a query executes, so threads are enough to load the engine.
+"""
+
+import math
+import os
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from bench.config import CONCURRENCY_DURATION_S, RANDOM_SEED, THINK_TIME_MS
+
+
+def percentile(values, pct):
+    """Return the nearest-rank percentile of ``values`` (0 for an empty list).
+    Args:
+        values: Latencies in milliseconds.
+        pct: Percentile between 0 and 100.
+    """
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(pct / 100 * len(ordered)) - 1)]
+
+
+def _user(engine, mix, user_id, start, deadline, think_ms):
+    """Run one simulated user until ``deadline``.
+    Returns:
+        A list of (query_id, latency_ms) pairs, one per completed query.
+    """
+    rng = random.Random(RANDOM_SEED * 1000 + user_id)
+    ids = [query_id for query_id, _sql, _weight in mix]
+    weights = [weight for _query_id, _sql, weight in mix]
+    sql = {query_id: text for query_id, text, _weight in mix}
+    try:
+        conn = engine.worker()
+    except Exception:
+        start.abort()
+        raise
+    samples = []
+    try:
+        start.wait()
+        while True:
+            if think_ms > 0:
+                time.sleep(rng.expovariate(1 / think_ms) / 1000)
+            if time.perf_counter() >= deadline[0]:
+                break
+            query_id = rng.choices(ids, weights)[0]
+            t0 = time.perf_counter()
+            conn.query(sql[query_id])
+            samples.append((query_id, (time.perf_counter() - t0) * 1000))
+    finally:
+        conn.close()
+    return samples
+
+
+def simulate_users(
+    engine, mix, users, duration_s=CONCURRENCY_DURATION_S, think_ms=THINK_TIME_MS
+):
+    """Drive one loaded engine with ``users`` concurrent dashboard users.
+    Args:
+        engine: A connected, loaded engine adapter.
+        mix: List of (query definition dict, weight) pairs from ``parse_mix``.
+        users: Number of concurrent users, one thread and connection each.
+        duration_s: How long the users keep issuing queries.
+        think_ms: Mean think time between a user's queries, in milliseconds.
+    Returns:
+        A dict with ``latency_ms`` (query id -> list of latencies), ``elapsed_s``
+        and ``cpu_s`` (CPU seconds used by this process, user + system).
+    """
+    rendered = [(q["id"], engine.translate(q), weight) for q, weight in mix]
+    start = threading.Barrier(users + 1)
+    # The deadline is set once every user has connected, so connection setup
+    # is not counted against the measured window.
+    deadline = [math.inf]
+    with ThreadPoolExecutor(users) as pool:
+        futures = [
+            pool.submit(_user, engine, rendered, i, start, deadline, think_ms)
+            for i in range(users)
+        ]
+        try:
+            start.wait()
+        except threading.BrokenBarrierError:
+            # A user failed to connect: surface its error, not the broken barrier.
+            for future in futures:
+                if not isinstance(future.exception(), threading.BrokenBarrierError):
+                    future.result()
+            raise
+        cpu0 = os.times()
+        t0 = time.perf_counter()
+        deadline[0] = t0 + duration_s
+        samples = [sample for future in futures for sample in future.result()]
+        elapsed_s = time.perf_counter() - t0
+        cpu1 = os.times()
+
+    latency_ms = {query_id: [] for query_id, _sql, _weight in rendered}
+    for query_id, ms in samples:
+        latency_ms[query_id].append(ms)
+    return {
+        "latency_ms": latency_ms,
+        "elapsed_s": elapsed_s,
+        "cpu_s": (cpu1.user - cpu0.user) + (cpu1.system - cpu0.system),
+    }
+
+
+def run_concurrency(
+    engines, mix, users, duration_s=CONCURRENCY_DURATION_S, think_ms=THINK_TIME_MS
+):
+    """Run the concurrent-user simulation against every engine in turn.
+    Args:
+        engines: Connected, loaded engine adapters.
+        mix: List of (query definition dict, weight) pairs from ``parse_mix``.
+        users: Number of concurrent users.
+        duration_s: Measured window per engine, in seconds.
+        think_ms: Mean think time between a user's queries, in milliseconds.
+    Returns:
+        A dict mapping engine name to the simulate_users() result.
+    """
+    print(f"\n=== Step 3: Simulating {users} concurrent users ===\n")
+    results = {}
+    for engine in engines:
+        print(f"  {engine.label} ({duration_s:g} s) ... ", end="", flush=True)
+        result = simulate_users(engine, mix, users, duration_s, think_ms)
+        latencies = [ms for values in result["latency_ms"].values() for ms in values]
+        print(
+            f"{len(latencies) / result['elapsed_s']:,.1f} QPS | "
+            f"p95 {percentile(latencies, 95):,.1f} ms"
+        )
+        results[engine.name] = result
+    return results
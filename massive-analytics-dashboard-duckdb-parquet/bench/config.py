@@ -0,0 +1,228 @@
+"""Shared configuration for the dashboard benchmark suite.
+
+Values are read from the ``.env`` file in the project root, then from environment
+variables, so every engine is benchmarked against the same dataset and settings.
+"""
+
+import os
+from datetime import datetime
+
+from dotenv import load_dotenv
+
+# Load .env file before reading any environment variables.
+# A missing .env is silently ignored so CI / production env vars still work.
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+load_dotenv(os.path.join(PROJECT_DIR, ".env"))
+
+# ---------------------------------------------------------------------------
+# Dataset
+# ---------------------------------------------------------------------------
+NUM_ROWS = int(os.environ.get("NUM_ROWS", "10_000_000"))
+RANDOM_SEED = 42
+DATE_START = datetime(2024, 1, 1)
+DATE_END = datetime(2024, 12, 31)
+
+# --- Clients: 100 named clients across diverse industries ---
+# Generated programmatically from prefix/industry/suffix pools to keep the
+# source compact while producing unique, realistic-sounding company names.
+_INDUSTRIES = [
+    "Retail",
+    "Technology",
+    "Food & Beverage",
+    "Fashion",
+    "Automotive",
+    "Healthcare",
+    "Education",
+    "Travel",
+    "Finance",
+    "Energy",
+    "Pet Care",
+    "Real Estate",
+    "Media",
+    "Entertainment",
+    "Sports",
+    "Fitness",
+    "Agriculture",
+    "Construction",
+    "Logistics",
+    "Legal",
+    "Insurance",
+    "Telecom",
+    "Pharma",
+    "Hospitality",
+    "Aerospace",
+]
+_COMPANY_PREFIXES = [
+    "Apex",
+    "Bolt",
+    "Crest",
+    "Dash",
+    "Echo",
+    "Flux",
+    "Glow",
+    "Hive",
+    "Iris",
+    "Jade",
+    "Kite",
+    "Luma",
+    "Mint",
+    "Nova",
+    "Onyx",
+    "Peak",
+    "Quill",
+    "Rift",
+    "Sage",
+    "Tide",
+]
+_COMPANY_SUFFIXES = ["Corp", "Co", "Inc", "Group", "Labs"]
+
+CLIENTS = {
+    i + 1: {
+        "name": (
+            f"{_COMPANY_PREFIXES[i % len(_COMPANY_PREFIXES)]} "
+            f"{_INDUSTRIES[i % len(_INDUSTRIES)]} "
+            f"{_COMPANY_SUFFIXES[i % len(_COMPANY_SUFFIXES)]}"
+        ),
+        "industry": _INDUSTRIES[i % len(_INDUSTRIES)],
+    }
+    for i in range(100)
+}
+
+# --- Channels: 10 major ad platforms ---
+CHANNELS = {
+    1: "Facebook",
+    2: "Google",
+    3: "TikTok",
+    4: "LinkedIn",
+    5: "Snapchat",
+    6: "Pinterest",
+    7: "YouTube",
+    8: "X (Twitter)",
+    9: "Reddit",
+    10: "Amazon Ads",
+}
+
+# Channel-specific metric profiles for realistic data diversity.
+# Each channel has different cost structures and performance patterns.
+CHANNEL_PROFILES = {
+    1: {
+        "imp_range": (500, 300_000),
+        "cpc_range": (0.20, 2.50),
+        "conv_rate": 0.025,
+    },  # Facebook
+    2: {
+        "imp_range": (200, 150_000),
+        "cpc_range": (0.50, 8.00),
+        "conv_rate": 0.045,
+    },  # Google
+    3: {
+        "imp_range": (1000, 500_000),
+        "cpc_range": (0.05, 1.50),
+        "conv_rate": 0.010,
+    },  # TikTok
+    4: {
+        "imp_range": (50, 50_000),
+        "cpc_range": (2.00, 15.00),
+        "conv_rate": 0.035,
+    },  # LinkedIn
+    5: {
+        "imp_range": (800, 400_000),
+        "cpc_range": (0.03, 1.00),
+        "conv_rate": 0.008,
+    },  # Snapchat
+    6: {
+        "imp_range": (300, 200_000),
+        "cpc_range": (0.10, 2.00),
+        "conv_rate": 0.030,
+    },  # Pinterest
+    7: {
+        "imp_range": (400, 250_000),
+        "cpc_range": (0.08, 3.00),
+        "conv_rate": 0.015,
+    },  # YouTube
+    8: {
+        "imp_range": (200, 180_000),
+        "cpc_range": (0.15, 3.50),
+        "conv_rate": 0.012,
+    },  # X (Twitter)
+    9: {
+        "imp_range": (300, 220_000),
+        "cpc_range": (0.10, 2.00),
+        "conv_rate": 0.020,
+    },  # Reddit
+    10: {
+        "imp_range": (100, 80_000),
+        "cpc_range": (0.30, 5.00),
+        "conv_rate": 0.055,
+    },  # Amazon Ads
+}
+
+# Seasonal spend multipliers by month (simulates real-world ad seasonality).
+SEASONAL_MULTIPLIERS = {
+    1: 0.80,  # January   — post-holiday lull
+    2: 0.85,  # February  — slow recovery
+    3: 0.95,  # March     — spring ramp-up
+    4: 1.00,  # April     — steady
+    5: 1.00,  # May       — steady
+    6: 0.90,  # June      — summer slowdown
+    7: 0.85,  # July      — summer lull
+    8: 0.90,  # August    — back-to-school prep
+    9: 1.05,  # September — back to school
+    10: 1.15,  # October   — pre-holiday ramp
+    11: 1.40,  # November  — Black Friday / Cyber Monday
+    12: 1.30,  # December  — holiday season peak
+}
+
+NUM_CLIENTS = len(CLIENTS)
+NUM_CHANNELS = len(CHANNELS)
+
+# ---------------------------------------------------------------------------
+# Files and runs
+# ---------------------------------------------------------------------------
+DATA_DIR = os.path.join(PROJECT_DIR, "data")
+# Generated once per run; every engine loads from this single Parquet file.
+SOURCE_PARQUET = os.path.join(DATA_DIR, "ad_insights.parquet")
+PARQUET_BASE = os.path.join(DATA_DIR, "insights")
+DB_NAME = "benchmark_poc_db"
+SQLITE_DB_PATH = os.path.join(DATA_DIR, f"{DB_NAME}.db")
+DUCKDB_DB_PATH = os.path.join(DATA_DIR, f"{DB_NAME}.duckdb")
+NUM_RUNS = int(os.environ.get("NUM_RUNS", "3"))
+# Rows buffered per Parquet row group while generating; bounds generation memory.
+GENERATE_ROW_GROUP_SIZE = 1_000_000
+GENERATE_WORKERS = int(os.environ.get("GENERATE_WORKERS", str(os.cpu_count() or 4)))
+# Row-store load path: "bulk" uses COPY / LOAD DATA / tuned SQLite pragmas,
+# "batch" uses executemany in LOAD_BATCH_SIZE batches.
+LOAD_MODES = ("bulk", "batch")
+LOAD_MODE = os.environ.get("LOAD_MODE", "bulk")
+LOAD_BATCH_SIZE = 10_000
+BULK_BATCH_SIZE = 100_000
+SKIP_CLEANUP = os.environ.get("SKIP_CLEANUP", "0") == "1"
+
+# Concurrent-user simulation (benchmark.py --users): each simulated dashboard
+# user loops think -> query for the duration, on its own connection.
+CONCURRENCY_DURATION_S = float(os.environ.get("CONCURRENCY_DURATION_S", "30"))
+# Mean of the exponential think-time distribution between a user's queries.
+THINK_TIME_MS = float(os.environ.get("THINK_TIME_MS", "1000"))
+CONCURRENCY_MIX = os.environ.get("CONCURRENCY_MIX", "B1 C1 D1").split()
+# Row-group size of the unpartitioned, sorted layout in the layout sweep
+# (benchmark.py --layouts); smaller groups let min/max statistics skip more.
+LAYOUT_ROW_GROUP_SIZE = int(os.environ.get("LAYOUT_ROW_GROUP_SIZE", "16_384"))
+
+RESULTS_DIR = PROJECT_DIR
+COMPARISON_FILE = os.path.join(RESULTS_DIR, "results_comparison.txt")
+CONCURRENCY_FILE = os.path.join(RESULTS_DIR, "results_concurrency.txt")
+LAYOUTS_FILE = os.path.join(RESULTS_DIR, "results_layouts.txt")
+
+# ---------------------------------------------------------------------------
+# Database servers
+# ---------------------------------------------------------------------------
+MYSQL_HOST = os.environ.get("MYSQL_HOST", "localhost")
+MYSQL_PORT = int(os.environ.get("MYSQL_PORT", "3306"))
+MYSQL_USER = os.environ.get("MYSQL_USER", "root")
+MYSQL_PASSWORD = os.environ.get("MYSQL_PASSWORD", "")
+
+PG_HOST = os.environ.get("PG_HOST", "localhost")
+PG_PORT = int(os.environ.get("PG_PORT", "5432"))
+PG_USER = os.environ.get("PG_USER", "postgres")
+PG_PASSWORD = os.environ.get("PG_PASSWORD", "postgres")
+PG_DBNAME = os.environ.get("PG_DBNAME", "benchmark_poc_db")
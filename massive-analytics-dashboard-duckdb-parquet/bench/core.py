@@ -0,0 +1,121 @@
+"""Benchmark core: load every selected engine, then time the query catalog on each."""
+
+import os
+import shutil
+import statistics
+import time
+
+from bench.config import DATA_DIR, LOAD_MODE, NUM_RUNS, SKIP_CLEANUP, SOURCE_PARQUET
+from bench.engines import ENGINES
+
+
+def time_query(engine, sql, runs=NUM_RUNS):
+    """Time a query over multiple runs and return median time + results.
+    Args:
+        engine: A connected engine adapter.
+        sql: SQL query string in the engine's dialect.
+        runs: Number of runs for timing.
+    Returns:
+        A tuple of (median_ms, result_rows).
+    """
+    times_ms = []
+    result = None
+    for _ in range(runs):
+        t0 = time.perf_counter()
+        engine.run(sql)
+        result = engine.fetch()
+        times_ms.append((time.perf_counter() - t0) * 1000)
+    return statistics.median(times_ms), result
+
+
+def load_engines(names, source=SOURCE_PARQUET, mode=LOAD_MODE):
+    """Connect each engine, load the shared source file and build its indexes.
+    Args:
+        names: Engine names from ``ENGINES``, in report order.
+        source: Path to the generated Parquet file.
+        mode: Row-store load path, ``"bulk"`` or ``"batch"``.
+    Returns:
+        A tuple of (engines, load_ms) where load_ms maps engine name to a dict
+        with ``data``, ``indexes`` (None for engines without secondary indexes)
+        and ``total`` milliseconds.
+    """
+    print(f"\n=== Step 2: Loading engines ({mode}) ===\n")
+    engines = []
+    load_ms = {}
+    for name in names:
+        engine = ENGINES[name]()
+        engine.connect()
+        print(f"  Loading {engine.label} ... ", end="", flush=True)
+        t0 = time.perf_counter()
+        engine.load(source, mode)
+        data_ms = (time.perf_counter() - t0) * 1000
+        index_ms = None
+        if engine.indexes:
+            t0 = time.perf_counter()
+            engine.create_indexes()
+            index_ms = (time.perf_counter() - t0) * 1000
+        load_ms[name] = {
+            "data": data_ms,
+            "indexes": index_ms,
+            "total": data_ms + (index_ms or 0.0),
+        }
+        if index_ms is None:
+            print(f"{data_ms:,.0f} ms")
+        else:
+            print(f"{data_ms:,.0f} ms + {index_ms:,.0f} ms indexes")
+        engines.append(engine)
+    return engines, load_ms
+
+
+def run_benchmarks(engines, queries, runs=NUM_RUNS):
+    """Execute every catalog query against every engine.
+    Args:
+        engines: Connected, loaded engine adapters; the first is the baseline.
+        queries: Query definition dicts from ``bench.queries``.
+        runs: Number of runs per query and engine.
+    Returns:
+        A list of result dicts, each containing: id, name, category, headers,
+        ms and rows, the last two keyed by engine name.
+    """
+    print("\n=== Step 3: Running benchmark queries ===\n")
+    results = []
+    for q in queries:
+        print(f"  Running: [{q['id']}] {q['name']} ... ", end="", flush=True)
+        ms = {}
+        rows = {}
+        for engine in engines:
+            ms[engine.name], rows[engine.name] = time_query(
+                engine, engine.translate(q), runs
+            )
+        print(" | ".join(f"{e.label} {ms[e.name]:,.1f}ms" for e in engines))
+        results.append(
+            {
+                "id": q["id"],
+                "name": q["name"],
+                "category": q["category"],
+                "headers": q["headers"],
+                "ms": ms,
+                "rows": rows,
+            }
+        )
+    return results
+
+
+def cleanup(names):
+    """Remove engine databases and the data directory unless SKIP_CLEANUP=1.
+    Args:
+        names: Engine names whose external state should be dropped.
+    """
+    if SKIP_CLEANUP:
+        print("Skipping cleanup (SKIP_CLEANUP=1).\n")
+        return
+    print("\n=== Cleanup ===\n")
+    for name in names:
+        engine = ENGINES[name]()
+        try:
+            engine.cleanup()
+        except Exception as exc:
+            print(f"  Warning: could not clean up {engine.label}: {exc}")
+    if os.path.exists(DATA_DIR):
+        shutil.rmtree(DATA_DIR)
+        print(f"Removed {DATA_DIR}\n")
@@ -0,0 +1,258 @@
+"""Generate the ad-insights dataset that every engine is benchmarked on."""
+
+import math
+import os
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from bench.config import (
+    CHANNEL_PROFILES,
+    CHANNELS,
+    CLIENTS,
+    DATA_DIR,
+    DATE_END,
+    DATE_START,
+    GENERATE_ROW_GROUP_SIZE,
+    GENERATE_WORKERS,
+    NUM_CHANNELS,
+    NUM_CLIENTS,
+    RANDOM_SEED,
+    SEASONAL_MULTIPLIERS,
+    SOURCE_PARQUET,
+)
+
+# Table columns in load order; the Parquet source also carries the partition key ``k``.
+SCHEMA = pa.schema(
+    [
+        ("id", pa.int64()),
+        ("client_id", pa.int32()),
+        ("channel_id", pa.int32()),
+        ("ad_account_id", pa.string()),
+        ("campaign_id", pa.string()),
+        ("campaign_name", pa.string()),
+        ("ad_id", pa.string()),
+        ("ad_name", pa.string()),
+        ("impressions", pa.int64()),
+        ("clicks", pa.int64()),
+        ("spend", pa.float64()),
+        ("conversions", pa.int32()),
+        ("date", pa.date32()),
+        ("k", pa.string()),
+    ]
+)
+COLUMNS = [
+    "id",
+    "client_id",
+    "channel_id",
+    "ad_account_id",
+    "campaign_id",
+    "campaign_name",
+    "ad_id",
+    "ad_name",
+    "impressions",
+    "clicks",
+    "spend",
+    "conversions",
+    "date",
+]
+
+CAMPAIGN_TYPES = [
+    "Brand Awareness",
+    "Retargeting",
+    "Lead Gen",
+    "Conversion",
+    "Prospecting",
+    "Engagement",
+]
+AD_FORMATS = [
+    "Video 30s",
+    "Video 15s",
+    "Carousel",
+    "Static Image",
+    "Story Ad",
+    "Collection",
+    "Dynamic",
+    "Playable",
+]
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+def make_k(client_id, channel_id):
+    """Generate the zero-padded Hive partition key for a client-channel pair.
+    Format: CCCCH where CCC = client_id (3 digits) and CH = channel_id (2 digits).
+    Example: client 1, channel 3 -> '00103'; client 100, channel 10 -> '10010'.
+    """
+    return f"{client_id:03d}{channel_id:02d}"
+
+
+def make_k_in(client_ids, channel_ids):
+    """Build a SQL IN(...) value string for DuckDB partition key filtering.
+    Args:
+        client_ids: Iterable of client IDs.
+        channel_ids: Iterable of channel IDs.
+    Returns:
+        A comma-separated string of quoted k values for SQL IN clauses.
+    """
+    keys = [make_k(c, ch) for c in client_ids for ch in channel_ids]
+    return ", ".join(f"'{k}'" for k in keys)
+
+
+def sql_path(path):
+    """Return a filesystem path as a quoted-safe, forward-slash SQL string body."""
+    return path.replace("\\", "/").replace("'", "''")
+
+
+# ---------------------------------------------------------------------------
+# Generate realistic ad performance data
+# ---------------------------------------------------------------------------
+def _block(client_id, channel_id, ads_per_channel, days, first_id):
+    """Generate every row of one client x channel block as Arrow columns.
+    Rows are ordered by ad, then day. Each block draws from its own generator,
+    seeded from (RANDOM_SEED, client_id, channel_id), so the data is identical
+    on every run no matter how many rows are generated.
+    Args:
+        client_id: Client of the block.
+        channel_id: Channel of the block.
+        ads_per_channel: Number of ad creatives in the block.
+        days: Number of days each ad has a row for.
+        first_id: ``id`` of the block's first row.
+    Returns:
+        A pyarrow.RecordBatch with SCHEMA.
+    """
+    rng = np.random.default_rng([RANDOM_SEED, client_id, channel_id])
+    profile = CHANNEL_PROFILES[channel_id]
+    client = CLIENTS[client_id]
+    channel_name = CHANNELS[channel_id]
+    n = ads_per_channel * days
+
+    ad_idx = np.repeat(np.arange(ads_per_channel, dtype=np.int32), days)
+    day = np.tile(np.arange(days), ads_per_channel)
+    dates = np.datetime64(DATE_START.date(), "D") + day
+    months = dates.astype("datetime64[M]").astype(np.int64) % 12 + 1
+    seasonal = np.array([0.0] + [SEASONAL_MULTIPLIERS[m] for m in range(1, 13)])[months]
+
+    # Impressions: channel-specific range with seasonal factor
+    low, high = profile["imp_range"]
+    impressions = (rng.integers(low, high, n, endpoint=True) * seasonal).astype(np.int64)
+    # CTR: varies by creative quality (0.5% – 8%)
+    clicks = (impressions * rng.uniform(0.005, 0.08, n)).astype(np.int64)
+    # CPC: channel-specific cost, modulated by season
+    spend = np.round(clicks * rng.uniform(*profile["cpc_range"], n) * seasonal, 2)
+    # Conversions: based on channel's typical conversion rate
+    conversions = (clicks * profile["conv_rate"] * rng.uniform(0.5, 1.5, n)).astype(np.int32)
+
+    # Per-ad strings are built once per ad and expanded with a vectorized take.
+    camp_types = [CAMPAIGN_TYPES[i % len(CAMPAIGN_TYPES)] for i in range(ads_per_channel)]
+    ad_formats = [AD_FORMATS[i % len(AD_FORMATS)] for i in range(ads_per_channel)]
+    prefix = f"{client_id:03d}_{channel_id:02d}"
+    per_ad = {
+        "campaign_id": [f"camp_{prefix}_{i:03d}" for i in range(ads_per_channel)],
+        "campaign_name": [f"{t} - {client['industry']} - {channel_name}" for t in camp_types],
+        "ad_id": [f"ad_{prefix}_{i:03d}" for i in range(ads_per_channel)],
+        "ad_name": [
+            f"{f} - {t} #{i + 1}" for i, (f, t) in enumerate(zip(ad_formats, camp_types))
+        ],
+    }
+    constant = np.zeros(n, dtype=np.int32)
+
+    return pa.record_batch(
+        [
+            pa.array(np.arange(first_id, first_id + n, dtype=np.int64)),
+            pa.array(np.full(n, client_id, dtype=np.int32)),
+            pa.array(np.full(n, channel_id, dtype=np.int32)),
+            pa.array([f"acc_{prefix}"]).take(constant),
+            pa.array(per_ad["campaign_id"]).take(ad_idx),
+            pa.array(per_ad["campaign_name"]).take(ad_idx),
+            pa.array(per_ad["ad_id"]).take(ad_idx),
+            pa.array(per_ad["ad_name"]).take(ad_idx),
+            pa.array(impressions),
+            pa.array(clicks),
+            pa.array(spend),
+            pa.array(conversions),
+            pa.array(dates, type=pa.date32()),
+            pa.array([make_k(client_id, channel_id)]).take(constant),
+        ],
+        schema=SCHEMA,
+    )
+
+
+def _blocks(num_rows, ads_per_channel, days, workers):
+    """Yield the record batches of the first ``num_rows`` rows, in row order.
+    Blocks are generated on a thread pool — NumPy and Arrow release the GIL —
+    with at most ``2 * workers`` blocks in flight to keep memory bounded.
+    """
+    block_rows = ads_per_channel * days
+    blocks = [
+        (client_id, channel_id)
+        for client_id in range(1, NUM_CLIENTS + 1)
+        for channel_id in range(1, NUM_CHANNELS + 1)
+    ][: math.ceil(num_rows / block_rows)]
+    with ThreadPoolExecutor(workers) as pool:
+        in_flight = deque()
+        for i, (client_id, channel_id) in enumerate(blocks):
+            in_flight.append(
+                pool.submit(
+                    _block, client_id, channel_id, ads_per_channel, days, i * block_rows + 1
+                )
+            )
+            if len(in_flight) >= 2 * workers:
+                yield in_flight.popleft().result()
+        while in_flight:
+            yield in_flight.popleft().result()
+
+
+def generate_data(num_rows, path=SOURCE_PARQUET, workers=GENERATE_WORKERS):
+    """Generate the dataset and write it to the shared Parquet source file.
+    Uses channel-specific metric profiles and seasonal multipliers to create
+    data that mirrors real-world ad platform behavior across 100 clients and
+    10 advertising channels. Each client x channel block is generated as NumPy
+    columns and streamed to Parquet as Arrow record batches, so memory stays
+    bounded by one row group regardless of ``num_rows``.
+    Args:
+        num_rows: Number of rows to generate.
+        path: Parquet file to write.
+        workers: Threads generating blocks.
+    Returns:
+        The number of rows written.
+    """
+    print("\n=== Step 1: Generating realistic ad performance data ===\n")
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    days = (DATE_END - DATE_START).days + 1
+    ads_per_channel = max(1, math.ceil(num_rows / (NUM_CLIENTS * NUM_CHANNELS * days)))
+
+    t0 = time.perf_counter()
+    written = 0
+    pending = []
+    tmp_path = f"{path}.tmp"
+    with pq.ParquetWriter(tmp_path, SCHEMA, compression="snappy") as writer:
+        for batch in _blocks(num_rows, ads_per_channel, days, workers):
+            batch = batch.slice(0, num_rows - written)
+            pending.append(batch)
+            written += batch.num_rows
+            if sum(b.num_rows for b in pending) >= GENERATE_ROW_GROUP_SIZE:
+                writer.write_table(pa.Table.from_batches(pending))
+                pending = []
+        if pending:
+            writer.write_table(pa.Table.from_batches(pending))
+    os.replace(tmp_path, path)
+    elapsed_ms = (time.perf_counter() - t0) * 1000
+
+    first_3 = [CLIENTS[i]["name"] for i in range(1, min(4, NUM_CLIENTS + 1))]
+    client_preview = (
+        ", ".join(first_3) + ", ..." if NUM_CLIENTS > 3 else ", ".join(first_3)
+    )
+
+    print(f"Generated {written:,} rows in {elapsed_ms:,.0f} ms")
+    print(f"  Clients:       {NUM_CLIENTS} ({client_preview})")
+    print(f"  Channels:      {NUM_CHANNELS} ({', '.join(CHANNELS.values())})")
+    print(f"  Date range:    {DATE_START.date()} to {DATE_END.date()} ({days} days)")
+    print(f"  Ads/partition: ~{ads_per_channel}")
+    print(f"  Source file:   {path}\n")
+    return written
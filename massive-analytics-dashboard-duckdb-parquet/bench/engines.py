@@ -0,0 +1,459 @@
+"""Engine adapters: one class per database the dashboard queries are benchmarked on.
+
+Each adapter implements the same five steps — ``connect``, ``load``, ``translate``,
+``run`` and ``fetch`` — so the benchmark core drives every engine identically.
+Secondary indexes are built by ``create_indexes`` after ``load``, so load time can
+be reported with and without them.
+Adding an engine means adding one subclass here and registering it in ``ENGINES``.
+"""
+
+import copy
+import io
+import os
+import shutil
+
+from bench.config import (
+    BULK_BATCH_SIZE,
+    DATA_DIR,
+    DB_NAME,
+    DUCKDB_DB_PATH,
+    LOAD_BATCH_SIZE,
+    LOAD_MODE,
+    MYSQL_HOST,
+    MYSQL_PASSWORD,
+    MYSQL_PORT,
+    MYSQL_USER,
+    NUM_CHANNELS,
+    NUM_CLIENTS,
+    PARQUET_BASE,
+    PG_DBNAME,
+    PG_HOST,
+    PG_PASSWORD,
+    PG_PORT,
+    PG_USER,
+    SQLITE_DB_PATH,
+)
+from bench.dataset import COLUMNS, make_k_in, sql_path
+
+INDEXES = {
+    "idx_client_channel_date": "client_id, channel_id, date",
+    "idx_client_date": "client_id, date",
+}
+
+
+class Engine:
+    """Base adapter. Subclasses set the dialect fragments and connection details."""
+
+    name = ""
+    label = ""
+    # Dialect fragments substituted into the query catalog templates.
+    table = "ad_insights"
+    month = "MONTH(date)"
+    numeric = ""
+    # Secondary indexes built by create_indexes(); the DuckDB engines have none.
+    indexes = {}
+
+    def __init__(self):
+        self.conn = None
+        self.cursor = None
+
+    def connect(self):
+        """Open the connection used for loading and querying."""
+        raise NotImplementedError
+
+    def worker(self):
+        """Return a new adapter on its own connection to the loaded data.
+        Called from the thread that will use it, since some drivers tie a
+        connection to the thread that opened it.
+        """
+        engine = type(self)()
+        engine.connect()
+        return engine
+
+    def load(self, source, mode=LOAD_MODE):
+        """Load the dataset from the shared Parquet source file.
+        Args:
+            source: Path to the generated ad_insights Parquet file.
+            mode: ``"bulk"`` for the engine's native bulk loader, ``"batch"``
+                for batched INSERTs. Engines with a single load path ignore it.
+        """
+        raise NotImplementedError
+
+    def create_indexes(self):
+        """Build the secondary indexes in ``indexes`` on the loaded table."""
+        for index, columns in self.indexes.items():
+            self.cursor.execute(f"CREATE INDEX {index} ON ad_insights ({columns})")
+        if self.indexes:
+            self.conn.commit()
+
+    def translate(self, query):
+        """Render a catalog query into this engine's SQL dialect.
+        Args:
+            query: A query definition dict from ``bench.queries``.
+        Returns:
+            The SQL string to run.
+        """
+        filter_sql = ""
+        if query["filter"] is not None:
+            filter_sql = self.match(*query["filter"])
+        return query["sql"].format(
+            table=self.table,
+            filter=filter_sql,
+            month=self.month,
+            numeric=self.numeric,
+        )
+
+    def match(self, client_ids, channel_ids):
+        """Return the predicate selecting the given clients and channels.
+        Args:
+            client_ids: List of client IDs, or ``None`` for all clients.
+            channel_ids: List of channel IDs, or ``None`` for all channels.
+        Returns:
+            A SQL boolean expression.
+        """
+        predicates = []
+        for column, values in (("client_id", client_ids), ("channel_id", channel_ids)):
+            if values is None:
+                continue
+            if len(values) == 1:
+                predicates.append(f"{column} = {values[0]}")
+            else:
+                predicates.append(f"{column} IN ({', '.join(str(v) for v in values)})")
+        return " AND ".join(predicates)
+
+    def run(self, sql):
+        """Execute a query."""
+        self.cursor.execute(sql)
+
+    def fetch(self):
+        """Return all rows of the last query as a list of tuples."""
+        return [tuple(row) for row in self.cursor.fetchall()]
+
+    def query(self, sql):
+        """Execute a query and return its rows."""
+        self.run(sql)
+        return self.fetch()
+
+    def close(self):
+        """Close the connection, if open."""
+        if self.cursor is not None:
+            self.cursor.close()
+        if self.conn is not None:
+            self.conn.close()
+        self.conn = None
+        self.cursor = None
+
+    def cleanup(self):
+        """Drop whatever ``load`` created outside the data directory."""
+
+
+# ---------------------------------------------------------------------------
+# Row stores
+# ---------------------------------------------------------------------------
+class RowStoreEngine(Engine):
+    """Shared loading for the row stores: table, bulk or batched load, two secondary indexes."""
+
+    indexes = INDEXES
+    placeholder = "%s"
+    spend_type = "DOUBLE"
+
+    def create_table(self):
+        self.cursor.execute("DROP TABLE IF EXISTS ad_insights")
+        self.cursor.execute(f"""
+            CREATE TABLE ad_insights (
+                id             BIGINT       NOT NULL PRIMARY KEY,
+                client_id      INTEGER      NOT NULL,
+                channel_id     INTEGER      NOT NULL,
+                ad_account_id  VARCHAR(64)  NOT NULL,
+                campaign_id    VARCHAR(128) NOT NULL,
+                campaign_name  VARCHAR(256) NOT NULL,
+                ad_id          VARCHAR(128) NOT NULL,
+                ad_name        VARCHAR(256) NOT NULL,
+                impressions    BIGINT       NOT NULL,
+                clicks         BIGINT       NOT NULL,
+                spend          {self.spend_type} NOT NULL,
+                conversions    INTEGER      NOT NULL,
+                date           DATE         NOT NULL
+            )
+        """)
+
+    def load(self, source, mode=LOAD_MODE):
+        """Create the table and fill it; indexes are left to create_indexes()."""
+        self.create_table()
+        if mode == "bulk":
+            self.bulk_load(source)
+        else:
+            self.batch_load(source)
+        self.conn.commit()
+
+    def bulk_load(self, source):
+        """Load the source rows with the engine's native bulk loader."""
+        raise NotImplementedError
+
+    def batch_load(self, source):
+        """Insert the source rows with ``executemany`` in LOAD_BATCH_SIZE batches."""
+        import duckdb
+
+        insert_sql = (
+            f"INSERT INTO ad_insights ({', '.join(COLUMNS)}) "
+            f"VALUES ({', '.join([self.placeholder] * len(COLUMNS))})"
+        )
+        # Dates are passed as ISO strings, which every row store parses into DATE.
+        columns = ", ".join(COLUMNS[:-1] + ["CAST(date AS VARCHAR) AS date"])
+        reader = duckdb.connect(":memory:")
+        result = reader.execute(
+            f"SELECT {columns} FROM read_parquet('{sql_path(source)}') ORDER BY id"
+        )
+        while batch := result.fetchmany(LOAD_BATCH_SIZE):
+            self.cursor.executemany(insert_sql, batch)
+        reader.close()
+
+    def row_chunks(self, source):
+        """Yield the source rows as lists of tuples, BULK_BATCH_SIZE rows per chunk.
+        Rows are built column-wise from Arrow batches, which is much cheaper than
+        fetching them one tuple at a time; dates become ISO strings.
+        """
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        parquet = pq.ParquetFile(source)
+        for batch in parquet.iter_batches(batch_size=BULK_BATCH_SIZE, columns=COLUMNS):
+            columns = [
+                (column.cast(pa.string()) if name == "date" else column).to_pylist()
+                for name, column in zip(batch.schema.names, batch.columns)
+            ]
+            yield list(zip(*columns))
+
+    def csv_chunks(self, source):
+        """Yield the source rows as headerless CSV, BULK_BATCH_SIZE rows per chunk.
+        The source is written in ``id`` order, so no sort is needed.
+        """
+        import pyarrow.csv as pacsv
+        import pyarrow.parquet as pq
+
+        options = pacsv.WriteOptions(include_header=False)
+        parquet = pq.ParquetFile(source)
+        for batch in parquet.iter_batches(batch_size=BULK_BATCH_SIZE, columns=COLUMNS):
+            buffer = io.BytesIO()
+            pacsv.write_csv(batch, buffer, options)
+            yield buffer.getvalue()
+
+
+class SQLiteEngine(RowStoreEngine):
+    name = "sqlite"
+    label = "SQLite"
+    month = "CAST(strftime('%m', date) AS INTEGER)"
+    placeholder = "?"
+
+    def connect(self):
+        import sqlite3
+
+        os.makedirs(os.path.dirname(SQLITE_DB_PATH), exist_ok=True)
+        self.conn = sqlite3.connect(SQLITE_DB_PATH)
+        self.cursor = self.conn.cursor()
+
+    def bulk_load(self, source):
+        """SQLite has no COPY: large Arrow-fed inserts in one transaction, WAL, no fsync."""
+        self.cursor.execute("PRAGMA journal_mode = WAL")
+        self.cursor.execute("PRAGMA synchronous = OFF")
+        insert_sql = (
+            f"INSERT INTO ad_insights ({', '.join(COLUMNS)}) "
+            f"VALUES ({', '.join([self.placeholder] * len(COLUMNS))})"
+        )
+        for rows in self.row_chunks(source):
+            self.cursor.executemany(insert_sql, rows)
+
+    def cleanup(self):
+        if os.path.exists(SQLITE_DB_PATH):
+            os.remove(SQLITE_DB_PATH)
+
+
+class PostgreSQLEngine(RowStoreEngine):
+    name = "postgresql"
+    label = "PostgreSQL"
+    month = "DATE_PART('month', date)::INTEGER"
+    # PostgreSQL's ROUND(x, n) is only defined for NUMERIC.
+    numeric = "::NUMERIC"
+    spend_type = "NUMERIC(14,2)"
+
+    def _connect(self):
+        import psycopg
+
+        return psycopg.connect(
+            host=PG_HOST,
+            port=PG_PORT,
+            user=PG_USER,
+            password=PG_PASSWORD,
+            dbname=PG_DBNAME,
+        )
+
+    def connect(self):
+        self.conn = self._connect()
+        self.cursor = self.conn.cursor()
+
+    def bulk_load(self, source):
+        """Stream the source into ``COPY ... FROM STDIN`` as CSV."""
+        with self.cursor.copy(
+            f"COPY ad_insights ({', '.join(COLUMNS)}) FROM STDIN (FORMAT csv)"
+        ) as copy:
+            for chunk in self.csv_chunks(source):
+                copy.write(chunk)
+
+    def cleanup(self):
+        conn = self._connect()
+        conn.autocommit = True
+        conn.execute("DROP TABLE IF EXISTS ad_insights")
+        conn.close()
+
+
+class MySQLEngine(RowStoreEngine):
+    name = "mysql"
+    label = "MySQL"
+
+    def _connect(self, **kwargs):
+        import mysql.connector
+
+        return mysql.connector.connect(
+            host=MYSQL_HOST,
+            port=MYSQL_PORT,
+            user=MYSQL_USER,
+            password=MYSQL_PASSWORD,
+            **kwargs,
+        )
+
+    def connect(self):
+        self.conn = self._connect(autocommit=False, allow_local_infile=True)
+        self.cursor = self.conn.cursor()
+        self.cursor.execute(f"CREATE DATABASE IF NOT EXISTS `{DB_NAME}`")
+        self.conn.database = DB_NAME
+
+    def bulk_load(self, source):
+        """Write the source to a CSV file and load it with ``LOAD DATA LOCAL INFILE``.
+        Requires ``local_infile`` to be enabled on the server.
+        """
+        csv_path = os.path.join(DATA_DIR, "ad_insights.csv")
+        with open(csv_path, "wb") as f:
+            for chunk in self.csv_chunks(source):
+                f.write(chunk)
+        try:
+            self.cursor.execute(f"""
+                LOAD DATA LOCAL INFILE '{sql_path(csv_path)}'
+                INTO TABLE ad_insights
+                FIELDS TERMINATED BY ',' OPTIONALLY ENCLOSED BY '"' ESCAPED BY ''
+                LINES TERMINATED BY '\\n'
+                ({', '.join(COLUMNS)})
+            """)
+        finally:
+            os.remove(csv_path)
+
+    def cleanup(self):
+        conn = self._connect(autocommit=True)
+        cursor = conn.cursor()
+        cursor.execute(f"DROP DATABASE IF EXISTS `{DB_NAME}`")
+        cursor.close()
+        conn.close()
+
+
+# ---------------------------------------------------------------------------
+# DuckDB
+# ---------------------------------------------------------------------------
+class DuckDBEngine(Engine):
+    """DuckDB with the data loaded into a native table in a database file."""
+
+    name = "duckdb"
+    label = "DuckDB"
+
+    def __init__(self):
+        super().__init__()
+        self.result = None
+
+    def connect(self):
+        import duckdb
+
+        os.makedirs(os.path.dirname(DUCKDB_DB_PATH), exist_ok=True)
+        self.conn = duckdb.connect(DUCKDB_DB_PATH)
+        self.cursor = self.conn
+
+    def load(self, source, mode=LOAD_MODE):
+        """Copy the source into a table sorted by the dashboard filter columns."""
+        self.conn.execute(f"""
+            CREATE OR REPLACE TABLE ad_insights AS
+            SELECT {", ".join(COLUMNS)}
+            FROM read_parquet('{sql_path(source)}')
+            ORDER BY client_id, channel_id, date, id
+        """)
+
+    def worker(self):
+        """Share the loaded database through a new DuckDB connection (``cursor``)."""
+        engine = copy.copy(self)
+        engine.conn = engine.cursor = self.conn.cursor()
+        engine.result = None
+        return engine
+
+    def run(self, sql):
+        self.result = self.conn.execute(sql)
+
+    def fetch(self):
+        return self.result.fetchall()
+
+    def close(self):
+        if self.conn is not None:
+            self.conn.close()
+        self.conn = None
+        self.cursor = None
+
+    def cleanup(self):
+        for path in (DUCKDB_DB_PATH, f"{DUCKDB_DB_PATH}.wal"):
+            if os.path.exists(path):
+                os.remove(path)
+
+
+class DuckDBParquetEngine(DuckDBEngine):
+    """DuckDB querying Hive-partitioned Parquet files in place."""
+
+    name = "duckdb-parquet"
+    label = "DuckDB+Parquet"
+
+    def __init__(self):
+        super().__init__()
+        self.table = (
+            f"read_parquet('{sql_path(PARQUET_BASE)}/**/*.parquet', hive_partitioning=true)"
+        )
+
+    def connect(self):
+        import duckdb
+
+        self.conn = duckdb.connect(":memory:")
+        self.cursor = self.conn
+
+    def load(self, source, mode=LOAD_MODE):
+        """Write the source as Parquet, Hive-partitioned by the composite key ``k``."""
+        if os.path.exists(PARQUET_BASE):
+            shutil.rmtree(PARQUET_BASE)
+        self.conn.execute(f"""
+            COPY (SELECT * FROM read_parquet('{sql_path(source)}'))
+            TO '{sql_path(PARQUET_BASE)}'
+            (FORMAT PARQUET, PARTITION_BY (k), COMPRESSION 'snappy', OVERWRITE_OR_IGNORE 1)
+        """)
+
+    def match(self, client_ids, channel_ids):
+        """Filter on the partition key so DuckDB prunes whole partition directories."""
+        clients = client_ids or range(1, NUM_CLIENTS + 1)
+        channels = channel_ids or range(1, NUM_CHANNELS + 1)
+        return f"k IN ({make_k_in(clients, channels)})"
+
+    def cleanup(self):
+        if os.path.exists(PARQUET_BASE):
+            shutil.rmtree(PARQUET_BASE)
+
+
+ENGINES = {
+    engine.name: engine
+    for engine in (
+        SQLiteEngine,
+        PostgreSQLEngine,
+        MySQLEngine,
+        DuckDBEngine,
+        DuckDBParquetEngine,
+    )
+}
@@ -0,0 +1,247 @@
+"""Parquet layout sweep: the same dataset written several ways, queried with one catalog.
+
+Each layout is a partitioning scheme plus sort order and row-group size; every
+layout is written once per compression codec and queried through DuckDB exactly
+like the ``duckdb-parquet`` engine. Adding a layout means adding one entry to
+``LAYOUTS``.
+"""
+
+import os
+import shutil
+import time
+
+from bench.config import (
+    DATA_DIR,
+    LAYOUT_ROW_GROUP_SIZE,
+    LOAD_MODE,
+    NUM_RUNS,
+    SOURCE_PARQUET,
+)
+from bench.core import time_query
+from bench.dataset import COLUMNS, sql_path
+from bench.engines import DuckDBParquetEngine, Engine
+
+LAYOUT_DIR = os.path.join(DATA_DIR, "layouts")
+COMPRESSIONS = ("snappy", "zstd")
+
+# partition_by: Hive partition columns, outermost first (None = one unpartitioned file).
+# extra: derived columns written alongside COLUMNS.
+# filter_on_k: render client/channel filters as ``k IN (...)`` instead of
+#   client_id / channel_id predicates, which the other layouts prune on directly.
+LAYOUTS = {
+    "k": {
+        "description": "Composite client+channel key k (current layout, 1,000 dirs)",
+        "partition_by": ["k"],
+        "extra": ["k"],
+        "order_by": None,
+        "row_group_size": None,
+        "filter_on_k": True,
+    },
+    "client": {
+        "description": "client_id only (100 dirs)",
+        "partition_by": ["client_id"],
+        "extra": [],
+        "order_by": None,
+        "row_group_size": None,
+        "filter_on_k": False,
+    },
+    "client-channel": {
+        "description": "client_id / channel_id nested (100 x 10 dirs)",
+        "partition_by": ["client_id", "channel_id"],
+        "extra": [],
+        "order_by": None,
+        "row_group_size": None,
+        "filter_on_k": False,
+    },
+    "client-month": {
+        "description": "client_id / month nested (100 x 12 dirs)",
+        "partition_by": ["client_id", "month"],
+        "extra": ["MONTH(date) AS month"],
+        "order_by": None,
+        "row_group_size": None,
+        "filter_on_k": False,
+    },
+    "sorted": {
+        "description": (
+            f"Unpartitioned, sorted by client, channel, date; "
+            f"{LAYOUT_ROW_GROUP_SIZE:,}-row row groups"
+        ),
+        "partition_by": None,
+        "extra": [],
+        "order_by": "client_id, channel_id, date",
+        "row_group_size": LAYOUT_ROW_GROUP_SIZE,
+        "filter_on_k": False,
+    },
+}
+
+
+class ParquetLayoutEngine(DuckDBParquetEngine):
+    """DuckDB over the dataset written in one of ``LAYOUTS`` with one codec."""
+
+    def __init__(self, layout, compression):
+        super().__init__()
+        self.layout_name = layout
+        self.layout = LAYOUTS[layout]
+        self.compression = compression
+        self.name = f"{layout}-{compression}"
+        self.label = f"{layout} / {compression}"
+        self.path = os.path.join(LAYOUT_DIR, self.name)
+        self.table = (
+            f"read_parquet('{sql_path(self.path)}/**/*.parquet', hive_partitioning=true)"
+        )
+
+    def load(self, source, mode=LOAD_MODE):
+        """Write the source in this layout: partitioning, sort order, row groups, codec."""
+        layout = self.layout
+        if os.path.exists(self.path):
+            shutil.rmtree(self.path)
+        select = (
+            f"SELECT {', '.join(COLUMNS + layout['extra'])} "
+            f"FROM read_parquet('{sql_path(source)}')"
+        )
+        if layout["order_by"]:
+            select += f" ORDER BY {layout['order_by']}"
+        options = ["FORMAT PARQUET", f"COMPRESSION '{self.compression}'"]
+        if layout["row_group_size"]:
+            options.append(f"ROW_GROUP_SIZE {layout['row_group_size']}")
+        if layout["partition_by"]:
+            options.append(f"PARTITION_BY ({', '.join(layout['partition_by'])})")
+            target = self.path
+        else:
+            os.makedirs(self.path)
+            target = os.path.join(self.path, "data.parquet")
+        self.conn.execute(
+            f"COPY ({select}) TO '{sql_path(target)}' ({', '.join(options)})"
+        )
+
+    def match(self, client_ids, channel_ids):
+        if self.layout["filter_on_k"]:
+            return super().match(client_ids, channel_ids)
+        return Engine.match(self, client_ids, channel_ids)
+
+    def storage(self):
+        """Return (file count, total bytes) of the written layout."""
+        files = 0
+        size = 0
+        for dirpath, _dirnames, filenames in os.walk(self.path):
+            for fname in filenames:
+                files += 1
+                size += os.path.getsize(os.path.join(dirpath, fname))
+        return files, size
+
+    def bytes_read(self, sql):
+        """Return the bytes DuckDB reads from Parquet files to answer ``sql``.
+        Sums the ``READ`` operations of DuckDB's FileSystem log, which count the
+        compressed column chunks and footers actually fetched. (The profiler's
+        ``total_bytes_read`` metric does not include Parquet scans.) Runs on a
+        fresh connection so DuckDB's in-memory file cache is empty.
+        """
+        import duckdb
+
+        conn = duckdb.connect(":memory:")
+        try:
+            conn.execute("CALL enable_logging('FileSystem')")
+            conn.execute(sql).fetchall()
+            (size,) = conn.execute("""
+                SELECT COALESCE(SUM(CAST(json_extract_string(message, '$.bytes') AS BIGINT)), 0)
+                FROM duckdb_logs
+                WHERE type = 'FileSystem' AND json_extract_string(message, '$.op') = 'READ'
+            """).fetchone()
+        finally:
+            conn.close()
+        return size
+
+    def cleanup(self):
+        if os.path.exists(self.path):
+            shutil.rmtree(self.path)
+
+
+def run_layout_sweep(
+    layouts, compressions, queries, runs=NUM_RUNS, source=SOURCE_PARQUET
+):
+    """Write every layout x codec combination, then time the catalog on each.
+    One layout is written and queried at a time, then removed, so disk usage
+    stays at one copy of the dataset (plus the source) during the sweep.
+    Args:
+        layouts: Layout names from ``LAYOUTS``.
+        compressions: Codecs from ``COMPRESSIONS``.
+        queries: Query definition dicts from ``bench.queries``.
+        runs: Number of runs per query (median reported).
+        source: Path to the generated Parquet file.
+    Returns:
+        A tuple of (engines, stats, results). ``stats`` maps engine name to a
+        dict with ``write_ms``, ``files`` and ``bytes``; ``results`` is a list
+        of result dicts like run_benchmarks() returns, with an extra
+        ``bytes_read`` dict keyed by engine name.
+    """
+    print("\n=== Step 2: Writing and querying Parquet layouts ===\n")
+    engines = []
+    stats = {}
+    results = [
+        {
+            "id": q["id"],
+            "name": q["name"],
+            "category": q["category"],
+            "headers": q["headers"],
+            "ms": {},
+            "rows": {},
+            "bytes_read": {},
+        }
+        for q in queries
+    ]
+    os.makedirs(LAYOUT_DIR, exist_ok=True)
+    for layout in layouts:
+        for compression in compressions:
+            engine = ParquetLayoutEngine(layout, compression)
+            engine.connect()
+            print(f"  {engine.label:<24}", end="", flush=True)
+            t0 = time.perf_counter()
+            engine.load(source)
+            write_ms = (time.perf_counter() - t0) * 1000
+            files, size = engine.storage()
+            stats[engine.name] = {"write_ms": write_ms, "files": files, "bytes": size}
+
+            for q, r in zip(queries, results):
+                sql = engine.translate(q)
+                r["bytes_read"][engine.name] = engine.bytes_read(sql)
+                r["ms"][engine.name], r["rows"][engine.name] = time_query(
+                    engine, sql, runs
+                )
+            engine.close()
+            engine.cleanup()
+            engines.append(engine)
+
+            total_ms = sum(r["ms"][engine.name] for r in results)
+            print(
+                f"{files:>6,} files | {size / (1024 * 1024):>8.2f} MB | "
+                f"write {write_ms:>7,.0f} ms | queries {total_ms:>8,.1f} ms"
+            )
+    if os.path.exists(LAYOUT_DIR):
+        shutil.rmtree(LAYOUT_DIR)
+    check_codec_reads(engines, results)
+    return engines, stats, results
+
+
+def check_codec_reads(engines, results):
+    """Warn for every layout where zstd did not read fewer bytes than snappy.
+    zstd compresses the same column chunks tighter, so a layout swept with both
+    codecs must read less with zstd; equal totals mean bytes read is not being
+    measured from the Parquet data.
+    Returns:
+        The layout names that failed the check.
+    """
+    by_name = {e.name: e for e in engines}
+    failed = []
+    for layout in dict.fromkeys(e.layout_name for e in engines):
+        snappy, zstd = f"{layout}-snappy", f"{layout}-zstd"
+        if snappy not in by_name or zstd not in by_name:
+            continue
+        snappy_read = sum(r["bytes_read"][snappy] for r in results)
+        zstd_read = sum(r["bytes_read"][zstd] for r in results)
+        if zstd_read >= snappy_read:
+            print(
+                f"  WARNING: {layout}: zstd read {zstd_read:,} bytes, "
+                f"not less than snappy's {snappy_read:,}"
+            )
+            failed.append(layout)
+    return failed
@@ -0,0 +1,504 @@
+"""Shared benchmark query catalog.
+
+Every query is written once as a template; engine adapters render it into their
+own SQL dialect (see ``Engine.translate``). Placeholders:
+
+  {table}    the ad_insights relation — a table, or ``read_parquet(...)``.
+  {filter}   the client/channel predicate from the query's ``filter`` entry,
+             rendered as ``client_id``/``channel_id`` comparisons for tables and
+             as ``k IN (...)`` for Hive-partitioned Parquet so DuckDB can prune.
+  {month}    the month number of ``date``.
+  {numeric}  the cast PostgreSQL needs before ROUND on a float expression.
+
+``filter`` is a ``(client_ids, channel_ids)`` pair where ``None`` means all.
+
+Queries are organized into categories that mirror real dashboard needs:
+  A) Accuracy Verification       — prove all engines return identical results.
+  B) Dashboard Filters           — multi-criteria filtering with date ranges.
+  C) Sorting & Ranking           — ORDER BY on raw and computed metrics.
+  D) Time Series & Widgets       — aggregations for charts and KPI cards.
+  E) Partition & Columnar Proof  — queries designed to expose the full-scan
+     penalty of row stores vs Hive partition pruning + columnar reads.
+  F) Row-Based Fetching          — narrow point-lookups where row stores shine.
+"""
+
+QUERIES = [
+    # =================================================================
+    # A) Accuracy Verification
+    # =================================================================
+    {
+        "id": "A1",
+        "name": "Total row count",
+        "category": "Accuracy Verification",
+        "headers": ["total_rows"],
+        "filter": None,
+        "sql": """
+            SELECT COUNT(*) AS total_rows
+            FROM {table}
+        """,
+    },
+    {
+        "id": "A2",
+        "name": "Global SUM aggregates",
+        "category": "Accuracy Verification",
+        "headers": [
+            "total_impressions",
+            "total_clicks",
+            "total_spend",
+            "total_conversions",
+        ],
+        "filter": None,
+        "sql": """
+            SELECT SUM(impressions) AS total_impressions,
+                   SUM(clicks)      AS total_clicks,
+                   ROUND(SUM(spend){numeric}, 2) AS total_spend,
+                   SUM(conversions)  AS total_conversions
+            FROM {table}
+        """,
+    },
+    {
+        "id": "A3",
+        "name": "Per-channel breakdown (client 1)",
+        "category": "Accuracy Verification",
+        "headers": [
+            "channel_id",
+            "row_count",
+            "total_impressions",
+            "total_clicks",
+            "total_spend",
+            "total_conversions",
+        ],
+        "filter": ([1], None),
+        "sql": """
+            SELECT channel_id,
+                   COUNT(*)          AS row_count,
+                   SUM(impressions)  AS total_impressions,
+                   SUM(clicks)       AS total_clicks,
+                   ROUND(SUM(spend){numeric}, 2) AS total_spend,
+                   SUM(conversions)  AS total_conversions
+            FROM {table}
+            WHERE {filter}
+            GROUP BY channel_id
+            ORDER BY channel_id
+        """,
+    },
+    # =================================================================
+    # B) Dashboard Filters
+    # =================================================================
+    {
+        "id": "B1",
+        "name": "Single client + channel + month filter",
+        "category": "Dashboard Filters",
+        "headers": [
+            "id",
+            "ad_id",
+            "ad_name",
+            "impressions",
+            "clicks",
+            "spend",
+            "conversions",
+            "date",
+        ],
+        "filter": ([1], [1]),
+        "sql": """
+            SELECT id, ad_id, ad_name, impressions, clicks, spend,
+                   conversions, date
+            FROM {table}
+            WHERE {filter}
+              AND date BETWEEN '2024-06-01' AND '2024-06-30'
+            ORDER BY date, id
+            LIMIT 500
+        """,
+    },
+    {
+        "id": "B2",
+        "name": "Multi-client + channels + Q3 + spend threshold",
+        "category": "Dashboard Filters",
+        "headers": [
+            "client_id",
+            "channel_id",
+            "campaign_id",
+            "campaign_name",
+            "total_impressions",
+            "total_clicks",
+            "total_spend",
+            "total_conversions",
+        ],
+        "filter": ([1, 15, 30, 50, 75, 100], [1, 2, 5]),
+        "sql": """
+            SELECT client_id, channel_id, campaign_id, campaign_name,
+                   SUM(impressions) AS total_impressions,
+                   SUM(clicks)      AS total_clicks,
+                   ROUND(SUM(spend){numeric}, 2) AS total_spend,
+                   SUM(conversions)  AS total_conversions
+            FROM {table}
+            WHERE {filter}
+              AND date BETWEEN '2024-07-01' AND '2024-09-30'
+            GROUP BY client_id, channel_id, campaign_id, campaign_name
+            HAVING SUM(spend) > 1000
+            ORDER BY total_spend DESC
+            LIMIT 20
+        """,
+    },
+    {
+        "id": "B3",
+        "name": "Campaign name search (LIKE) + date range",
+        "category": "Dashboard Filters",
+        "headers": [
+            "campaign_id",
+            "campaign_name",
+            "channel_id",
+            "total_impressions",
+            "total_clicks",
+            "total_spend",
+        ],
+        "filter": ([2], None),
+        "sql": """
+            SELECT campaign_id, campaign_name, channel_id,
+                   SUM(impressions) AS total_impressions,
+                   SUM(clicks)      AS total_clicks,
+                   ROUND(SUM(spend){numeric}, 2) AS total_spend
+            FROM {table}
+            WHERE {filter}
+              AND campaign_name LIKE '%Retargeting%'
+              AND date BETWEEN '2024-01-01' AND '2024-06-30'
+            GROUP BY campaign_id, campaign_name, channel_id
+            ORDER BY total_spend DESC
+        """,
+    },
+    # =================================================================
+    # C) Sorting & Ranking
+    # =================================================================
+    {
+        "id": "C1",
+        "name": "Top 10 ads by total spend",
+        "category": "Sorting & Ranking",
+        "headers": [
+            "ad_id",
+            "ad_name",
+            "channel_id",
+            "total_impressions",
+            "total_clicks",
+            "total_spend",
+            "total_conversions",
+        ],
+        "filter": ([1], None),
+        "sql": """
+            SELECT ad_id, ad_name, channel_id,
+                   SUM(impressions) AS total_impressions,
+                   SUM(clicks)      AS total_clicks,
+                   ROUND(SUM(spend){numeric}, 2) AS total_spend,
+                   SUM(conversions)  AS total_conversions
+            FROM {table}
+            WHERE {filter}
+            GROUP BY ad_id, ad_name, channel_id
+            ORDER BY total_spend DESC
+            LIMIT 10
+        """,
+    },
+    {
+        "id": "C2",
+        "name": "Top campaigns by CTR (computed metric sort)",
+        "category": "Sorting & Ranking",
+        "headers": [
+            "campaign_id",
+            "campaign_name",
+            "channel_id",
+            "total_clicks",
+            "total_impressions",
+            "ctr_pct",
+        ],
+        "filter": ([3], None),
+        "sql": """
+            SELECT campaign_id, campaign_name, channel_id,
+                   SUM(clicks)      AS total_clicks,
+                   SUM(impressions)  AS total_impressions,
+                   ROUND((SUM(clicks) * 100.0
+                          / NULLIF(SUM(impressions), 0)){numeric}, 4) AS ctr_pct
+            FROM {table}
+            WHERE {filter}
+              AND date BETWEEN '2024-01-01' AND '2024-12-31'
+            GROUP BY campaign_id, campaign_name, channel_id
+            HAVING SUM(impressions) > 10000
+            ORDER BY ctr_pct DESC
+            LIMIT 10
+        """,
+    },
+    {
+        "id": "C3",
+        "name": "Worst cost-per-conversion (bottom performers)",
+        "category": "Sorting & Ranking",
+        "headers": [
+            "ad_id",
+            "ad_name",
+            "channel_id",
+            "total_spend",
+            "total_conversions",
+            "cost_per_conv",
+        ],
+        "filter": ([2], None),
+        "sql": """
+            SELECT ad_id, ad_name, channel_id,
+                   ROUND(SUM(spend){numeric}, 2) AS total_spend,
+                   SUM(conversions)  AS total_conversions,
+                   ROUND((SUM(spend)
+                          / NULLIF(SUM(conversions), 0)){numeric}, 2) AS cost_per_conv
+            FROM {table}
+            WHERE {filter}
+              AND date BETWEEN '2024-01-01' AND '2024-12-31'
+            GROUP BY ad_id, ad_name, channel_id
+            HAVING SUM(conversions) > 0
+            ORDER BY cost_per_conv DESC
+            LIMIT 10
+        """,
+    },
+    # =================================================================
+    # D) Time Series & Widgets
+    # =================================================================
+    {
+        "id": "D1",
+        "name": "Daily spend trend (line chart — June 2024)",
+        "category": "Time Series & Widgets",
+        "headers": [
+            "date",
+            "daily_impressions",
+            "daily_clicks",
+            "daily_spend",
+            "daily_conversions",
+        ],
+        "filter": ([1], [1]),
+        "sql": """
+            SELECT date,
+                   SUM(impressions) AS daily_impressions,
+                   SUM(clicks)      AS daily_clicks,
+                   ROUND(SUM(spend){numeric}, 2) AS daily_spend,
+                   SUM(conversions)  AS daily_conversions
+            FROM {table}
+            WHERE {filter}
+              AND date BETWEEN '2024-06-01' AND '2024-06-30'
+            GROUP BY date
+            ORDER BY date
+        """,
+    },
+    {
+        "id": "D2",
+        "name": "Monthly rollup by channel (bar chart — full year)",
+        "category": "Time Series & Widgets",
+        "headers": [
+            "month",
+            "channel_id",
+            "monthly_impressions",
+            "monthly_clicks",
+            "monthly_spend",
+            "monthly_conversions",
+        ],
+        "filter": ([1], None),
+        "sql": """
+            SELECT {month}       AS month,
+                   channel_id,
+                   SUM(impressions)  AS monthly_impressions,
+                   SUM(clicks)       AS monthly_clicks,
+                   ROUND(SUM(spend){numeric}, 2) AS monthly_spend,
+                   SUM(conversions)  AS monthly_conversions
+            FROM {table}
+            WHERE {filter}
+              AND date BETWEEN '2024-01-01' AND '2024-12-31'
+            GROUP BY {month}, channel_id
+            ORDER BY month, channel_id
+        """,
+    },
+    {
+        "id": "D3",
+        "name": "Channel spend distribution % (pie chart)",
+        "category": "Time Series & Widgets",
+        "headers": ["channel_id", "channel_spend", "pct_of_total"],
+        "filter": ([1], None),
+        "sql": """
+            SELECT channel_id,
+                   ROUND(SUM(spend){numeric}, 2) AS channel_spend,
+                   ROUND((SUM(spend) * 100.0 / (
+                       SELECT SUM(spend)
+                       FROM {table}
+                       WHERE {filter}
+                   )){numeric}, 2) AS pct_of_total
+            FROM {table}
+            WHERE {filter}
+            GROUP BY channel_id
+            ORDER BY channel_spend DESC
+        """,
+    },
+    # =================================================================
+    # E) Partition & Columnar Proof
+    #
+    # E1 is *designed* to be slow in row stores but fast in DuckDB:
+    #
+    # Row-store weakness:
+    #   - Filters on channel_id=2 WITHOUT client_id.  Neither composite
+    #     index (client_id, channel_id, date) nor (client_id, date)
+    #     starts with channel_id, so row stores fall back to a FULL TABLE
+    #     SCAN of all rows.
+    #   - Row-store reads every column of every row even though we only
+    #     need date, impressions, clicks, spend, and conversions.
+    #
+    # DuckDB + Parquet advantage:
+    #   - Hive partition pruning: k IN (...) targets exactly the 100
+    #     partitions for channel 2 (one per client) out of 1,000 total,
+    #     skipping 90% of the data at the filesystem level.
+    #   - Columnar reads: Parquet files store each column separately,
+    #     so DuckDB reads only the 5 columns needed (date, impressions,
+    #     clicks, spend, conversions), ignoring the other 8+ columns.
+    #   - Snappy compression on individual columns further reduces I/O.
+    # =================================================================
+    {
+        "id": "E1",
+        "name": "Channel-only filter: monthly rollup across all clients",
+        "category": "Partition & Columnar Proof",
+        "headers": [
+            "month",
+            "row_count",
+            "total_impressions",
+            "total_clicks",
+            "total_spend",
+            "total_conversions",
+        ],
+        "filter": (None, [2]),
+        "sql": """
+            SELECT {month}       AS month,
+                   COUNT(*)          AS row_count,
+                   SUM(impressions)  AS total_impressions,
+                   SUM(clicks)       AS total_clicks,
+                   ROUND(SUM(spend){numeric}, 2) AS total_spend,
+                   SUM(conversions)  AS total_conversions
+            FROM {table}
+            WHERE {filter}
+              AND date BETWEEN '2024-01-01' AND '2024-12-31'
+            GROUP BY {month}
+            ORDER BY month
+        """,
+    },
+    # -----------------------------------------------------------------
+    # E2: Ad-level rollup with computed metrics for a single client.
+    #
+    # This query DOES include client_id — matching real dashboard usage.
+    #
+    # Row-store weakness (despite the index being usable):
+    #   - The composite index (client_id, channel_id, date) narrows to
+    #     ~1M rows for client_id=1, but impressions, clicks, spend, and
+    #     conversions are NOT in the index.  For every matching row the
+    #     engine must perform a RANDOM I/O "bookmark lookup" back to the
+    #     table to fetch those column values.
+    #   - High-cardinality GROUP BY (ad_id) creates many hash buckets,
+    #     each accumulated one row at a time.
+    #
+    # DuckDB + Parquet advantage:
+    #   - Partition pruning: k IN (...) reads only 10 out of 1,000
+    #     partitions (client 1, all 10 channels) — 99% pruned.
+    #   - Columnar reads: DuckDB reads only the 7 columns referenced and
+    #     skips the other 6 entirely.  All reads are SEQUENTIAL.
+    #   - Vectorized hash aggregation processes thousands of rows per
+    #     CPU cycle vs row-at-a-time execution.
+    # -----------------------------------------------------------------
+    {
+        "id": "E2",
+        "name": "Ad-level rollup + computed CTR & CPA (single client)",
+        "category": "Partition & Columnar Proof",
+        "headers": [
+            "ad_id",
+            "ad_name",
+            "channel_id",
+            "total_impressions",
+            "total_clicks",
+            "total_spend",
+            "total_conversions",
+            "ctr_pct",
+            "cost_per_conv",
+        ],
+        "filter": ([1], None),
+        "sql": """
+            SELECT ad_id, ad_name, channel_id,
+                   SUM(impressions)  AS total_impressions,
+                   SUM(clicks)       AS total_clicks,
+                   ROUND(SUM(spend){numeric}, 2) AS total_spend,
+                   SUM(conversions)  AS total_conversions,
+                   ROUND((SUM(clicks) * 100.0
+                          / NULLIF(SUM(impressions), 0)){numeric}, 4) AS ctr_pct,
+                   ROUND((SUM(spend)
+                          / NULLIF(SUM(conversions), 0)){numeric}, 2) AS cost_per_conv
+            FROM {table}
+            WHERE {filter}
+              AND date BETWEEN '2024-01-01' AND '2024-12-31'
+            GROUP BY ad_id, ad_name, channel_id
+            ORDER BY total_spend DESC
+            LIMIT 50
+        """,
+    },
+    # =================================================================
+    # F) Row-Based Fetching (row-store strength)
+    # =================================================================
+    {
+        "id": "F1",
+        "name": "SELECT * for specific client/date (Row fetch)",
+        "category": "Row-Based Fetching",
+        "headers": [
+            "id",
+            "client_id",
+            "channel_id",
+            "ad_account_id",
+            "campaign_id",
+            "campaign_name",
+            "ad_id",
+            "ad_name",
+            "impressions",
+            "clicks",
+            "spend",
+            "conversions",
+            "date",
+        ],
+        "filter": ([5], None),
+        "sql": """
+            SELECT id, client_id, channel_id, ad_account_id,
+                   campaign_id, campaign_name, ad_id, ad_name,
+                   impressions, clicks, spend, conversions, date
+            FROM {table}
+            WHERE {filter}
+              AND date BETWEEN '2024-01-01' AND '2024-01-31'
+            ORDER BY date, id
+        """,
+    },
+]
+
+
+def select_queries(ids=None):
+    """Return the catalog entries with the given ids, in catalog order.
+    Args:
+        ids: Iterable of query ids such as ``["B1", "C1"]``; ``None`` for all.
+    Returns:
+        A list of query definition dicts.
+    """
+    if ids is None:
+        return list(QUERIES)
+    wanted = {i.upper() for i in ids}
+    unknown = wanted - {q["id"] for q in QUERIES}
+    if unknown:
+        raise ValueError(f"Unknown query ids: {', '.join(sorted(unknown))}")
+    return [q for q in QUERIES if q["id"] in wanted]
+
+
+def parse_mix(specs):
+    """Parse a weighted query mix such as ``["B1=5", "C1=3", "D1"]``.
+    Args:
+        specs: Iterable of ``ID`` or ``ID=WEIGHT`` strings; a bare id has weight 1.
+    Returns:
+        A list of (query definition dict, weight) pairs, in the order given.
+    """
+    mix = []
+    for spec in specs:
+        query_id, _, weight = spec.partition("=")
+        try:
+            weight = float(weight) if weight else 1.0
+        except ValueError:
+            raise ValueError(f"Invalid weight in query mix entry: {spec}") from None
+        if weight <= 0:
+            raise ValueError(f"Query mix weights must be positive: {spec}")
+        mix.append((select_queries([query_id])[0], weight))
+    return mix
@@ -0,0 +1,571 @@
+"""Result files and console summary for a multi-engine benchmark run."""
+
+import os
+from datetime import datetime
+from decimal import Decimal
+
+from bench.concurrency import percentile
+from bench.config import (
+    COMPARISON_FILE,
+    CONCURRENCY_FILE,
+    LAYOUTS_FILE,
+    DATE_END,
+    DATE_START,
+    LOAD_MODE,
+    NUM_CHANNELS,
+    NUM_CLIENTS,
+    NUM_RUNS,
+    PARQUET_BASE,
+    RESULTS_DIR,
+)
+
+
+def normalize_value(val):
+    """Normalize a query result value for cross-engine comparison.
+    Converts Decimal, date, and other types to standard Python types
+    so results from different engines can be compared accurately.
+    Args:
+        val: A single value from a query result row.
+    Returns:
+        The normalized value.
+    """
+    if val is None:
+        return None
+    if isinstance(val, Decimal):
+        return float(val)
+    if hasattr(val, "isoformat"):
+        return str(val)
+    return val
+
+
+def results_match(rows_a, rows_b, float_tolerance=0.02):
+    """Check if two result sets match within tolerance for floating-point values.
+    Args:
+        rows_a: First result set (list of tuples).
+        rows_b: Second result set (list of tuples).
+        float_tolerance: Maximum allowed difference for float comparisons.
+    Returns:
+        A tuple of (is_match: bool, detail: str).
+    """
+    if len(rows_a) != len(rows_b):
+        return False, f"Row count differs: {len(rows_a)} vs {len(rows_b)}"
+
+    for i, (ra, rb) in enumerate(zip(rows_a, rows_b)):
+        na = tuple(normalize_value(v) for v in ra)
+        nb = tuple(normalize_value(v) for v in rb)
+        if len(na) != len(nb):
+            return False, f"Row {i}: column count differs ({len(na)} vs {len(nb)})"
+        for j, (va, vb) in enumerate(zip(na, nb)):
+            if isinstance(va, (int, float)) and isinstance(vb, (int, float)):
+                if abs(float(va) - float(vb)) > float_tolerance:
+                    return False, f"Row {i}, col {j}: {va} vs {vb}"
+            else:
+                if str(va) != str(vb):
+                    return False, f"Row {i}, col {j}: '{va}' vs '{vb}'"
+
+    return True, "All values match"
+
+
+def results_file(engine):
+    """Return the per-engine result file path, e.g. ``results_sqlite.txt``."""
+    return os.path.join(RESULTS_DIR, f"results_{engine.name.replace('-', '_')}.txt")
+
+
+def _speedup(baseline_ms, ms):
+    return baseline_ms / ms if ms > 0 else float("inf")
+
+
+def _all_match(r, engines):
+    baseline = r["rows"][engines[0].name]
+    return all(results_match(baseline, r["rows"][e.name])[0] for e in engines[1:])
+
+
+def _ms(value):
+    return "—" if value is None else f"{value:,.0f}"
+
+
+def _table(rows, headers):
+    from tabulate import tabulate
+
+    return tabulate(rows, headers=headers, tablefmt="simple", floatfmt=",.2f", intfmt=",")
+
+
+# ---------------------------------------------------------------------------
+# Result files
+# ---------------------------------------------------------------------------
+def write_single_engine_results(engine, results, num_rows):
+    """Write query results for a single engine to its result file.
+    Args:
+        engine: The engine adapter whose results are written.
+        results: List of result dicts from run_benchmarks().
+        num_rows: Number of rows in the dataset.
+    Returns:
+        The path of the written file.
+    """
+    filepath = results_file(engine)
+    with open(filepath, "w", encoding="utf-8") as f:
+        f.write(f"{'=' * 72}\n")
+        f.write(f"  {engine.label} Query Results\n")
+        f.write(f"  Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+        f.write(
+            f"  Dataset: {num_rows:,} rows | "
+            f"{NUM_CLIENTS} clients | {NUM_CHANNELS} channels\n"
+        )
+        f.write(f"{'=' * 72}\n\n")
+
+        for r in results:
+            rows = r["rows"][engine.name]
+            f.write(f"{'─' * 72}\n")
+            f.write(f"[{r['id']}] {r['name']}\n")
+            f.write(f"Category: {r['category']}\n")
+            f.write(f"Time: {r['ms'][engine.name]:,.1f} ms | Rows: {len(rows):,}\n")
+            f.write(f"{'─' * 72}\n")
+            f.write(_table(rows, r["headers"]) if rows else "(no rows)")
+            f.write("\n\n")
+    return filepath
+
+
+def write_comparison_file(
+    engines, results, load_ms, num_rows, runs=NUM_RUNS, load_mode=LOAD_MODE
+):
+    """Write a combined comparison file with side-by-side results.
+    Speedups and accuracy checks are relative to the first (baseline) engine.
+    Args:
+        engines: Engine adapters in report order.
+        results: List of result dicts from run_benchmarks().
+        load_ms: Load time dicts per engine name, from load_engines().
+        num_rows: Number of rows in the dataset.
+        runs: Number of runs per query (median reported).
+        load_mode: Row-store load path the engines were loaded with.
+    """
+    from tabulate import tabulate
+
+    baseline = engines[0]
+    others = engines[1:]
+    labels = " vs ".join(e.label for e in engines)
+
+    with open(COMPARISON_FILE, "w", encoding="utf-8") as f:
+        # === Header ===
+        f.write("=" * 78 + "\n")
+        f.write(f"  BENCHMARK COMPARISON: {labels}\n")
+        f.write(
+            f"  Dataset:    {num_rows:,} rows | "
+            f"{NUM_CLIENTS} clients | {NUM_CHANNELS} channels\n"
+        )
+        f.write(f"  Date range: {DATE_START.date()} to {DATE_END.date()}\n")
+        f.write(f"  Generated:  {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+        f.write(f"  Runs/query: {runs} (median time reported)\n")
+        f.write(f"  Baseline:   {baseline.label}\n")
+        f.write("=" * 78 + "\n\n")
+
+        # === Load times ===
+        f.write(f"LOAD TIME ({load_mode} load path)\n")
+        f.write("-" * 78 + "\n")
+        f.write(
+            tabulate(
+                [
+                    [
+                        e.label,
+                        _ms(load_ms[e.name]["data"]),
+                        _ms(load_ms[e.name]["indexes"]),
+                        _ms(load_ms[e.name]["total"]),
+                    ]
+                    for e in engines
+                ],
+                headers=["Engine", "Data (ms)", "Indexes (ms)", "Total (ms)"],
+                tablefmt="simple",
+                disable_numparse=True,
+                colalign=("left", "right", "right", "right"),
+            )
+        )
+        f.write("\n\n")
+
+        # === Performance Summary Table ===
+        f.write("PERFORMANCE SUMMARY\n")
+        f.write("-" * 78 + "\n")
+        summary_rows = []
+        totals = dict.fromkeys((e.name for e in engines), 0.0)
+        match_count = 0
+        for r in results:
+            matched = _all_match(r, engines)
+            match_count += matched
+            for e in engines:
+                totals[e.name] += r["ms"][e.name]
+            summary_rows.append(
+                [r["id"], r["name"]]
+                + [f"{r['ms'][e.name]:,.1f}" for e in engines]
+                + [
+                    f"{_speedup(r['ms'][baseline.name], r['ms'][e.name]):.1f}x"
+                    for e in others
+                ]
+                + ["YES" if matched else "NO"]
+            )
+        summary_rows.append(
+            ["", "─" * 40] + ["─" * 9] * len(engines) + ["─" * 7] * len(others) + ["─" * 5]
+        )
+        summary_rows.append(
+            ["", "TOTAL"]
+            + [f"{totals[e.name]:,.1f}" for e in engines]
+            + [f"{_speedup(totals[baseline.name], totals[e.name]):.1f}x" for e in others]
+            + [f"{match_count}/{len(results)}"]
+        )
+        f.write(
+            tabulate(
+                summary_rows,
+                headers=["#", "Query"]
+                + [f"{e.label} (ms)" for e in engines]
+                + [f"{e.label} speedup" for e in others]
+                + ["Match"],
+                tablefmt="simple",
+                disable_numparse=True,
+                colalign=("left", "left")
+                + ("right",) * (len(engines) + len(others))
+                + ("center",),
+            )
+        )
+        f.write("\n\n")
+
+        # === Detailed Results ===
+        f.write("=" * 78 + "\n")
+        f.write("DETAILED QUERY RESULTS (side-by-side)\n")
+        f.write("=" * 78 + "\n\n")
+
+        for r in results:
+            f.write("─" * 78 + "\n")
+            f.write(f"[{r['id']}] {r['name']}\n")
+            f.write(f"Category:    {r['category']}\n")
+            for e in engines:
+                line = f"{e.label + ':':<16}{r['ms'][e.name]:,.1f} ms "
+                line += f"({len(r['rows'][e.name]):,} rows)"
+                if e is not baseline:
+                    speedup = _speedup(r["ms"][baseline.name], r["ms"][e.name])
+                    matched, detail = results_match(
+                        r["rows"][baseline.name], r["rows"][e.name]
+                    )
+                    line += f" | {speedup:.1f}x | {'PASS' if matched else 'FAIL'} — {detail}"
+                f.write(line + "\n")
+            f.write("─" * 78 + "\n\n")
+
+            for e in engines:
+                f.write(f"  >>> {e.label} Result:\n")
+                rows = r["rows"][e.name]
+                if rows:
+                    for line in _table(rows, r["headers"]).splitlines():
+                        f.write(f"  {line}\n")
+                else:
+                    f.write("  (no rows)\n")
+                f.write("\n")
+            f.write("\n")
+
+
+def _concurrency_rows(engines, results):
+    """One row per engine and query (plus an ``all`` row per engine)."""
+    cores = os.cpu_count() or 1
+    rows = []
+    for e in engines:
+        r = results[e.name]
+        latency_ms = {
+            "all": [ms for values in r["latency_ms"].values() for ms in values],
+            **r["latency_ms"],
+        }
+        for query_id, values in latency_ms.items():
+            rows.append(
+                [
+                    e.label if query_id == "all" else "",
+                    query_id,
+                    f"{len(values):,}",
+                    f"{len(values) / r['elapsed_s']:,.1f}",
+                    f"{percentile(values, 50):,.1f}",
+                    f"{percentile(values, 95):,.1f}",
+                    f"{percentile(values, 99):,.1f}",
+                    f"{r['cpu_s'] / r['elapsed_s'] / cores * 100:.0f}%"
+                    if query_id == "all"
+                    else "",
+                ]
+            )
+    return rows
+
+
+_CONCURRENCY_HEADERS = [
+    "Engine",
+    "Query",
+    "Queries",
+    "QPS",
+    "p50 (ms)",
+    "p95 (ms)",
+    "p99 (ms)",
+    "CPU",
+]
+
+
+def write_concurrency_file(engines, results, num_rows, mix, users, duration_s, think_ms):
+    """Write the concurrent-user simulation results.
+    Args:
+        engines: Engine adapters in report order.
+        results: Dict from run_concurrency(), keyed by engine name.
+        num_rows: Number of rows in the dataset.
+        mix: List of (query definition dict, weight) pairs.
+        users: Number of concurrent users.
+        duration_s: Measured window per engine, in seconds.
+        think_ms: Mean think time between a user's queries, in milliseconds.
+    """
+    from tabulate import tabulate
+
+    with open(CONCURRENCY_FILE, "w", encoding="utf-8") as f:
+        f.write("=" * 78 + "\n")
+        f.write(f"  CONCURRENT USERS: {' vs '.join(e.label for e in engines)}\n")
+        f.write(
+            f"  Dataset:    {num_rows:,} rows | "
+            f"{NUM_CLIENTS} clients | {NUM_CHANNELS} channels\n"
+        )
+        f.write(f"  Generated:  {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+        f.write(
+            f"  Users:      {users} | {duration_s:g} s per engine | "
+            f"think time exp(mean {think_ms:g} ms)\n"
+        )
+        f.write(
+            "  Query mix:  "
+            + ", ".join(f"{q['id']} x{weight:g}" for q, weight in mix)
+            + "\n"
+        )
+        f.write(
+            f"  CPU:        this process, user + system, as % of all cores "
+            f"({os.cpu_count() or 1}); PostgreSQL/MySQL server CPU is not included\n"
+        )
+        f.write("=" * 78 + "\n\n")
+        f.write(
+            tabulate(
+                _concurrency_rows(engines, results),
+                headers=_CONCURRENCY_HEADERS,
+                tablefmt="simple",
+                disable_numparse=True,
+                colalign=("left", "left") + ("right",) * 6,
+            )
+        )
+        f.write("\n\n")
+        f.write("Queries:\n")
+        for q, _weight in mix:
+            f.write(f"  [{q['id']}] {q['name']}\n")
+
+
+def _mb(size):
+    return f"{size / (1024 * 1024):,.2f}"
+
+
+def _layout_rows(engines, stats, results):
+    """One summary row per layout; accuracy is checked against the first layout."""
+    rows = []
+    for e in engines:
+        matched = sum(
+            results_match(r["rows"][engines[0].name], r["rows"][e.name])[0]
+            for r in results
+        )
+        rows.append(
+            [
+                e.label,
+                f"{stats[e.name]['files']:,}",
+                _mb(stats[e.name]["bytes"]),
+                f"{stats[e.name]['write_ms']:,.0f}",
+                _mb(sum(r["bytes_read"][e.name] for r in results)),
+                f"{sum(r['ms'][e.name] for r in results):,.1f}",
+                f"{matched}/{len(results)}",
+            ]
+        )
+    return rows
+
+
+_LAYOUT_HEADERS = [
+    "Layout / codec",
+    "Files",
+    "Size (MB)",
+    "Write (ms)",
+    "Read (MB)",
+    "Queries (ms)",
+    "Match",
+]
+
+
+def write_layouts_file(engines, stats, results, num_rows, runs=NUM_RUNS):
+    """Write the layout sweep: storage, bytes read and latency per layout.
+    Args:
+        engines: ParquetLayoutEngine instances in sweep order; the first is the
+            baseline for accuracy checks.
+        stats: Storage stats per engine name, from run_layout_sweep().
+        results: Result dicts from run_layout_sweep().
+        num_rows: Number of rows in the dataset.
+        runs: Number of runs per query (median reported).
+    """
+    from tabulate import tabulate
+
+    with open(LAYOUTS_FILE, "w", encoding="utf-8") as f:
+        f.write("=" * 78 + "\n")
+        f.write("  PARQUET LAYOUT SWEEP\n")
+        f.write(
+            f"  Dataset:    {num_rows:,} rows | "
+            f"{NUM_CLIENTS} clients | {NUM_CHANNELS} channels\n"
+        )
+        f.write(f"  Generated:  {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+        f.write(f"  Runs/query: {runs} (median time reported)\n")
+        f.write(f"  Baseline:   {engines[0].label}\n")
+        f.write(
+            "  Read (MB):  Parquet bytes read (DuckDB FileSystem log) per query on a"
+            " fresh connection, summed over the catalog\n"
+        )
+        f.write("=" * 78 + "\n\n")
+
+        f.write("LAYOUTS\n")
+        f.write("-" * 78 + "\n")
+        layouts = {e.layout_name: e.layout for e in engines}
+        for name, layout in layouts.items():
+            f.write(f"  {name:<16}{layout['description']}\n")
+        f.write("\n")
+
+        f.write("SUMMARY\n")
+        f.write("-" * 78 + "\n")
+        f.write(
+            tabulate(
+                _layout_rows(engines, stats, results),
+                headers=_LAYOUT_HEADERS,
+                tablefmt="simple",
+                disable_numparse=True,
+                colalign=("left",) + ("right",) * 5 + ("center",),
+            )
+        )
+        f.write("\n\n")
+
+        for title, key, fmt in (
+            ("LATENCY PER QUERY (ms)", "ms", lambda v: f"{v:,.1f}"),
+            ("BYTES READ PER QUERY (KB)", "bytes_read", lambda v: f"{v / 1024:,.0f}"),
+        ):
+            f.write(title + "\n")
+            f.write("-" * 78 + "\n")
+            f.write(
+                tabulate(
+                    [[r["id"]] + [fmt(r[key][e.name]) for e in engines] for r in results],
+                    headers=["#"] + [e.label for e in engines],
+                    tablefmt="simple",
+                    disable_numparse=True,
+                    colalign=("left",) + ("right",) * len(engines),
+                )
+            )
+            f.write("\n\n")
+
+        f.write("Queries:\n")
+        for r in results:
+            f.write(f"  [{r['id']}] {r['name']}\n")
+
+
+# ---------------------------------------------------------------------------
+# Console summary
+# ---------------------------------------------------------------------------
+def print_results(engines, results, load_ms):
+    """Print the benchmark performance summary and Parquet storage size.
+    Args:
+        engines: Engine adapters in report order; the first is the baseline.
+        results: List of result dicts from run_benchmarks().
+        load_ms: Load time dicts per engine name, from load_engines().
+    """
+    print("\n=== Step 5: Results ===\n")
+    from tabulate import tabulate
+
+    baseline = engines[0]
+
+    # Group by category
+    categories = []
+    for r in results:
+        if r["category"] not in categories:
+            categories.append(r["category"])
+
+    table_data = []
+    blank = [""] * (len(engines) + 1)
+    for cat in categories:
+        table_data.append([f"--- {cat} ---"] + blank)
+        for r in results:
+            if r["category"] != cat:
+                continue
+            table_data.append(
+                [f"  [{r['id']}] {r['name']}"]
+                + [f"{r['ms'][e.name]:,.1f}" for e in engines]
+                + ["YES" if _all_match(r, engines) else "NO"]
+            )
+    table_data.append(
+        ["Load (data only)"] + [_ms(load_ms[e.name]["data"]) for e in engines] + [""]
+    )
+    table_data.append(
+        ["Load (with indexes)"] + [_ms(load_ms[e.name]["total"]) for e in engines] + [""]
+    )
+
+    print(
+        tabulate(
+            table_data,
+            headers=["Query"] + [f"{e.label} (ms)" for e in engines] + ["Match"],
+            tablefmt="simple",
+            disable_numparse=True,
+            colalign=("left",) + ("right",) * len(engines) + ("center",),
+        )
+    )
+
+    # Totals
+    totals = {e.name: sum(r["ms"][e.name] for r in results) for e in engines}
+    match_count = sum(_all_match(r, engines) for r in results)
+    print(
+        "\nTotal:  "
+        + " | ".join(
+            f"{e.label} {totals[e.name]:,.1f} ms "
+            f"({_speedup(totals[baseline.name], totals[e.name]):.1f}x)"
+            for e in engines
+        )
+        + f" | Accuracy {match_count}/{len(results)} matched"
+    )
+
+    # File size comparison
+    parquet_size = 0
+    if os.path.exists(PARQUET_BASE):
+        for dirpath, _dirnames, filenames in os.walk(PARQUET_BASE):
+            for fname in filenames:
+                parquet_size += os.path.getsize(os.path.join(dirpath, fname))
+    if parquet_size:
+        print(f"\nParquet data size: {parquet_size / (1024 * 1024):.2f} MB\n")
+
+
+def print_concurrency_results(engines, results):
+    """Print throughput, latency percentiles and CPU use per engine and query.
+    Args:
+        engines: Engine adapters in report order.
+        results: Dict from run_concurrency(), keyed by engine name.
+    """
+    print("\n=== Step 5: Results ===\n")
+    from tabulate import tabulate
+
+    print(
+        tabulate(
+            _concurrency_rows(engines, results),
+            headers=_CONCURRENCY_HEADERS,
+            tablefmt="simple",
+            disable_numparse=True,
+            colalign=("left", "left") + ("right",) * 6,
+        )
+    )
+    print()
+
+
+def print_layout_results(engines, stats, results):
+    """Print the per-layout storage, bytes read and latency summary.
+    Args:
+        engines: ParquetLayoutEngine instances in sweep order.
+        stats: Storage stats per engine name, from run_layout_sweep().
+        results: Result dicts from run_layout_sweep().
+    """
+    print("\n=== Step 4: Results ===\n")
+    from tabulate import tabulate
+
+    print(
+        tabulate(
+            _layout_rows(engines, stats, results),
+            headers=_LAYOUT_HEADERS,
+            tablefmt="simple",
+            disable_numparse=True,
+            colalign=("left",) + ("right",) * 5 + ("center",),
+        )
+    )
+    print()
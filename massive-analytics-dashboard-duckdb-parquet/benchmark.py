@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+"""
+Benchmark: row stores vs DuckDB for ad analytics dashboard queries.
+Generates realistic ad performance data across 100 clients and 10 ad channels,
+loads the identical dataset into every selected engine, then runs the shared
+query catalog (A1–F1) that simulates common dashboard operations: filtering,
+sorting, aggregation, and time-series analysis.
+Engines:
+  - sqlite          — SQLite (embedded, file-based)
+  - postgresql      — PostgreSQL (local server)
+  - mysql           — MySQL (local server)
+  - duckdb          — DuckDB native table in a database file
+  - duckdb-parquet  — DuckDB over Hive-partitioned Parquet
+Result files:
+  - results_<engine>.txt    — raw query results per engine
+  - results_comparison.txt  — side-by-side comparison with accuracy checks
+Run from repo root:
+  uv run python benchmark.py --engines sqlite duckdb duckdb-parquet
+Simulate concurrent dashboard users instead of timing the catalog serially:
+  uv run python benchmark.py --users 50 --mix B1 C1 D1
+Sweep alternative Parquet layouts (partitioning, sort order, codec) instead:
+  uv run python benchmark.py --layouts
+Set SKIP_CLEANUP=1 to keep databases and Parquet files after the run.
+"""
+
+import argparse
+
+from bench.concurrency import run_concurrency
+from bench.config import (
+    COMPARISON_FILE,
+    CONCURRENCY_DURATION_S,
+    CONCURRENCY_FILE,
+    CONCURRENCY_MIX,
+    LAYOUTS_FILE,
+    LOAD_MODE,
+    LOAD_MODES,
+    NUM_ROWS,
+    NUM_RUNS,
+    SOURCE_PARQUET,
+    THINK_TIME_MS,
+)
+from bench.core import cleanup, load_engines, run_benchmarks
+from bench.dataset import generate_data
+from bench.engines import ENGINES
+from bench.layouts import COMPRESSIONS, LAYOUTS, run_layout_sweep
+from bench.queries import QUERIES, parse_mix, select_queries
+from bench.report import (
+    print_concurrency_results,
+    print_layout_results,
+    print_results,
+    write_comparison_file,
+    write_concurrency_file,
+    write_layouts_file,
+    write_single_engine_results,
+)
+
+DEFAULT_ENGINES = ["sqlite", "duckdb", "duckdb-parquet"]
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Compare database engines on the ad-insights dashboard queries"
+    )
+    parser.add_argument(
+        "--engines",
+        nargs="+",
+        choices=ENGINES,
+        default=DEFAULT_ENGINES,
+        help="engines to benchmark; the first is the baseline for speedups and accuracy",
+    )
+    parser.add_argument(
+        "--queries",
+        nargs="+",
+        metavar="ID",
+        help=f"query ids to run (default: all of {', '.join(q['id'] for q in QUERIES)})",
+    )
+    parser.add_argument("--rows", type=int, default=NUM_ROWS, help="rows to generate")
+    parser.add_argument("--runs", type=int, default=NUM_RUNS, help="runs per query")
+    parser.add_argument(
+        "--load-mode",
+        choices=LOAD_MODES,
+        default=LOAD_MODE,
+        help="row-store load path: native bulk loader or batched INSERTs",
+    )
+    concurrency = parser.add_argument_group(
+        "concurrent users", "simulate dashboard users instead of timing the catalog serially"
+    )
+    concurrency.add_argument(
+        "--users", type=int, metavar="N", help="concurrent users, one connection each"
+    )
+    concurrency.add_argument(
+        "--duration",
+        type=float,
+        default=CONCURRENCY_DURATION_S,
+        metavar="SECONDS",
+        help="measured window per engine",
+    )
+    concurrency.add_argument(
+        "--think-ms",
+        type=float,
+        default=THINK_TIME_MS,
+        help="mean of the exponential think time between a user's queries",
+    )
+    concurrency.add_argument(
+        "--mix",
+        nargs="+",
+        default=CONCURRENCY_MIX,
+        metavar="ID[=WEIGHT]",
+        help=f"weighted query mix (default: {' '.join(CONCURRENCY_MIX)})",
+    )
+    layouts = parser.add_argument_group(
+        "layout sweep", "write the dataset in several Parquet layouts and query each"
+    )
+    layouts.add_argument(
+        "--layouts",
+        nargs="*",
+        choices=LAYOUTS,
+        metavar="LAYOUT",
+        help=f"layouts to sweep; none listed means all of {', '.join(LAYOUTS)}",
+    )
+    layouts.add_argument(
+        "--compressions",
+        nargs="+",
+        choices=COMPRESSIONS,
+        default=list(COMPRESSIONS),
+        help="Parquet codecs to write each layout with",
+    )
+    args = parser.parse_args(argv)
+    if len(set(args.engines)) != len(args.engines):
+        parser.error("--engines must not repeat an engine")
+    if args.rows < 1 or args.runs < 1:
+        parser.error("--rows and --runs must be positive")
+    if args.users is not None and args.layouts is not None:
+        parser.error("--users and --layouts are separate modes")
+    if args.layouts == []:
+        args.layouts = list(LAYOUTS)
+    if args.users is not None and (args.users < 1 or args.duration <= 0 or args.think_ms < 0):
+        parser.error("--users and --duration must be positive, --think-ms not negative")
+    try:
+        args.queries = select_queries(args.queries)
+        args.mix = parse_mix(args.mix)
+    except ValueError as exc:
+        parser.error(str(exc))
+    return args
+
+
+def sweep_layouts(args):
+    """Write the dataset in each Parquet layout and run the catalog on each."""
+    print("\n" + "=" * 60)
+    print(f"  Parquet layout sweep: {', '.join(args.layouts)}")
+    print(
+        f"  {args.rows:,} rows | {len(args.queries)} queries | {args.runs} runs/query"
+        f" | {', '.join(args.compressions)}"
+    )
+    print("=" * 60)
+    cleanup([])
+    num_rows = generate_data(args.rows)
+    engines, stats, results = run_layout_sweep(
+        args.layouts, args.compressions, args.queries, args.runs, SOURCE_PARQUET
+    )
+
+    print("\n=== Step 3: Writing result files ===\n")
+    write_layouts_file(engines, stats, results, num_rows, args.runs)
+    print(f"  {'Layout sweep':<24}-> {LAYOUTS_FILE}")
+    print_layout_results(engines, stats, results)
+
+
+def main(argv=None):
+    """Orchestrate the full benchmark pipeline."""
+    args = parse_args(argv)
+    labels = [ENGINES[name].label for name in args.engines]
+
+    if args.layouts is not None:
+        return sweep_layouts(args)
+
+    print("\n" + "=" * 60)
+    print(f"  Benchmark: {' vs '.join(labels)}")
+    if args.users is None:
+        workload = f"{len(args.queries)} queries | {args.runs} runs/query"
+    else:
+        workload = f"{args.users} concurrent users | {args.duration:g} s/engine"
+    print(f"  {args.rows:,} rows | {workload} | {args.load_mode} load")
+    print("=" * 60)
+    cleanup(args.engines)
+    num_rows = generate_data(args.rows)
+    engines, load_ms = load_engines(args.engines, SOURCE_PARQUET, args.load_mode)
+    try:
+        if args.users is None:
+            bench_results = run_benchmarks(engines, args.queries, args.runs)
+        else:
+            user_results = run_concurrency(
+                engines, args.mix, args.users, args.duration, args.think_ms
+            )
+    finally:
+        for engine in engines:
+            engine.close()
+
+    print("\n=== Step 4: Writing result files ===\n")
+    if args.users is not None:
+        write_concurrency_file(
+            engines,
+            user_results,
+            num_rows,
+            args.mix,
+            args.users,
+            args.duration,
+            args.think_ms,
+        )
+        print(f"  {'Concurrent users':<24}-> {CONCURRENCY_FILE}")
+        print_concurrency_results(engines, user_results)
+        return
+
+    for engine in engines:
+        path = write_single_engine_results(engine, bench_results, num_rows)
+        print(f"  {engine.label + ' results':<24}-> {path}")
+    write_comparison_file(
+        engines, bench_results, load_ms, num_rows, args.runs, args.load_mode
+    )
+    print(f"  {'Comparison':<24}-> {COMPARISON_FILE}")
+
+    print_results(engines, bench_results, load_ms)
+
+
+if __name__ == "__main__":
+    main()